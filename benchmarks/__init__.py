@@ -0,0 +1,5 @@
+"""
+Benchmarks do Sistema de Monitoramento BACEN
+Executados offline sobre páginas e respostas sintéticas em benchmarks/fixtures
+(escritas no formato do bcb.gov.br; não são cópias do site)
+"""
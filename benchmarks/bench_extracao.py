@@ -0,0 +1,71 @@
+"""
+Benchmark da extração de texto: BeautifulSoup (html.parser) x ExtratorConteudo (lxml)
+
+As páginas padrão são sintéticas e parecidas entre si; para números representativos,
+passe páginas salvas do bcb.gov.br como argumentos.
+
+Uso:
+    python -m benchmarks.bench_extracao [arquivo.html ...] [--repeticoes N]
+"""
+
+import os
+import sys
+import time
+import argparse
+from pathlib import Path
+
+# Adiciona o diretório raiz ao path
+root_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if root_dir not in sys.path:
+    sys.path.insert(0, root_dir)
+
+from modulo_scraper.extrator_conteudo import ExtratorConteudo, extrair_texto_legado
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures" / "paginas"
+
+
+def medir(funcao, html: bytes, repeticoes: int) -> tuple:
+    """
+    Mede o tempo médio de uma função de extração
+    
+    Args:
+        funcao: Função que recebe o HTML e devolve o texto
+        html: Conteúdo HTML bruto
+        repeticoes: Número de execuções
+    
+    Returns:
+        Tupla (milissegundos por página, texto extraído)
+    """
+    texto = funcao(html)
+    inicio = time.perf_counter()
+    for _ in range(repeticoes):
+        funcao(html)
+    decorrido = time.perf_counter() - inicio
+    return decorrido / repeticoes * 1000, texto
+
+
+def main():
+    """Função principal"""
+    parser = argparse.ArgumentParser(description="Benchmark de extração de texto HTML")
+    parser.add_argument('arquivos', nargs='*', help='Páginas HTML (padrão: fixtures sintéticas)')
+    parser.add_argument('--repeticoes', type=int, default=50, help='Execuções por página')
+    args = parser.parse_args()
+    
+    arquivos = [Path(a) for a in args.arquivos] or sorted(FIXTURES_DIR.glob("*.html"))
+    extrator = ExtratorConteudo()
+    
+    print(f"{'página':<32} {'legado ms':>10} {'lxml ms':>10} {'ganho':>7} {'tokens legado':>14} {'tokens lxml':>12}")
+    for arquivo in arquivos:
+        html = arquivo.read_bytes()
+        ms_legado, texto_legado = medir(extrair_texto_legado, html, args.repeticoes)
+        ms_novo, texto_novo = medir(extrator.extrair_texto, html, args.repeticoes)
+        
+        # Aproximação usual: ~4 caracteres por token
+        print(
+            f"{arquivo.name[:32]:<32} {ms_legado:>10.2f} {ms_novo:>10.2f} "
+            f"{ms_legado / ms_novo:>6.1f}x {len(texto_legado) // 4:>14} {len(texto_novo) // 4:>12}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+"""
+Benchmark do tempo de importação (python -X importtime)
+
+Mede, em processos novos, o custo de importar o ponto de entrada e cada subsistema,
+e verifica que o import de main_refatorado e dos pacotes com atributos preguiçosos
+(config.importacao) não carrega dependências pesadas.
+Sai com código 1 se o orçamento (--limite-ms) for estourado ou se alguma
+dependência pesada for importada cedo demais, para uso em CI.
+
+Uso:
+    python -m benchmarks.bench_importacao [--repeticoes N] [--limite-ms 150] [--detalhar 10]
+"""
+
+import os
+import sys
+import argparse
+import subprocess
+from statistics import median
+from typing import Dict, List, Tuple
+
+# Adiciona o diretório raiz ao path
+root_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if root_dir not in sys.path:
+    sys.path.insert(0, root_dir)
+
+# Módulos medidos: o ponto de entrada e o que cada subsistema carrega ao ser usado
+ALVOS = [
+    'main_refatorado',
+    'modulo_scraper',
+    'modulo_scraper.bacen_scraper',
+    'modulo_scraper.driver_pool',
+    'modulo_llm',
+    'modulo_report',
+    'modulo_report.pdf_generator',
+    'modulo_email.email_sender',
+    'modulo_scheduler',
+    'modulo_scheduler.task_scheduler',
+    'modulo_arquivo',
+]
+
+# Não podem aparecer no import destes (os pacotes só carregam o pesado no primeiro acesso)
+SEM_DEPENDENCIAS_PESADAS = {
+    'main_refatorado', 'modulo_scraper', 'modulo_llm', 'modulo_report', 'modulo_scheduler', 'modulo_arquivo',
+}
+
+DEPENDENCIAS_PESADAS = [
+    'selenium', 'webdriver_manager', 'reportlab', 'apscheduler', 'sqlalchemy',
+    'openai', 'anthropic', 'pypdf', 'pyarrow', 'streamlit', 'pandas',
+]
+
+
+def _executar(codigo: str) -> subprocess.CompletedProcess:
+    """Roda um trecho de código num interpretador novo com -X importtime"""
+    return subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', codigo],
+        capture_output=True, text=True, cwd=root_dir
+    )
+
+
+def _ler_importtime(saida: str) -> List[Tuple[float, str]]:
+    """Converte as linhas "import time: self [us] | cumulative | imported package" em (ms, nome)"""
+    importacoes = []
+    for linha in saida.splitlines():
+        if not linha.startswith('import time:') or 'cumulative' in linha:
+            continue
+        _, cumulativo, nome = linha[len('import time:'):].split('|')
+        importacoes.append((int(cumulativo) / 1000, nome.strip()))
+    return importacoes
+
+
+# Módulos que o interpretador já carrega na partida (site, .pth etc.), fora da conta dos alvos
+MODULOS_PARTIDA = {nome for _, nome in _ler_importtime(_executar("pass").stderr)}
+
+
+def medir_importacao(modulo: str) -> Tuple[float, List[Tuple[float, str]], List[str]]:
+    """
+    Importa um módulo num interpretador novo com -X importtime
+    
+    Args:
+        modulo: Nome do módulo
+    
+    Returns:
+        Tupla (ms cumulativos do módulo, [(ms cumulativos, nome)] dos imports que ele
+        provocou, dependências pesadas carregadas)
+    """
+    resultado = _executar(
+        f"import sys; import {modulo}; "
+        f"print(','.join(m for m in {DEPENDENCIAS_PESADAS!r} if m in sys.modules))"
+    )
+    if resultado.returncode != 0:
+        raise RuntimeError(f"Falha ao importar {modulo}: {resultado.stderr.strip().splitlines()[-1]}")
+    
+    importacoes = [
+        (ms, nome) for ms, nome in _ler_importtime(resultado.stderr)
+        if nome.split('.')[0] not in MODULOS_PARTIDA
+    ]
+    total = next((ms for ms, nome in importacoes if nome == modulo), 0.0)
+    carregadas = [m for m in resultado.stdout.strip().split(',') if m]
+    return total, importacoes, carregadas
+
+
+def main():
+    """Função principal"""
+    parser = argparse.ArgumentParser(description="Benchmark do tempo de importação")
+    parser.add_argument('--repeticoes', type=int, default=5, help='Processos por módulo (usa a mediana)')
+    parser.add_argument('--limite-ms', type=float, default=150.0,
+                        help='Orçamento para importar main_refatorado')
+    parser.add_argument('--detalhar', type=int, default=0, metavar='N',
+                        help='Mostra os N imports mais caros de cada módulo')
+    args = parser.parse_args()
+    
+    falhas = []
+    medianas: Dict[str, float] = {}
+    
+    print(f"{'módulo':<34} {'mediana ms':>11} {'mín ms':>8}  dependências pesadas")
+    for modulo in ALVOS:
+        try:
+            medicoes = [medir_importacao(modulo) for _ in range(args.repeticoes)]
+        except RuntimeError as e:
+            print(f"{modulo:<34} {'-':>11} {'-':>8}  {str(e)}")
+            continue
+        
+        tempos = [total for total, _, _ in medicoes]
+        medianas[modulo] = median(tempos)
+        carregadas = medicoes[-1][2]
+        print(f"{modulo:<34} {medianas[modulo]:>11.1f} {min(tempos):>8.1f}  {', '.join(carregadas) or '-'}")
+        
+        if args.detalhar:
+            mais_caros = sorted(
+                (item for item in medicoes[-1][1] if item[1] != modulo), reverse=True
+            )[:args.detalhar]
+            for ms, nome in mais_caros:
+                print(f"    {ms:>8.1f}  {nome}")
+        
+        if modulo in SEM_DEPENDENCIAS_PESADAS and carregadas:
+            falhas.append(f"{modulo} importa dependências pesadas: {', '.join(carregadas)}")
+    
+    if medianas.get('main_refatorado', 0) > args.limite_ms:
+        falhas.append(
+            f"main_refatorado levou {medianas['main_refatorado']:.1f} ms (limite: {args.limite_ms:.0f} ms)"
+        )
+    
+    for falha in falhas:
+        print(f"FALHA: {falha}")
+    sys.exit(1 if falhas else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+Benchmark do perfil de navegação enxuta nas listagens do bcb.gov.br
+
+Compara o perfil completo (imagens, fontes, CSS, carregamento "normal") com o enxuto
+(recursos bloqueados via CDP, carregamento "eager"), medindo o tempo até a listagem
+estar pronta e os bytes transferidos. Requer Chrome/chromedriver e acesso ao bcb.gov.br:
+o servidor mock não tem as listagens com imagens, fontes e CSS que o perfil enxuto corta.
+
+Uso:
+    python -m benchmarks.bench_navegacao [--repeticoes N] [--url URL ...]
+"""
+
+import os
+import sys
+import copy
+import time
+import argparse
+import statistics
+
+# Adiciona o diretório raiz ao path
+root_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if root_dir not in sys.path:
+    sys.path.insert(0, root_dir)
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+
+from config.config import Config
+from modulo_scraper.driver_pool import criar_driver
+
+# Soma os bytes transferidos pela navegação e por todos os subrecursos
+SCRIPT_BYTES = """
+const nav = performance.getEntriesByType('navigation')[0];
+const recursos = performance.getEntriesByType('resource');
+return {
+    bytes: (nav ? nav.transferSize : 0) + recursos.reduce((t, r) => t + (r.transferSize || 0), 0),
+    recursos: recursos.length
+};
+"""
+
+
+def medir_perfil(config: Config, urls: list, repeticoes: int) -> dict:
+    """
+    Mede tempo até a listagem ficar pronta e bytes transferidos
+    
+    Args:
+        config: Configuração com o perfil desejado
+        urls: Páginas de listagem
+        repeticoes: Carregamentos por página
+    
+    Returns:
+        Dicionário com medianas de tempo, bytes e recursos
+    """
+    driver = criar_driver(config)
+    tempos, bytes_transferidos, recursos = [], [], []
+    
+    try:
+        for url in urls:
+            for _ in range(repeticoes):
+                driver.execute_cdp_cmd("Network.clearBrowserCache", {})
+                inicio = time.perf_counter()
+                driver.get(url)
+                WebDriverWait(driver, config.TIMEOUT_PAGINA).until(
+                    EC.presence_of_element_located((By.CLASS_NAME, "lista"))
+                )
+                tempos.append(time.perf_counter() - inicio)
+                
+                medidas = driver.execute_script(SCRIPT_BYTES)
+                bytes_transferidos.append(medidas['bytes'])
+                recursos.append(medidas['recursos'])
+    finally:
+        driver.quit()
+    
+    return {
+        'pronto_s': statistics.median(tempos),
+        'kb': statistics.median(bytes_transferidos) / 1024,
+        'recursos': statistics.median(recursos),
+    }
+
+
+def main():
+    """Função principal"""
+    config = Config()
+    
+    parser = argparse.ArgumentParser(description="Benchmark do perfil de navegação enxuta")
+    parser.add_argument('--repeticoes', type=int, default=3, help='Carregamentos por página')
+    parser.add_argument('--url', action='append', dest='urls', help='Página de listagem (repetível)')
+    args = parser.parse_args()
+    
+    urls = args.urls or [
+        config.BACEN_COMUNICADOS_URL,
+        config.BACEN_RESOLUCOES_URL,
+        config.BACEN_CIRCULARES_URL,
+    ]
+    
+    resultados = {}
+    for nome, enxuta in [('completo', False), ('enxuto', True)]:
+        perfil = copy.copy(config)
+        perfil.NAVEGACAO_ENXUTA = enxuta
+        resultados[nome] = medir_perfil(perfil, urls, args.repeticoes)
+    
+    print(f"{'perfil':<10} {'pronto (s)':>11} {'transferido (KB)':>17} {'recursos':>9}")
+    for nome, r in resultados.items():
+        print(f"{nome:<10} {r['pronto_s']:>11.2f} {r['kb']:>17.0f} {r['recursos']:>9.0f}")
+    
+    completo, enxuto = resultados['completo'], resultados['enxuto']
+    print(
+        f"\nGanho: {completo['pronto_s'] / enxuto['pronto_s']:.1f}x no tempo, "
+        f"{(1 - enxuto['kb'] / max(completo['kb'], 1)) * 100:.0f}% menos bytes"
+    )
+
+
+if __name__ == "__main__":
+    main()
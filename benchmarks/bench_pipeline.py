@@ -0,0 +1,244 @@
+"""
+Benchmark do pipeline completo, offline
+
+Sobe o servidor mock (busca de normativos, páginas sintéticas e um OLLAMA simulado) e um
+SMTP local, e executa as etapas do pipeline com os componentes reais: listagem pela
+API, download e extração das páginas, resumo pelo LLM, PDF e email. Mede itens/s e a
+latência por item (p50/p95) de cada etapa. Com --comparar, sai com código 1 se alguma
+etapa ficar mais lenta que a base gravada por --salvar além da tolerância, para uso
+em CI.
+
+Uso:
+    python -m benchmarks.bench_pipeline [--copias 20] [--latencia-llm-ms 0]
+        [--destinatarios 3] [--salvar base.json] [--comparar base.json] [--tolerancia 0.2]
+"""
+
+import os
+import sys
+import copy
+import json
+import time
+import smtplib
+import argparse
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from typing import Dict, List, Optional
+
+# Adiciona o diretório raiz ao path
+root_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if root_dir not in sys.path:
+    sys.path.insert(0, root_dir)
+
+from benchmarks.servidor_mock import ServidorMock, ServidorSMTPMock
+from config.config import Config
+from modulo_email import EmailSender
+from modulo_llm import LLMManager
+from modulo_report import PDFGenerator
+from modulo_scraper import BACENScraper, Publicacao
+from modulo_scraper.coletor_api import CAMPO_DATA
+
+ETAPAS = ['listagem', 'download', 'extracao', 'resumo', 'pdf', 'email']
+
+
+class EmailSenderLocal(EmailSender):
+    """EmailSender contra o SMTP local (sem STARTTLS nem login)"""
+    
+    def configurar_servidor_smtp(self):
+        return smtplib.SMTP(self.config.SMTP_SERVER, self.config.SMTP_PORT, timeout=30)
+
+
+def _percentil(valores: List[float], p: float) -> Optional[float]:
+    """Percentil pelo posto mais próximo (None sem valores)"""
+    if not valores:
+        return None
+    ordenados = sorted(valores)
+    return ordenados[min(len(ordenados) - 1, max(0, round(p / 100 * len(ordenados)) - 1))]
+
+
+def _medida(itens: int, segundos: float, latencias_ms: Optional[List[float]] = None) -> Dict:
+    """Resultado de uma etapa"""
+    latencias_ms = latencias_ms or []
+    return {
+        'itens': itens,
+        'total_s': segundos,
+        'itens_por_s': itens / segundos if segundos else None,
+        'p50_ms': _percentil(latencias_ms, 50),
+        'p95_ms': _percentil(latencias_ms, 95),
+    }
+
+
+def _cronometrar(funcao, *args, **kwargs):
+    """Executa a função e devolve (resultado, milissegundos)"""
+    inicio = time.perf_counter()
+    resultado = funcao(*args, **kwargs)
+    return resultado, (time.perf_counter() - inicio) * 1000
+
+
+def configurar(servidor: ServidorMock, smtp: ServidorSMTPMock, destinatarios: int) -> Config:
+    """
+    Configuração apontando todos os serviços externos para os mocks
+    
+    Args:
+        servidor: Servidor mock do bcb.gov.br e do OLLAMA
+        smtp: SMTP local
+        destinatarios: Número de destinatários do email
+    
+    Returns:
+        Cópia da configuração do ambiente com as substituições
+    """
+    config = copy.copy(Config())
+    config.SCRAPER_BACKEND = 'api'
+    config.BACEN_API_URL = servidor.url_api
+    config.BACEN_BASE_URL = servidor.url
+    config.API_MAX_PAGINAS = 1000
+    config.HTTP_CACHE_ENABLED = False
+    config.WEBDRIVER_POOL_ENABLED = False
+    # O limitador protege o bcb.gov.br; aqui mediria só a espera
+    config.TAXA_REQUISICOES = 1_000_000
+    config.RAJADA_REQUISICOES = 1_000_000
+    config.ORCAMENTO_REQUISICOES = 0
+    config.SMTP_SERVER = '127.0.0.1'
+    config.SMTP_PORT = smtp.porta
+    config.EMAIL_USER = 'benchmark@localhost'
+    config.DESTINATARIOS = [f"destinatario{i}@localhost" for i in range(destinatarios)]
+    config.LOG_NIVEL = 'WARNING'
+    return config
+
+
+def executar(config: Config, servidor: ServidorMock, diretorio_pdf: str) -> Dict[str, Dict]:
+    """
+    Executa as etapas do pipeline contra os mocks
+    
+    Args:
+        config: Configuração de configurar()
+        servidor: Servidor mock (URL do OLLAMA e datas das fixtures)
+        diretorio_pdf: Onde gravar o relatório
+    
+    Returns:
+        Medidas por etapa
+    """
+    resultados = {}
+    datas = sorted({date.fromisoformat(linha[CAMPO_DATA][:10]) for linha in servidor.linhas})
+    
+    with BACENScraper(config) as scraper:
+        # Listagem: um dia por vez, como a recuperação de dias atrasados
+        itens: List[Publicacao] = []
+        inicio = time.perf_counter()
+        latencias = []
+        for dia in datas:
+            listados, ms = _cronometrar(scraper.buscar_todas_categorias, dia.strftime("%d/%m/%Y"))
+            itens.extend(listados)
+            latencias.append(ms)
+        resultados['listagem'] = _medida(len(itens), time.perf_counter() - inicio, latencias)
+        
+        # Download: em paralelo, com os mesmos workers da coleta
+        def baixar(item: Publicacao):
+            return _cronometrar(lambda: scraper._baixar(item.link).content)
+        
+        inicio = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=config.MAX_WORKERS_CONTEUDO) as executor:
+            baixados = list(executor.map(baixar, itens))
+        resultados['download'] = _medida(
+            len(itens), time.perf_counter() - inicio, [ms for _, ms in baixados]
+        )
+        
+        # Extração do conteúdo principal
+        inicio = time.perf_counter()
+        latencias = []
+        for item, (html, _) in zip(itens, baixados):
+            item.conteudo_completo, ms = _cronometrar(scraper.extrator.extrair_texto, html)
+            latencias.append(ms)
+        resultados['extracao'] = _medida(len(itens), time.perf_counter() - inicio, latencias)
+    
+    # Resumos: sequenciais, como no pipeline
+    llm_manager = LLMManager('ollama', base_url=servidor.url_ollama, model='benchmark')
+    inicio = time.perf_counter()
+    latencias = []
+    for item in itens:
+        item.resumo, ms = _cronometrar(
+            llm_manager.summarize, texto=item.conteudo_completo, titulo=item.titulo, link=item.link, max_lines=5
+        )
+        latencias.append(ms)
+    resultados['resumo'] = _medida(len(itens), time.perf_counter() - inicio, latencias)
+    llm_manager.fechar()
+    
+    data_referencia = datas[-1].strftime("%d/%m/%Y") if datas else None
+    caminho_pdf, ms = _cronometrar(PDFGenerator(diretorio_pdf).generate_pdf, itens, data_referencia)
+    resultados['pdf'] = _medida(len(itens), ms / 1000, [ms])
+    
+    # Email: uma mensagem por destinatário, com o PDF anexado
+    email_sender = EmailSenderLocal(config)
+    inicio = time.perf_counter()
+    corpo_html = email_sender.criar_corpo_email_html(itens, data_referencia)
+    envio = email_sender.enviar_email_com_anexo("Benchmark BACEN", corpo_html, caminho_pdf)
+    decorrido = time.perf_counter() - inicio
+    enviados = envio['total_enviados']
+    resultados['email'] = _medida(enviados, decorrido, [decorrido * 1000 / enviados] if enviados else [])
+    
+    return resultados
+
+
+def comparar(resultados: Dict[str, Dict], base: Dict[str, Dict], tolerancia: float) -> List[str]:
+    """
+    Etapas com vazão abaixo da base além da tolerância
+    
+    Args:
+        resultados: Medidas atuais
+        base: Medidas gravadas com --salvar
+        tolerancia: Queda aceita (0.2 = 20%)
+    
+    Returns:
+        Descrição das regressões
+    """
+    regressoes = []
+    for etapa in ETAPAS:
+        atual = (resultados.get(etapa) or {}).get('itens_por_s')
+        anterior = (base.get(etapa) or {}).get('itens_por_s')
+        if atual is not None and anterior and atual < anterior * (1 - tolerancia):
+            regressoes.append(f"{etapa}: {atual:.1f} itens/s (base: {anterior:.1f}, {atual / anterior - 1:+.0%})")
+    return regressoes
+
+
+def main():
+    """Função principal"""
+    parser = argparse.ArgumentParser(description="Benchmark do pipeline completo com serviços simulados")
+    parser.add_argument('--copias', type=int, default=20, help='Vezes que cada publicação das fixtures aparece')
+    parser.add_argument('--latencia-llm-ms', type=float, default=0, help='Tempo simulado de cada resposta do LLM')
+    parser.add_argument('--destinatarios', type=int, default=3, help='Destinatários do email')
+    parser.add_argument('--salvar', metavar='ARQUIVO', help='Grava as medidas em JSON (base para --comparar)')
+    parser.add_argument('--comparar', metavar='ARQUIVO', help='Compara com medidas gravadas por --salvar')
+    parser.add_argument('--tolerancia', type=float, default=0.2, help='Queda de vazão aceita em --comparar')
+    args = parser.parse_args()
+    
+    with ServidorMock(copias=args.copias, latencia_llm_ms=args.latencia_llm_ms) as servidor, \
+            ServidorSMTPMock() as smtp, tempfile.TemporaryDirectory() as diretorio_pdf:
+        config = configurar(servidor, smtp, args.destinatarios)
+        resultados = executar(config, servidor, diretorio_pdf)
+        requisicoes = sum(servidor.requisicoes.values())
+        print(f"Servidor mock: {requisicoes} requisições; SMTP: {smtp.mensagens} mensagens, "
+              f"{smtp.bytes_recebidos / 1024:.0f} KB\n")
+    
+    def numero(valor: Optional[float], formato: str) -> str:
+        return format(valor, formato) if valor is not None else "-"
+    
+    print(f"{'etapa':<10} {'itens':>6} {'total s':>9} {'itens/s':>9} {'p50 ms':>9} {'p95 ms':>9}")
+    for etapa in ETAPAS:
+        r = resultados[etapa]
+        print(f"{etapa:<10} {r['itens']:>6} {r['total_s']:>9.3f} {numero(r['itens_por_s'], '>9.1f')} "
+              f"{numero(r['p50_ms'], '>9.2f')} {numero(r['p95_ms'], '>9.2f')}")
+    
+    if args.salvar:
+        with open(args.salvar, 'w', encoding='utf-8') as f:
+            json.dump(resultados, f, indent=2)
+    
+    if args.comparar:
+        with open(args.comparar, encoding='utf-8') as f:
+            regressoes = comparar(resultados, json.load(f), args.tolerancia)
+        for regressao in regressoes:
+            print(f"REGRESSÃO: {regressao}")
+        sys.exit(1 if regressoes else 0)
+
+
+if __name__ == "__main__":
+    main()
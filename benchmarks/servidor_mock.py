@@ -0,0 +1,394 @@
+"""
+Servidor HTTP local que imita os serviços do BACEN a partir de respostas sintéticas
+
+As fixtures em benchmarks/fixtures foram escritas à mão no formato do bcb.gov.br (mesmos
+campos da API, mesma estrutura de página); não são cópias do site e variam pouco entre
+si, então medem o custo do código, não a diversidade das páginas reais.
+
+Permite exercitar o backend "api" do scraper sem acesso à rede. As datas das fixtures são
+deslocadas para que a publicação mais recente caia no dia anterior, como numa coleta real.
+Também atende as páginas dos normativos (páginas HTML sintéticas), um endpoint
+/ollama/api/generate no formato do OLLAMA e, em ServidorSMTPMock, um SMTP sem TLS que
+só conta as mensagens, para medir o pipeline inteiro offline (bench_pipeline).
+
+Não há páginas de listagem: só a listagem do backend "api" é exercitada; a listagem
+padrão via Selenium nunca passa por aqui.
+
+Uso:
+    python -m benchmarks.servidor_mock [--porta 8765] [--porta-smtp 8025] [--datas-originais] [--copias N]
+"""
+
+import os
+import sys
+import re
+import json
+import hashlib
+import time
+import argparse
+import threading
+import socketserver
+from datetime import date, datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+# Adiciona o diretório raiz ao path
+root_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if root_dir not in sys.path:
+    sys.path.insert(0, root_dir)
+
+from modulo_scraper.coletor_api import (
+    CAMINHO_BUSCA, CAMINHO_CONTEUDO, CAMPO_DATA, CAMPO_NUMERO, CAMPO_TIPO, CAMPO_TITULO
+)
+
+FIXTURES_API = Path(__file__).parent / "fixtures" / "api"
+FIXTURES_PAGINAS = Path(__file__).parent / "fixtures" / "paginas"
+
+# Página pública de um normativo (link das publicações, com BACEN_BASE_URL apontando para o mock)
+CAMINHO_PAGINA_NORMATIVO = "/estabilidadefinanceira/exibenormativo"
+
+_TIPOS = re.compile(CAMPO_TIPO + r':"([^"]+)"')
+_INTERVALO = re.compile(r'range\(datetime\(([\d-]+)[^)]*\),\s*datetime\(([\d-]+)')
+
+
+def carregar_fixtures(deslocar_datas: bool = True) -> tuple:
+    """
+    Lê as respostas sintéticas da busca e do texto dos normativos
+    
+    Args:
+        deslocar_datas: Desloca as datas para que a mais recente seja ontem
+    
+    Returns:
+        Tupla (linhas da busca, conteúdos por "tipo|número")
+    """
+    with open(FIXTURES_API / "buscanormativos.json", encoding="utf-8") as f:
+        linhas = json.load(f)["Rows"]
+    with open(FIXTURES_API / "exibenormativo.json", encoding="utf-8") as f:
+        conteudos = json.load(f)
+    
+    if deslocar_datas and linhas:
+        mais_recente = max(date.fromisoformat(linha[CAMPO_DATA][:10]) for linha in linhas)
+        deslocamento = (date.today() - timedelta(days=1)) - mais_recente
+        for linha in linhas:
+            original = datetime.fromisoformat(linha[CAMPO_DATA].replace('Z', '+00:00'))
+            linha[CAMPO_DATA] = (original + deslocamento).strftime("%Y-%m-%dT%H:%M:%SZ")
+    
+    return linhas, conteudos
+
+
+def replicar_linhas(linhas: list, copias: int) -> tuple:
+    """
+    Multiplica as linhas das fixtures, com números distintos, para gerar volume
+    
+    Args:
+        linhas: Linhas da busca
+        copias: Vezes que cada linha aparece (1 = só as originais)
+    
+    Returns:
+        Tupla (linhas, {"tipo|número da cópia": "tipo|número original"})
+    """
+    replicadas, originais = list(linhas), {}
+    for k in range(1, copias):
+        for linha in linhas:
+            copia = dict(linha)
+            copia[CAMPO_NUMERO] = f"{linha[CAMPO_NUMERO]}{k:03d}"
+            copia[CAMPO_TITULO] = f"{linha[CAMPO_TITULO]} (cópia {k})"
+            originais[f"{linha[CAMPO_TIPO]}|{copia[CAMPO_NUMERO]}"] = f"{linha[CAMPO_TIPO]}|{linha[CAMPO_NUMERO]}"
+            replicadas.append(copia)
+    return replicadas, originais
+
+
+class ManipuladorMock(BaseHTTPRequestHandler):
+    """Atende as rotas simuladas do bcb.gov.br"""
+    
+    def do_GET(self):
+        url = urlparse(self.path)
+        params = {chave: valores[0] for chave, valores in parse_qs(url.query).items()}
+        self.server.contar(url.path)
+        
+        if url.path.endswith(CAMINHO_BUSCA):
+            self._busca(params)
+        elif url.path.endswith(CAMINHO_CONTEUDO):
+            self._conteudo(params)
+        elif url.path == CAMINHO_PAGINA_NORMATIVO:
+            self._pagina_normativo(params)
+        elif url.path.startswith("/paginas/"):
+            self._pagina(url.path[len("/paginas/"):])
+        else:
+            self._responder(404, b"", "text/plain")
+    
+    def do_POST(self):
+        url = urlparse(self.path)
+        self.server.contar(url.path)
+        corpo = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        
+        if url.path == "/ollama/api/generate":
+            self._gerar(json.loads(corpo or b"{}"))
+        else:
+            self._responder(404, b"", "text/plain")
+    
+    def _gerar(self, pedido: dict):
+        """Resposta do OLLAMA (sem stream), após a latência simulada do modelo"""
+        if self.server.latencia_llm_s:
+            time.sleep(self.server.latencia_llm_s)
+        prompt = pedido.get("prompt", "")
+        titulo = next((linha[len("Título: "):] for linha in prompt.splitlines() if linha.startswith("Título: ")), "")
+        self._json({
+            "model": pedido.get("model"),
+            "response": f"Resumo simulado de {titulo}.\nPrincipais pontos e impactos do normativo.",
+            "done": True,
+            # Aproximação usual: ~4 caracteres por token
+            "prompt_eval_count": len(prompt) // 4,
+            "eval_count": 20
+        })
+    
+    def _busca(self, params: dict):
+        """Busca de normativos: filtro por tipo e data, ordenação e paginação"""
+        consulta = params.get("querytext", "")
+        tipos = set(_TIPOS.findall(consulta))
+        intervalo = _INTERVALO.search(params.get("refinementfilters", ""))
+        
+        linhas = [
+            linha for linha in self.server.linhas
+            if (not tipos or linha[CAMPO_TIPO] in tipos)
+            and (not intervalo or intervalo.group(1) <= linha[CAMPO_DATA][:10] <= intervalo.group(2))
+        ]
+        linhas.sort(key=lambda linha: linha[CAMPO_DATA], reverse=True)
+        
+        inicio = int(params.get("startrow", 0))
+        limite = int(params.get("rowlimit", 15))
+        self._json({"TotalRows": len(linhas), "Rows": linhas[inicio:inicio + limite]})
+    
+    def _conteudo(self, params: dict):
+        """Texto de um normativo, com ETag para exercitar a revalidação do cache"""
+        chave = f"{params.get('p1', '')}|{params.get('p2', '')}"
+        documento = self.server.conteudos.get(self.server.originais.get(chave, chave))
+        if documento is None:
+            self._json({"conteudo": []}, status=404)
+            return
+        self._json(documento, etag=True)
+    
+    def _pagina_normativo(self, params: dict):
+        """Página de um normativo: uma das páginas sintéticas, sempre a mesma para o mesmo número"""
+        indice = int(hashlib.sha256(params.get("numero", "").encode()).hexdigest(), 16)
+        self._responder(200, self.server.paginas[indice % len(self.server.paginas)], "text/html; charset=utf-8")
+    
+    def _pagina(self, nome: str):
+        """Páginas HTML sintéticas"""
+        caminho = FIXTURES_PAGINAS / Path(nome).name
+        if not caminho.is_file():
+            self._responder(404, b"", "text/plain")
+            return
+        self._responder(200, caminho.read_bytes(), "text/html; charset=utf-8")
+    
+    def _json(self, corpo: dict, status: int = 200, etag: bool = False):
+        """Responde JSON, opcionalmente com ETag/304"""
+        dados = json.dumps(corpo, ensure_ascii=False).encode("utf-8")
+        cabecalhos = {}
+        if etag:
+            cabecalhos["ETag"] = f'"{hashlib.sha256(dados).hexdigest()[:16]}"'
+            if self.headers.get("If-None-Match") == cabecalhos["ETag"]:
+                self._responder(304, b"", "application/json", cabecalhos)
+                return
+        self._responder(status, dados, "application/json; charset=utf-8", cabecalhos)
+    
+    def _responder(self, status: int, corpo: bytes, content_type: str, cabecalhos: dict = None):
+        """Envia status, cabeçalhos e corpo"""
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(corpo)))
+        for nome, valor in (cabecalhos or {}).items():
+            self.send_header(nome, valor)
+        self.end_headers()
+        if corpo:
+            self.wfile.write(corpo)
+    
+    def log_message(self, formato, *args):
+        """Silencia o log de acesso padrão do http.server"""
+        pass
+
+
+class ServidorMock(ThreadingHTTPServer):
+    """Servidor dos serviços simulados, executado em thread própria"""
+    
+    daemon_threads = True
+    
+    def __init__(
+        self,
+        porta: int = 0,
+        deslocar_datas: bool = True,
+        copias: int = 1,
+        latencia_llm_ms: float = 0
+    ):
+        """
+        Inicializa o servidor
+        
+        Args:
+            porta: Porta local (0 = escolhida pelo sistema)
+            deslocar_datas: Desloca as datas das fixtures para que a mais recente seja ontem
+            copias: Vezes que cada publicação das fixtures aparece na busca (volume)
+            latencia_llm_ms: Tempo simulado de cada resposta do endpoint do OLLAMA
+        """
+        super().__init__(("127.0.0.1", porta), ManipuladorMock)
+        linhas, self.conteudos = carregar_fixtures(deslocar_datas)
+        self.linhas, self.originais = replicar_linhas(linhas, copias)
+        self.paginas = [caminho.read_bytes() for caminho in sorted(FIXTURES_PAGINAS.glob("*.html"))]
+        self.latencia_llm_s = latencia_llm_ms / 1000
+        self.requisicoes = {}
+        self._lock = threading.Lock()
+        self._thread = None
+    
+    @property
+    def url(self) -> str:
+        """URL base do servidor"""
+        return f"http://127.0.0.1:{self.server_address[1]}"
+    
+    @property
+    def url_api(self) -> str:
+        """Valor a usar em BACEN_API_URL"""
+        return f"{self.url}/api"
+    
+    @property
+    def url_ollama(self) -> str:
+        """Valor a usar em OLLAMA_BASE_URL"""
+        return f"{self.url}/ollama"
+    
+    def contar(self, caminho: str):
+        """Conta requisições por rota"""
+        with self._lock:
+            self.requisicoes[caminho] = self.requisicoes.get(caminho, 0) + 1
+    
+    def iniciar(self) -> "ServidorMock":
+        """Atende requisições em segundo plano"""
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+    
+    def parar(self):
+        """Encerra o servidor"""
+        self.shutdown()
+        self.server_close()
+    
+    def __enter__(self):
+        return self.iniciar()
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.parar()
+
+
+class ManipuladorSMTP(socketserver.StreamRequestHandler):
+    """Diálogo SMTP mínimo (sem TLS; qualquer login é aceito): aceita e descarta as mensagens"""
+    
+    def _enviar(self, linha: str):
+        self.wfile.write(f"{linha}\r\n".encode("ascii"))
+    
+    def handle(self):
+        self._enviar("220 mock ESMTP")
+        while True:
+            linha = self.rfile.readline()
+            if not linha:
+                return
+            comando = linha.decode("ascii", errors="replace").strip().upper()
+            
+            if comando.startswith(("EHLO", "HELO")):
+                self._enviar("250-mock")
+                self._enviar("250-AUTH PLAIN LOGIN")
+                self._enviar("250 SIZE 52428800")
+            elif comando.startswith("AUTH"):
+                self._enviar("235 autenticado")
+            elif comando.startswith("DATA"):
+                self._enviar("354 fim com <CRLF>.<CRLF>")
+                tamanho = 0
+                for linha_dados in iter(self.rfile.readline, b""):
+                    if linha_dados in (b".\r\n", b".\n"):
+                        break
+                    tamanho += len(linha_dados)
+                self.server.registrar(tamanho)
+                self._enviar("250 OK")
+            elif comando.startswith("QUIT"):
+                self._enviar("221 tchau")
+                return
+            else:
+                # MAIL, RCPT, RSET, NOOP
+                self._enviar("250 OK")
+
+
+class ServidorSMTPMock(socketserver.ThreadingTCPServer):
+    """SMTP local que conta mensagens e bytes recebidos, executado em thread própria"""
+    
+    daemon_threads = True
+    allow_reuse_address = True
+    
+    def __init__(self, porta: int = 0):
+        """
+        Inicializa o servidor
+        
+        Args:
+            porta: Porta local (0 = escolhida pelo sistema)
+        """
+        super().__init__(("127.0.0.1", porta), ManipuladorSMTP)
+        self.mensagens = 0
+        self.bytes_recebidos = 0
+        self._lock = threading.Lock()
+    
+    @property
+    def porta(self) -> int:
+        """Porta em uso"""
+        return self.server_address[1]
+    
+    def registrar(self, tamanho: int):
+        """Conta uma mensagem recebida"""
+        with self._lock:
+            self.mensagens += 1
+            self.bytes_recebidos += tamanho
+    
+    def iniciar(self) -> "ServidorSMTPMock":
+        """Atende conexões em segundo plano"""
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return self
+    
+    def parar(self):
+        """Encerra o servidor"""
+        self.shutdown()
+        self.server_close()
+    
+    def __enter__(self):
+        return self.iniciar()
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.parar()
+
+
+def main():
+    """Função principal"""
+    parser = argparse.ArgumentParser(description="Servidor local com respostas sintéticas do BACEN")
+    parser.add_argument("--porta", type=int, default=8765)
+    parser.add_argument("--datas-originais", action="store_true", help="Não desloca as datas das fixtures")
+    parser.add_argument("--copias", type=int, default=1, help="Vezes que cada publicação das fixtures aparece")
+    parser.add_argument("--latencia-llm-ms", type=float, default=0, help="Tempo simulado do OLLAMA")
+    parser.add_argument("--porta-smtp", type=int, default=8025, help="Porta do SMTP simulado (0 = desativado)")
+    args = parser.parse_args()
+    
+    servidor = ServidorMock(
+        args.porta, deslocar_datas=not args.datas_originais,
+        copias=args.copias, latencia_llm_ms=args.latencia_llm_ms
+    )
+    smtp = ServidorSMTPMock(args.porta_smtp).iniciar() if args.porta_smtp else None
+    print(f"Servidor mock em {servidor.url} (BACEN_API_URL={servidor.url_api}, "
+          f"BACEN_BASE_URL={servidor.url}, OLLAMA_BASE_URL={servidor.url_ollama})")
+    if smtp:
+        print(f"SMTP simulado em 127.0.0.1:{smtp.porta} (SMTP_SERVER=127.0.0.1, "
+              f"SMTP_PORT={smtp.porta}, SMTP_STARTTLS=false)")
+    try:
+        servidor.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        servidor.server_close()
+        if smtp:
+            print(f"SMTP: {smtp.mensagens} mensagem(ns), {smtp.bytes_recebidos / 1024:.0f} KB")
+            smtp.parar()
+
+
+if __name__ == "__main__":
+    main()
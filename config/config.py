@@ -27,6 +27,9 @@ class Config:
             self.SMTP_SERVER = os.getenv("SMTP_SERVER", "smtp.gmail.com")
             self.SMTP_PORT = int(os.getenv("SMTP_PORT", "587"))
         
+        # Relays internos (e o SMTP do servidor mock) não usam STARTTLS
+        self.SMTP_STARTTLS = os.getenv("SMTP_STARTTLS", "true").lower() == "true"
+        
         self.EMAIL_USER = os.getenv("EMAIL_USER", "")
         self.EMAIL_PASSWORD = os.getenv("EMAIL_PASSWORD", "")
         
@@ -52,15 +55,103 @@ class Config:
             "BACEN_CIRCULARES_URL",
             "https://www.bcb.gov.br/estabilidadefinanceira/circular"
         )
+        self.BACEN_RESOLUCOES_BCB_URL = os.getenv(
+            "BACEN_RESOLUCOES_BCB_URL",
+            "https://www.bcb.gov.br/estabilidadefinanceira/resolucoesbcb"
+        )
+        self.BACEN_INSTRUCOES_NORMATIVAS_URL = os.getenv(
+            "BACEN_INSTRUCOES_NORMATIVAS_URL",
+            "https://www.bcb.gov.br/estabilidadefinanceira/instrucoesnormativas"
+        )
+        self.BACEN_CARTAS_CIRCULARES_URL = os.getenv(
+            "BACEN_CARTAS_CIRCULARES_URL",
+            "https://www.bcb.gov.br/estabilidadefinanceira/cartascirculares"
+        )
+        
+        # Categorias coletadas (chaves do registro em modulo_scraper/categorias.py)
+        categorias_str = os.getenv("CATEGORIAS_ATIVAS", "comunicado,resolucao,circular")
+        self.CATEGORIAS_ATIVAS = [
+            categoria.strip()
+            for categoria in categorias_str.split(",")
+            if categoria.strip()
+        ]
+        
+        # Backend de coleta: "selenium" (páginas renderizadas) ou "api" (serviços JSON do BACEN)
+        self.SCRAPER_BACKEND = os.getenv("SCRAPER_BACKEND", "selenium").lower()
+        self.BACEN_API_URL = os.getenv("BACEN_API_URL", "https://www.bcb.gov.br/api")
+        self.API_ITENS_POR_PAGINA = int(os.getenv("API_ITENS_POR_PAGINA", "50"))
+        self.API_MAX_PAGINAS = int(os.getenv("API_MAX_PAGINAS", "20"))
         
         # Configurações de Agendamento
         self.HORA_EXECUCAO = os.getenv("HORA_EXECUCAO", "07:00")
         self.FUSO_HORARIO = os.getenv("FUSO_HORARIO", "America/Sao_Paulo")
+        # Tolerância (s) para executar uma tarefa cujo horário passou com o sistema parado
+        self.MISFIRE_GRACE_TIME = int(os.getenv("MISFIRE_GRACE_TIME", "3600"))
+        # Dias para trás reprocessados na inicialização (0 desativa a recuperação)
+        self.RECUPERACAO_MAX_DIAS = int(os.getenv("RECUPERACAO_MAX_DIAS", "7"))
+        # Threads do agendador (relatório diário e verificações de novidades em paralelo)
+        self.AGENDADOR_WORKERS = int(os.getenv("AGENDADOR_WORKERS", "4"))
+        
+        # Verificação de novidades entre relatórios (0 desativa)
+        self.POLLING_INTERVALO_MINUTOS = int(os.getenv("POLLING_INTERVALO_MINUTOS", "15"))
+        polling_str = os.getenv("POLLING_CATEGORIAS", "")
+        self.POLLING_CATEGORIAS = [
+            categoria.strip()
+            for categoria in polling_str.split(",")
+            if categoria.strip()
+        ] or list(self.CATEGORIAS_ATIVAS)
+        self.ALERTAS_EMAIL_ENABLED = os.getenv("ALERTAS_EMAIL_ENABLED", "true").lower() == "true"
+        
+        # API HTTP local de controle do agendador (ativa o modo em segundo plano)
+        self.CONTROLE_API_ENABLED = os.getenv("CONTROLE_API_ENABLED", "false").lower() == "true"
+        self.CONTROLE_API_HOST = os.getenv("CONTROLE_API_HOST", "127.0.0.1")
+        self.CONTROLE_API_PORTA = int(os.getenv("CONTROLE_API_PORTA", "8790"))
+        self.CONTROLE_API_TOKEN = os.getenv("CONTROLE_API_TOKEN", "")
+        
+        # Tarefas em segundo plano do Streamlit (coleta e resumos fora da sessão do usuário)
+        self.FRONTEND_WORKERS = int(os.getenv("FRONTEND_WORKERS", "2"))
+        self.FRONTEND_ATUALIZACAO_SEGUNDOS = float(os.getenv("FRONTEND_ATUALIZACAO_SEGUNDOS", "2"))
+        self.FRONTEND_RETENCAO_MINUTOS = int(os.getenv("FRONTEND_RETENCAO_MINUTOS", "60"))
+        
+        # Trava do relatório diário entre réplicas do agendador: "arquivo" (mesmo host),
+        # "sqlite" (banco compartilhado) ou "redis" (várias máquinas)
+        self.TRAVA_BACKEND = os.getenv("TRAVA_BACKEND", "arquivo").lower()
+        self.TRAVA_REDIS_URL = os.getenv("TRAVA_REDIS_URL", "redis://localhost:6379/0")
+        self.TRAVA_TTL_SEGUNDOS = int(os.getenv("TRAVA_TTL_SEGUNDOS", "600"))
+        self.TRAVA_RETENCAO_HORAS = int(os.getenv("TRAVA_RETENCAO_HORAS", "48"))
+        
+        # Arquivo pesquisável das publicações de cada relatório (aba Histórico do Streamlit)
+        self.ARQUIVO_ENABLED = os.getenv("ARQUIVO_ENABLED", "true").lower() == "true"
+        # Exportação das publicações em Parquet particionado (ano/mês/categoria), requer pyarrow
+        self.PARQUET_ENABLED = os.getenv("PARQUET_ENABLED", "false").lower() == "true"
+        self.PARQUET_COMPRESSAO = os.getenv("PARQUET_COMPRESSAO", "zstd")
         
         # Configurações do Selenium
         self.HEADLESS_MODE = os.getenv("HEADLESS_MODE", "true").lower() == "true"
+        # Bloqueia imagens, fontes e CSS e usa carregamento "eager" nas listagens
+        self.NAVEGACAO_ENXUTA = os.getenv("NAVEGACAO_ENXUTA", "true").lower() == "true"
         self.TIMEOUT_PAGINA = int(os.getenv("TIMEOUT_PAGINA", "30"))
-        self.DELAY_ENTRE_REQUISICOES = int(os.getenv("DELAY_ENTRE_REQUISICOES", "2"))
+        
+        # Pool de navegadores aquecidos (reutilizados entre coletas)
+        self.WEBDRIVER_POOL_ENABLED = os.getenv("WEBDRIVER_POOL_ENABLED", "true").lower() == "true"
+        self.WEBDRIVER_POOL_TAMANHO = int(os.getenv("WEBDRIVER_POOL_TAMANHO", "2"))
+        self.WEBDRIVER_MAX_USOS = int(os.getenv("WEBDRIVER_MAX_USOS", "20"))
+        self.WEBDRIVER_MAX_MEMORIA_MB = int(os.getenv("WEBDRIVER_MAX_MEMORIA_MB", "1024"))
+        
+        # Controle de taxa e retentativas (compartilhado por todo o I/O do scraper)
+        self.TAXA_REQUISICOES = float(os.getenv("TAXA_REQUISICOES", "2"))
+        self.RAJADA_REQUISICOES = int(os.getenv("RAJADA_REQUISICOES", "4"))
+        self.MAX_TENTATIVAS = int(os.getenv("MAX_TENTATIVAS", "3"))
+        self.ORCAMENTO_REQUISICOES = int(os.getenv("ORCAMENTO_REQUISICOES", "500"))
+        self.MAX_WORKERS_CONTEUDO = int(os.getenv("MAX_WORKERS_CONTEUDO", "4"))
+        
+        # Configurações do Cache HTTP
+        self.HTTP_CACHE_ENABLED = os.getenv("HTTP_CACHE_ENABLED", "true").lower() == "true"
+        
+        # Configurações de extração de PDF
+        self.PDF_MAX_PAGINAS = int(os.getenv("PDF_MAX_PAGINAS", "50"))
+        self.PDF_WORKERS = int(os.getenv("PDF_WORKERS", "2"))
+        self.PDF_MIN_CARACTERES_PAGINA = int(os.getenv("PDF_MIN_CARACTERES_PAGINA", "1000"))
         
         # Configurações de LLM
         self.LLM_PROVIDER = os.getenv("LLM_PROVIDER", "fallback").lower()
@@ -70,15 +161,35 @@ class Config:
         self.OLLAMA_MODEL = os.getenv("OLLAMA_MODEL", "llama2")
         self.OPENAI_MODEL = os.getenv("OPENAI_MODEL", "gpt-3.5-turbo")
         self.CLAUDE_MODEL = os.getenv("CLAUDE_MODEL", "claude-3-sonnet-20240229")
+        # Cache de resumos (mesmo documento, provedor e modelo não voltam ao LLM)
+        self.LLM_CACHE_ENABLED = os.getenv("LLM_CACHE_ENABLED", "true").lower() == "true"
+        self.LLM_CACHE_DIAS = int(os.getenv("LLM_CACHE_DIAS", "90"))
+        
+        # Logging (ver config/logging_config.py)
+        self.LOG_NIVEL = os.getenv("LOG_NIVEL", "INFO").upper()
+        self.LOG_JSON_ENABLED = os.getenv("LOG_JSON_ENABLED", "true").lower() == "true"
+        self.LOG_MAX_MB = int(os.getenv("LOG_MAX_MB", "10"))
+        self.LOG_BACKUPS = int(os.getenv("LOG_BACKUPS", "5"))
         
         # Diretórios
         self.BASE_DIR = Path(__file__).parent.parent
         self.RELATORIOS_DIR = self.BASE_DIR / "relatorios"
         self.LOGS_DIR = self.BASE_DIR / "logs"
+        self.CACHE_DIR = Path(os.getenv("CACHE_DIR", str(self.BASE_DIR / "cache")))
+        self.HTTP_CACHE_DIR = self.CACHE_DIR / "http"
+        self.LLM_CACHE_PATH = self.CACHE_DIR / "resumos.db"
+        self.DADOS_DIR = Path(os.getenv("DADOS_DIR", str(self.BASE_DIR / "dados")))
+        self.AGENDADOR_DB_PATH = self.DADOS_DIR / "agendador.db"
+        self.ARQUIVO_DB_PATH = self.DADOS_DIR / "arquivo.db"
+        self.PARQUET_DIR = Path(os.getenv("PARQUET_DIR") or self.DADOS_DIR / "parquet")
+        self.TRAVA_DIR = self.DADOS_DIR / "travas"
+        self.TRAVA_SQLITE_PATH = Path(os.getenv("TRAVA_SQLITE_PATH") or self.AGENDADOR_DB_PATH)
         
         # Cria diretórios se não existirem
         self.RELATORIOS_DIR.mkdir(exist_ok=True)
         self.LOGS_DIR.mkdir(exist_ok=True)
+        self.CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        self.DADOS_DIR.mkdir(parents=True, exist_ok=True)
     
     def get_llm_api_key(self) -> str:
         """
@@ -112,7 +223,14 @@ class Config:
         if not self.DESTINATARIOS:
             errors.append("DESTINATARIOS não configurado")
         
-        if self.LLM_PROVIDER != "fallback" and not self.get_llm_api_key():
+        if self.SCRAPER_BACKEND not in ("selenium", "api"):
+            errors.append(f"SCRAPER_BACKEND inválido: {self.SCRAPER_BACKEND} (use selenium ou api)")
+        
+        if self.TRAVA_BACKEND not in ("arquivo", "sqlite", "redis"):
+            errors.append(f"TRAVA_BACKEND inválido: {self.TRAVA_BACKEND} (use arquivo, sqlite ou redis)")
+        
+        # O OLLAMA roda localmente e não usa API key
+        if self.LLM_PROVIDER not in ("fallback", "ollama") and not self.get_llm_api_key():
             errors.append(f"API Key do {self.LLM_PROVIDER.upper()} não configurada")
         
         return errors
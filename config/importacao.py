@@ -0,0 +1,41 @@
+"""
+Importação preguiçosa de atributos de pacote (PEP 562)
+
+Os pacotes exportam classes de dependências pesadas (Selenium, reportlab, SDKs de LLM,
+APScheduler, pyarrow) sem importá-las no import do pacote: o módulo só é carregado no
+primeiro acesso ao nome.
+
+Uso, no __init__.py do pacote:
+    
+    _MODULOS = {'PDFGenerator': '.pdf_generator'}
+    __getattr__, __dir__ = carregar_preguicoso(__name__, _MODULOS)
+"""
+
+import sys
+from importlib import import_module
+from typing import Any, Callable, Dict, List, Tuple
+
+
+def carregar_preguicoso(pacote: str, modulos: Dict[str, str]) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Cria o __getattr__ e o __dir__ de um pacote com atributos importados sob demanda
+    
+    Args:
+        pacote: __name__ do pacote
+        modulos: Nome exportado -> módulo relativo que o define (ex.: '.bacen_scraper')
+    
+    Returns:
+        Tupla (__getattr__, __dir__) para atribuir no __init__.py
+    """
+    def __getattr__(nome: str) -> Any:
+        if nome not in modulos:
+            raise AttributeError(f"module {pacote!r} has no attribute {nome!r}")
+        valor = getattr(import_module(modulos[nome], pacote), nome)
+        # Os próximos acessos não passam mais por aqui
+        setattr(sys.modules[pacote], nome, valor)
+        return valor
+    
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[pacote])) | set(modulos))
+    
+    return __getattr__, __dir__
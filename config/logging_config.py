@@ -0,0 +1,176 @@
+"""
+Configuração única de logging do sistema
+
+Os módulos só enfileiram registros (QueueHandler); uma thread (QueueListener) grava
+no console, no log geral, no arquivo de cada componente (lidos pela aba Logs do
+Streamlit) e, opcionalmente, em JSON por linha. Assim a escrita em disco nunca
+bloqueia as threads de coleta, resumo ou agendamento.
+"""
+
+import os
+import json
+import queue
+import atexit
+import logging
+import threading
+from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+
+FORMATO_TEXTO = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+# Arquivo de cada componente e os prefixos de logger que vão para ele
+ARQUIVOS_COMPONENTES: Dict[str, Tuple[str, ...]] = {
+    'scraper.log': ('modulo_scraper',),
+    'llm.log': ('modulo_llm',),
+    'pdf_generator.log': ('modulo_report',),
+    'email_sender.log': ('modulo_email',),
+    'scheduler.log': ('modulo_scheduler', 'apscheduler'),
+}
+ARQUIVO_GERAL = 'sistema_monitoramento.log'
+ARQUIVO_JSON = 'eventos.jsonl'
+
+# Atributos padrão de LogRecord (o restante veio de extra= e entra no JSON)
+_ATRIBUTOS_PADRAO = set(vars(logging.LogRecord('', 0, '', 0, '', None, None))) | {'message', 'asctime'}
+
+_listener: Optional[QueueListener] = None
+_lock = threading.Lock()
+
+
+class FiltroComponente(logging.Filter):
+    """Aceita apenas registros de loggers com um dos prefixos"""
+    
+    def __init__(self, prefixos: Tuple[str, ...]):
+        super().__init__()
+        self.prefixos = prefixos
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        return any(record.name == p or record.name.startswith(p + '.') for p in self.prefixos)
+
+
+class FormatadorJSON(logging.Formatter):
+    """Um objeto JSON por linha, com os campos passados em extra="""
+    
+    def format(self, record: logging.LogRecord) -> str:
+        evento = {
+            'ts': datetime.fromtimestamp(record.created).isoformat(timespec='milliseconds'),
+            'nivel': record.levelname,
+            'logger': record.name,
+            'mensagem': record.getMessage(),
+            'modulo': f"{record.module}:{record.lineno}",
+            'thread': record.threadName,
+            'processo': record.process,
+        }
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            evento['excecao'] = record.exc_text
+        for chave, valor in vars(record).items():
+            if chave not in _ATRIBUTOS_PADRAO and not chave.startswith('_'):
+                evento[chave] = valor
+        return json.dumps(evento, ensure_ascii=False, default=str)
+
+
+class HandlerFila(QueueHandler):
+    """
+    QueueHandler que preserva o traceback à parte da mensagem
+    
+    Em processos filhos (pool de extração de PDF) a thread do listener não existe;
+    ali os registros são gravados diretamente pelos handlers herdados.
+    """
+    
+    def __init__(self, fila, handlers):
+        super().__init__(fila)
+        self.handlers_destino = handlers
+        self._pid = os.getpid()
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Resolve mensagem e traceback na thread de origem (args podem mudar depois)
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+        record.msg = record.getMessage()
+        record.args = None
+        record.exc_info = None
+        return record
+    
+    def emit(self, record: logging.LogRecord):
+        if os.getpid() != self._pid:
+            for handler in self.handlers_destino:
+                if record.levelno >= handler.level:
+                    handler.handle(record)
+            return
+        super().emit(record)
+
+
+def configurar_logging(config=None) -> QueueListener:
+    """
+    Configura o logging do processo (chamadas seguintes não alteram nada)
+    
+    Args:
+        config: Objeto de configuração (LOGS_DIR, LOG_NIVEL, LOG_JSON_ENABLED,
+            LOG_MAX_MB, LOG_BACKUPS); sem ele, valores padrão
+    
+    Returns:
+        Listener que grava os registros
+    """
+    global _listener
+    with _lock:
+        if _listener is not None:
+            return _listener
+        
+        logs_dir = Path(getattr(config, 'LOGS_DIR', Path(__file__).parent.parent / 'logs'))
+        logs_dir.mkdir(parents=True, exist_ok=True)
+        nivel = getattr(logging, str(getattr(config, 'LOG_NIVEL', 'INFO')).upper(), logging.INFO)
+        max_bytes = int(getattr(config, 'LOG_MAX_MB', 10)) * 1024 * 1024
+        backups = int(getattr(config, 'LOG_BACKUPS', 5))
+        
+        def arquivo(nome: str, formatador: logging.Formatter) -> RotatingFileHandler:
+            handler = RotatingFileHandler(
+                logs_dir / nome, maxBytes=max_bytes, backupCount=backups, encoding='utf-8', delay=True
+            )
+            handler.setFormatter(formatador)
+            return handler
+        
+        texto = logging.Formatter(FORMATO_TEXTO)
+        console = logging.StreamHandler()
+        console.setFormatter(texto)
+        handlers = [console, arquivo(ARQUIVO_GERAL, texto)]
+        
+        for nome, prefixos in ARQUIVOS_COMPONENTES.items():
+            handler = arquivo(nome, texto)
+            handler.addFilter(FiltroComponente(prefixos))
+            handlers.append(handler)
+        
+        if getattr(config, 'LOG_JSON_ENABLED', True):
+            handlers.append(arquivo(ARQUIVO_JSON, FormatadorJSON()))
+        
+        fila = queue.SimpleQueue()
+        _listener = QueueListener(fila, *handlers, respect_handler_level=True)
+        
+        raiz = logging.getLogger()
+        for handler in list(raiz.handlers):
+            raiz.removeHandler(handler)
+        raiz.addHandler(HandlerFila(fila, handlers))
+        raiz.setLevel(nivel)
+        
+        _listener.start()
+        atexit.register(encerrar_logging)
+        return _listener
+
+
+def encerrar_logging():
+    """Esvazia a fila e fecha os arquivos de log"""
+    global _listener
+    with _lock:
+        if _listener is None:
+            return
+        raiz = logging.getLogger()
+        for handler in list(raiz.handlers):
+            if isinstance(handler, HandlerFila):
+                raiz.removeHandler(handler)
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
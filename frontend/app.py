@@ -5,6 +5,8 @@ Frontend Streamlit - Interface Web para o Sistema de Monitoramento BACEN
 import streamlit as st
 import os
 import sys
+import time
+import atexit
 from datetime import datetime
 import pandas as pd
 from pathlib import Path
@@ -14,11 +16,12 @@ root_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 if root_dir not in sys.path:
     sys.path.insert(0, root_dir)
 
-from modulo_scraper import BACENScraper
-from modulo_llm import LLMManager
 from modulo_report import PDFGenerator
 from modulo_email import EmailSender
 from config.config import Config
+from frontend.tarefas_fundo import STATUS_ATIVOS, GerenciadorTarefas, tarefa_coleta, tarefa_resumos
+from frontend.recursos import RecursosFrontend, impressao_config
+from frontend.leitor_logs import FiltroLog, LeitorLog
 
 
 # Configuração da página
@@ -41,6 +44,28 @@ def get_config():
 
 config = get_config()
 
+@st.cache_resource
+def get_gerenciador():
+    """Pool de tarefas em segundo plano, compartilhado por todas as sessões"""
+    return GerenciadorTarefas(config.FRONTEND_WORKERS, config.FRONTEND_RETENCAO_MINUTOS)
+
+gerenciador = get_gerenciador()
+
+@st.cache_resource
+def get_recursos(impressao: str):
+    """Clientes LLM, scraper e cache de resumos da configuração (identificada pelo hash)"""
+    recursos = RecursosFrontend(config)
+    atexit.register(recursos.encerrar)
+    return recursos
+
+recursos = get_recursos(impressao_config(config))
+
+@st.cache_data(max_entries=4, show_spinner=False)
+def ler_relatorio(caminho: str, sha256: str) -> bytes:
+    """Bytes de um PDF, lidos do disco uma vez por versão (caminho e sha256 do índice)"""
+    with open(caminho, 'rb') as f:
+        return f.read()
+
 # Sidebar - Configurações
 with st.sidebar:
     st.header("⚙️ Configurações")
@@ -69,143 +94,194 @@ with st.sidebar:
     # Status do sistema
     st.subheader("📊 Status")
     
-    # Verifica se há relatórios recentes
-    relatorios_dir = Path("relatorios")
-    if relatorios_dir.exists():
-        pdfs = list(relatorios_dir.glob("*.pdf"))
-        if pdfs:
-            ultimo_pdf = max(pdfs, key=lambda p: p.stat().st_mtime)
-            st.success(f"✅ Último relatório: {ultimo_pdf.name}")
-        else:
-            st.warning("⚠️ Nenhum relatório encontrado")
+    # Último relatório, pelo índice mantido pelo PDFGenerator (sem varrer o diretório)
+    ultimo_relatorio = recursos.indice_relatorios.ultimo()
+    if ultimo_relatorio:
+        st.success(f"✅ Último relatório: {ultimo_relatorio['nome']}")
     else:
-        st.warning("⚠️ Diretório de relatórios não existe")
+        st.warning("⚠️ Nenhum relatório encontrado")
+    
+    if recursos.cache_resumos:
+        cache = recursos.cache_resumos.estatisticas
+        st.caption(f"Cache de resumos: {cache['acertos']} reaproveitados, {cache['gravados']} novos")
+    
+    # Tarefas em segundo plano de todas as sessões
+    em_andamento = [t for t in gerenciador.listar() if t['status'] in STATUS_ATIVOS]
+    if em_andamento:
+        st.subheader("⏳ Em andamento")
+        for tarefa in em_andamento:
+            progresso = f" ({tarefa['concluidos']}/{tarefa['total']})" if tarefa['total'] else ""
+            st.caption(f"{tarefa['descricao']}{progresso}")
 
 # Abas principais
-tab1, tab2, tab3, tab4 = st.tabs(["📋 Executar Coleta", "📊 Relatórios", "📧 Email", "📝 Logs"])
+tab1, tab2, tab3, tab4, tab5 = st.tabs(
+    ["📋 Executar Coleta", "📊 Relatórios", "📧 Email", "📝 Logs", "🗂️ Histórico"]
+)
 
 # Aba 1: Executar Coleta
+def exibir_tarefa(tarefa_id, colunas, rotulo_itens):
+    """
+    Mostra progresso e resultados parciais de uma tarefa em segundo plano
+    
+    Returns:
+        Instantâneo da tarefa ou None se ela não existir mais
+    """
+    estado = gerenciador.obter(tarefa_id)
+    if not estado:
+        return None
+    
+    if estado['status'] == 'pendente':
+        st.info("⏳ Aguardando na fila...")
+    elif estado['status'] == 'executando':
+        if estado['total']:
+            st.progress(
+                estado['progresso'],
+                text=f"{estado['concluidos']}/{estado['total']} {rotulo_itens} ({estado['duracao_s']:.0f}s)"
+            )
+        else:
+            st.info(f"⏳ {estado['descricao']}... ({estado['duracao_s']:.0f}s)")
+    elif estado['status'] == 'erro':
+        st.error(f"❌ {estado['descricao']} falhou: {estado['erro']}")
+    
+    itens = estado['resultado_final'] if estado['resultado_final'] is not None else estado['resultados']
+    if itens:
+        df = pd.DataFrame(itens)
+        st.dataframe(df[[c for c in colunas if c in df.columns]], use_container_width=True)
+    return estado
+
+
 with tab1:
     st.header("Executar Coleta e Processamento")
+    st.caption("A coleta e os resumos rodam em segundo plano: a página pode ser atualizada sem interrompê-los.")
     
     col1, col2 = st.columns(2)
     
     with col1:
         st.subheader("Coleta de Dados")
-        if st.button("🔄 Executar Coleta", type="primary"):
-            with st.spinner("Coletando dados do BACEN..."):
-                try:
-                    scraper = BACENScraper(config)
-                    dados_coletados = scraper.executar_coleta()
-                    
-                    if dados_coletados:
-                        st.success(f"✅ {len(dados_coletados)} documentos coletados!")
-                        st.session_state['dados_coletados'] = dados_coletados
-                        
-                        # Mostra preview
-                        st.subheader("Preview dos Dados Coletados")
-                        df = pd.DataFrame(dados_coletados)
-                        st.dataframe(df[['titulo', 'tipo', 'data']], use_container_width=True)
-                    else:
-                        st.warning("⚠️ Nenhum documento encontrado")
-                        
-                except Exception as e:
-                    st.error(f"❌ Erro na coleta: {str(e)}")
+        coleta = gerenciador.obter(st.session_state.get('tarefa_coleta'))
+        coleta_ativa = bool(coleta and coleta['status'] in STATUS_ATIVOS)
+        
+        if st.button("🔄 Executar Coleta", type="primary", disabled=coleta_ativa):
+            st.session_state['tarefa_coleta'] = gerenciador.submeter(
+                'coleta', tarefa_coleta, recursos.scraper(),
+                descricao="Coletando dados do BACEN", chave='coleta'
+            )
+        
+        estado = exibir_tarefa(st.session_state.get('tarefa_coleta'), ['titulo', 'tipo', 'data'], "documentos")
+        if estado and estado['status'] == 'concluida':
+            if st.session_state.get('dados_coletados_tarefa') != estado['id']:
+                st.session_state['dados_coletados'] = estado['resultado_final']
+                st.session_state['dados_coletados_tarefa'] = estado['id']
+            
+            if estado['resultado_final']:
+                st.success(f"✅ {len(estado['resultado_final'])} documentos coletados!")
+            else:
+                st.warning("⚠️ Nenhum documento encontrado")
     
     with col2:
         st.subheader("Processamento com LLM")
+        resumos = gerenciador.obter(st.session_state.get('tarefa_resumos'))
+        resumos_ativa = bool(resumos and resumos['status'] in STATUS_ATIVOS)
         
         if 'dados_coletados' in st.session_state and st.session_state['dados_coletados']:
-            if st.button("🤖 Processar com LLM", type="primary"):
-                with st.spinner("Processando com LLM..."):
-                    try:
-                        llm_manager = LLMManager(
-                            provider_name=selected_provider,
-                            api_key=api_key
-                        )
-                        
-                        informacoes_processadas = []
-                        progress_bar = st.progress(0)
-                        
-                        for idx, item in enumerate(st.session_state['dados_coletados']):
-                            texto = item.get('conteudo_completo', '')
-                            titulo = item.get('titulo', '')
-                            link = item.get('link', '')
-                            
-                            if texto:
-                                resumo = llm_manager.summarize(
-                                    texto=texto,
-                                    titulo=titulo,
-                                    link=link,
-                                    max_lines=5
-                                )
-                                item['resumo'] = resumo
-                            
-                            informacoes_processadas.append(item)
-                            progress_bar.progress((idx + 1) / len(st.session_state['dados_coletados']))
-                        
-                        st.session_state['informacoes_processadas'] = informacoes_processadas
-                        st.success(f"✅ {len(informacoes_processadas)} documentos processados!")
-                        
-                    except Exception as e:
-                        st.error(f"❌ Erro no processamento: {str(e)}")
-        else:
+            if st.button("🤖 Processar com LLM", type="primary", disabled=resumos_ativa):
+                try:
+                    # Cria o gerenciador já aqui, para que um erro de configuração apareça na hora
+                    recursos.llm_manager(selected_provider, api_key)
+                    st.session_state['tarefa_resumos'] = gerenciador.submeter(
+                        'resumos', tarefa_resumos,
+                        list(st.session_state['dados_coletados']),
+                        recursos, selected_provider, api_key,
+                        descricao="Processando com LLM"
+                    )
+                except Exception as e:
+                    st.error(f"❌ Erro ao configurar o LLM: {str(e)}")
+        elif not resumos:
             st.info("ℹ️ Execute a coleta primeiro")
+        
+        estado = exibir_tarefa(st.session_state.get('tarefa_resumos'), ['titulo', 'resumo'], "documentos")
+        if estado and estado['status'] == 'concluida':
+            if st.session_state.get('informacoes_processadas_tarefa') != estado['id']:
+                st.session_state['informacoes_processadas'] = estado['resultado_final']
+                st.session_state['informacoes_processadas_tarefa'] = estado['id']
+            st.success(f"✅ {len(estado['resultado_final'])} documentos processados!")
 
 # Aba 2: Relatórios
 with tab2:
     st.header("Relatórios Gerados")
     
-    # Lista de relatórios PDF
-    relatorios_dir = Path("relatorios")
-    if relatorios_dir.exists():
-        pdfs = sorted(relatorios_dir.glob("*.pdf"), key=lambda p: p.stat().st_mtime, reverse=True)
+    # Lista de relatórios PDF (uma página do índice por vez)
+    indice = recursos.indice_relatorios
+    total_relatorios = indice.total()
+    
+    if total_relatorios:
+        st.subheader("Relatórios Disponíveis")
         
-        if pdfs:
-            st.subheader("Relatórios Disponíveis")
+        col1, col2 = st.columns([3, 1])
+        with col1:
+            paginas_relatorios = -(-total_relatorios // 10)
+            pagina_relatorios = st.number_input(
+                f"Página (de {paginas_relatorios}):", min_value=1, max_value=paginas_relatorios, value=1
+            )
+        with col2:
+            if st.button("🔄 Reindexar", help="Inclui PDFs copiados para a pasta e remove os apagados"):
+                indice.sincronizar()
+                st.rerun()
+        
+        for relatorio in indice.listar(10, (pagina_relatorios - 1) * 10):
+            col1, col2, col3 = st.columns([3, 1, 1])
             
-            for pdf in pdfs[:10]:  # Mostra últimos 10
-                col1, col2, col3 = st.columns([3, 1, 1])
-                
-                with col1:
-                    st.write(f"📄 {pdf.name}")
-                    st.caption(f"Modificado: {datetime.fromtimestamp(pdf.stat().st_mtime).strftime('%d/%m/%Y %H:%M')}")
-                
-                with col2:
-                    with open(pdf, 'rb') as f:
+            with col1:
+                st.write(f"📄 {relatorio['nome']}")
+                detalhes = [f"Gerado: {datetime.fromtimestamp(relatorio['criado_em']).strftime('%d/%m/%Y %H:%M')}"]
+                if relatorio['itens'] is not None:
+                    detalhes.append(f"{relatorio['itens']} documento(s)")
+                detalhes.append(f"{relatorio['tamanho'] / 1024:.0f} KB")
+                st.caption(" | ".join(detalhes))
+            
+            with col2:
+                # Só o relatório escolhido é lido do disco, uma vez: os reruns seguintes
+                # (inclusive a atualização automática) reaproveitam os bytes em cache
+                if st.session_state.get('relatorio_download') == relatorio['nome']:
+                    if os.path.exists(relatorio['caminho']):
                         st.download_button(
-                            "⬇️ Download",
-                            f.read(),
-                            file_name=pdf.name,
+                            "💾 Salvar",
+                            ler_relatorio(relatorio['caminho'], relatorio['sha256']),
+                            file_name=relatorio['nome'],
                             mime="application/pdf",
-                            key=f"download_{pdf.name}"
+                            key=f"download_{relatorio['nome']}"
                         )
-                
-                with col3:
-                    if st.button("🗑️", key=f"delete_{pdf.name}"):
-                        pdf.unlink()
-                        st.rerun()
+                    else:
+                        st.caption("Arquivo ausente")
+                elif st.button("⬇️ Download", key=f"preparar_{relatorio['nome']}"):
+                    st.session_state['relatorio_download'] = relatorio['nome']
+                    st.rerun()
             
-            # Gerar novo relatório
-            if 'informacoes_processadas' in st.session_state:
-                st.markdown("---")
-                st.subheader("Gerar Novo Relatório PDF")
-                
-                if st.button("📄 Gerar PDF", type="primary"):
-                    with st.spinner("Gerando PDF..."):
-                        try:
-                            generator = PDFGenerator()
-                            caminho_pdf = generator.generate_pdf(
-                                st.session_state['informacoes_processadas']
-                            )
-                            st.success(f"✅ PDF gerado: {caminho_pdf}")
-                            st.rerun()
-                        except Exception as e:
-                            st.error(f"❌ Erro ao gerar PDF: {str(e)}")
-        else:
-            st.info("ℹ️ Nenhum relatório encontrado")
+            with col3:
+                if st.button("🗑️", key=f"delete_{relatorio['nome']}"):
+                    indice.remover(relatorio['nome'])
+                    st.rerun()
     else:
-        st.warning("⚠️ Diretório de relatórios não existe")
+        st.info("ℹ️ Nenhum relatório encontrado")
+    
+    # Gerar novo relatório
+    if 'informacoes_processadas' in st.session_state:
+        st.markdown("---")
+        st.subheader("Gerar Novo Relatório PDF")
+        
+        if st.button("📄 Gerar PDF", type="primary"):
+            with st.spinner("Gerando PDF..."):
+                try:
+                    generator = PDFGenerator(str(config.RELATORIOS_DIR))
+                    caminho_pdf = generator.generate_pdf(
+                        st.session_state['informacoes_processadas']
+                    )
+                    if recursos.arquivo:
+                        recursos.arquivo.arquivar(st.session_state['informacoes_processadas'], caminho_pdf)
+                    st.success(f"✅ PDF gerado: {caminho_pdf}")
+                    st.rerun()
+                except Exception as e:
+                    st.error(f"❌ Erro ao gerar PDF: {str(e)}")
 
 # Aba 3: Email
 with tab3:
@@ -214,14 +290,13 @@ with tab3:
     if 'informacoes_processadas' in st.session_state:
         st.subheader("Enviar Relatório por Email")
         
-        # Seleção de PDF
-        relatorios_dir = Path("relatorios")
-        pdfs = sorted(relatorios_dir.glob("*.pdf"), key=lambda p: p.stat().st_mtime, reverse=True) if relatorios_dir.exists() else []
+        # Seleção de PDF (os mais recentes, pelo índice)
+        pdfs = {relatorio['nome']: relatorio['caminho'] for relatorio in recursos.indice_relatorios.listar(50)}
         
         if pdfs:
             pdf_selecionado = st.selectbox(
                 "Selecione o PDF para enviar:",
-                [pdf.name for pdf in pdfs]
+                list(pdfs.keys())
             )
             
             assunto = st.text_input(
@@ -233,7 +308,7 @@ with tab3:
                 with st.spinner("Enviando email..."):
                     try:
                         email_sender = EmailSender(config)
-                        caminho_pdf = relatorios_dir / pdf_selecionado
+                        caminho_pdf = pdfs[pdf_selecionado]
                         
                         corpo_html = email_sender.criar_corpo_email_html(
                             st.session_state['informacoes_processadas']
@@ -262,25 +337,45 @@ with tab4:
     st.header("Logs do Sistema")
     
     log_files = {
-        "Scraper": "logs/scraper.log",
-        "LLM": "logs/llm.log",
-        "PDF": "logs/pdf_generator.log",
-        "Email": "logs/email_sender.log",
-        "Scheduler": "logs/scheduler.log"
+        "Sistema": "sistema_monitoramento.log",
+        "Scraper": "scraper.log",
+        "LLM": "llm.log",
+        "PDF": "pdf_generator.log",
+        "Email": "email_sender.log",
+        "Scheduler": "scheduler.log"
     }
     
-    log_selecionado = st.selectbox("Selecione o log:", list(log_files.keys()))
+    col1, col2, col3 = st.columns([2, 1, 1])
+    with col1:
+        log_selecionado = st.selectbox("Selecione o log:", list(log_files.keys()))
+    with col2:
+        nivel_minimo = st.selectbox("Nível mínimo:", ['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'])
+    with col3:
+        max_registros = st.number_input("Registros:", min_value=20, max_value=2000, value=100, step=20)
+    
+    col1, col2, col3 = st.columns([2, 2, 1])
+    with col1:
+        componente = st.text_input("Componente (logger):", placeholder="ex.: modulo_scraper.coletor_api")
+    with col2:
+        busca = st.text_input("Contém:")
+    with col3:
+        st.checkbox("Atualizar automaticamente", key='logs_auto')
     
-    log_path = log_files[log_selecionado]
+    log_path = config.LOGS_DIR / log_files[log_selecionado]
+    filtro = FiltroLog(nivel_minimo, componente.strip(), busca.strip())
     
-    if os.path.exists(log_path):
-        with open(log_path, 'r', encoding='utf-8') as f:
-            linhas = f.readlines()
-            ultimas_linhas = linhas[-100:] if len(linhas) > 100 else linhas
-            
+    # O leitor guarda o offset: nas atualizações seguintes só lê o que foi acrescentado
+    chave_leitor = (str(log_path), filtro, int(max_registros))
+    if st.session_state.get('leitor_logs_chave') != chave_leitor:
+        st.session_state['leitor_logs'] = LeitorLog(log_path, int(max_registros), filtro)
+        st.session_state['leitor_logs_chave'] = chave_leitor
+    leitor = st.session_state['leitor_logs']
+    registros = leitor.atualizar()
+    
+    if log_path.exists():
         st.text_area(
-            "Últimas 100 linhas:",
-            value=''.join(ultimas_linhas),
+            f"Últimos {len(registros)} registros:",
+            value=leitor.texto(),
             height=400
         )
         
@@ -289,6 +384,82 @@ with tab4:
     else:
         st.warning(f"⚠️ Arquivo de log não encontrado: {log_path}")
 
+# Aba 5: Histórico
+with tab5:
+    st.header("Histórico de Publicações")
+    
+    arquivo = recursos.arquivo
+    if not arquivo:
+        st.info("ℹ️ Arquivo de publicações desativado (ARQUIVO_ENABLED=false)")
+    elif not arquivo.total():
+        st.info("ℹ️ Nenhuma publicação arquivada: elas entram no arquivo a cada relatório gerado")
+    else:
+        col1, col2, col3, col4 = st.columns([3, 2, 2, 1])
+        with col1:
+            busca_historico = st.text_input("Buscar:", placeholder="palavras no título, resumo ou conteúdo")
+        with col2:
+            tipos_historico = st.multiselect("Tipos:", arquivo.tipos())
+        with col3:
+            periodo = st.date_input("Período:", value=[], format="DD/MM/YYYY")
+        with col4:
+            por_pagina = st.selectbox("Por página:", [25, 50, 100])
+        
+        # Filtros novos voltam para a primeira página
+        filtros = (busca_historico, tuple(tipos_historico), tuple(periodo), por_pagina)
+        if st.session_state.get('historico_filtros') != filtros:
+            st.session_state['historico_filtros'] = filtros
+            st.session_state['historico_pagina'] = 1
+        
+        # A consulta traz só a página pedida (paginação e busca feitas no SQLite)
+        resultado = arquivo.buscar(
+            texto=busca_historico,
+            tipos=tipos_historico,
+            data_inicio=periodo[0] if len(periodo) > 0 else None,
+            data_fim=periodo[1] if len(periodo) > 1 else None,
+            pagina=st.session_state['historico_pagina'],
+            por_pagina=por_pagina
+        )
+        st.session_state['historico_pagina'] = resultado['pagina']
+        
+        if resultado['itens']:
+            df = pd.DataFrame(resultado['itens'])
+            coluna_texto = 'trecho' if busca_historico.strip() and df['trecho'].notna().any() else 'resumo'
+            st.dataframe(
+                df[['data', 'tipo', 'titulo', coluna_texto, 'link']],
+                use_container_width=True,
+                hide_index=True,
+                column_config={'link': st.column_config.LinkColumn("Link")}
+            )
+        else:
+            st.warning("⚠️ Nenhuma publicação encontrada com esses filtros")
+        
+        col1, col2, col3 = st.columns([1, 2, 1])
+        with col1:
+            if st.button("◀ Anterior", disabled=resultado['pagina'] <= 1):
+                st.session_state['historico_pagina'] -= 1
+                st.rerun()
+        with col2:
+            st.caption(
+                f"{resultado['total']} publicação(ões) - página {resultado['pagina']} de {resultado['paginas']}"
+            )
+        with col3:
+            if st.button("Próxima ▶", disabled=resultado['pagina'] >= resultado['paginas']):
+                st.session_state['historico_pagina'] += 1
+                st.rerun()
+        
+        if resultado['itens']:
+            opcoes = {f"{item['data'] or '-'} - {item['titulo'][:90]}": item['id'] for item in resultado['itens']}
+            escolhida = st.selectbox("Detalhes da publicação:", list(opcoes.keys()))
+            publicacao = arquivo.obter(opcoes[escolhida])
+            if publicacao:
+                with st.expander(publicacao['titulo'], expanded=False):
+                    st.markdown(f"**{publicacao['tipo'] or ''}** - {publicacao['data'] or ''} - [Leia na íntegra]({publicacao['link']})")
+                    if publicacao['caminho_pdf']:
+                        st.caption(f"Relatório: {Path(publicacao['caminho_pdf']).name}")
+                    st.markdown(publicacao['resumo'] or "_Sem resumo_")
+                    if publicacao['conteudo']:
+                        st.text_area("Conteúdo:", publicacao['conteudo'], height=250, key=f"conteudo_{publicacao['id']}")
+
 # Rodapé
 st.markdown("---")
 st.markdown(
@@ -299,3 +470,9 @@ st.markdown(
     unsafe_allow_html=True
 )
 
+# Enquanto houver tarefa desta sessão em andamento (ou com os logs em acompanhamento),
+# atualiza a página periodicamente
+tarefas_sessao = [gerenciador.obter(st.session_state.get(chave)) for chave in ('tarefa_coleta', 'tarefa_resumos')]
+if st.session_state.get('logs_auto') or any(estado and estado['status'] in STATUS_ATIVOS for estado in tarefas_sessao):
+    time.sleep(config.FRONTEND_ATUALIZACAO_SEGUNDOS)
+    st.rerun()
@@ -0,0 +1,212 @@
+"""
+Leitura do final dos arquivos de log para a aba Logs do Streamlit
+
+Lê de trás para frente em blocos a partir do fim do arquivo, e nas atualizações
+seguintes só os bytes acrescentados desde o último offset. O custo não depende do
+tamanho do log. Tracebacks ficam junto do registro que os originou, e a rotação do
+arquivo (RotatingFileHandler) é detectada pelo inode e pelo tamanho.
+"""
+
+import os
+import re
+import logging
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Iterable, List, Optional
+
+# Cabeçalho de um registro no formato de config.logging_config.FORMATO_TEXTO
+PADRAO_REGISTRO = re.compile(
+    rb'^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2},\d{3} - (?P<componente>\S+) - (?P<nivel>[A-Z]+) - '
+)
+
+
+@dataclass
+class RegistroLog:
+    """Um registro do log (cabeçalho e eventuais linhas de continuação)"""
+    
+    texto: str
+    nivel: Optional[str] = None
+    componente: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class FiltroLog:
+    """Critérios de exibição dos registros"""
+    
+    nivel_minimo: str = 'DEBUG'
+    componente: str = ''
+    texto: str = ''
+    
+    def aceita(self, registro: RegistroLog) -> bool:
+        """
+        Verifica se o registro passa no filtro
+        
+        Args:
+            registro: Registro lido
+        
+        Returns:
+            True se o registro deve ser exibido
+        """
+        if registro.nivel and logging.getLevelName(registro.nivel) < logging.getLevelName(self.nivel_minimo):
+            return False
+        if self.componente and not (
+            registro.componente == self.componente
+            or (registro.componente or '').startswith(self.componente + '.')
+        ):
+            return False
+        return not self.texto or self.texto.lower() in registro.texto.lower()
+
+
+def _agrupar(linhas: Iterable[bytes]) -> List[RegistroLog]:
+    """Junta as linhas (em ordem) em registros; linhas sem cabeçalho continuam o anterior"""
+    registros: List[RegistroLog] = []
+    for linha in linhas:
+        cabecalho = PADRAO_REGISTRO.match(linha)
+        texto = linha.decode('utf-8', errors='replace').rstrip('\r')
+        if cabecalho or not registros:
+            registros.append(RegistroLog(
+                texto,
+                cabecalho.group('nivel').decode() if cabecalho else None,
+                cabecalho.group('componente').decode() if cabecalho else None
+            ))
+        else:
+            registros[-1].texto += '\n' + texto
+    return registros
+
+
+class LeitorLog:
+    """Últimos registros de um arquivo de log, atualizados de forma incremental"""
+    
+    TAMANHO_BLOCO = 64 * 1024
+    
+    def __init__(
+        self,
+        caminho,
+        max_registros: int = 100,
+        filtro: Optional[FiltroLog] = None,
+        limite_busca_mb: int = 32
+    ):
+        """
+        Inicializa o leitor (nada é lido antes de atualizar())
+        
+        Args:
+            caminho: Arquivo de log
+            max_registros: Registros mantidos para exibição
+            filtro: Critérios de exibição (padrão: todos os registros)
+            limite_busca_mb: Máximo lido de trás para frente procurando registros que
+                passem no filtro (e de acréscimos entre duas atualizações)
+        """
+        self.caminho = str(caminho)
+        self.filtro = filtro or FiltroLog()
+        self.limite_busca = limite_busca_mb * 1024 * 1024
+        self.registros: Deque[RegistroLog] = deque(maxlen=max_registros)
+        self.offset: Optional[int] = None
+        self._inode: Optional[int] = None
+        self._ultimo_aceito: Optional[bool] = None  # Se o registro mais recente lido passou no filtro
+        self.bytes_lidos = 0
+    
+    def atualizar(self) -> List[RegistroLog]:
+        """
+        Lê o que mudou desde a última chamada
+        
+        Returns:
+            Registros atuais, do mais antigo para o mais recente
+        """
+        try:
+            estado = os.stat(self.caminho)
+        except FileNotFoundError:
+            self.registros.clear()
+            self.offset = None
+            return []
+        
+        rotacionado = estado.st_ino != self._inode or estado.st_size < (self.offset or 0)
+        if self.offset is None or rotacionado or estado.st_size - self.offset > self.limite_busca:
+            self._ler_final(estado.st_size)
+        elif estado.st_size > self.offset:
+            self._ler_acrescimos(estado.st_size)
+        
+        self._inode = estado.st_ino
+        return list(self.registros)
+    
+    def _ler_final(self, tamanho: int):
+        """Lê blocos do fim para o início até juntar max_registros que passem no filtro"""
+        self.registros.clear()
+        self._ultimo_aceito = None
+        encontrados: List[RegistroLog] = []
+        pendentes: List[bytes] = []  # Linhas de continuação cujo cabeçalho ainda não foi lido
+        posicao = tamanho
+        resto = b''
+        fim = None
+        
+        def fechar_registro():
+            registro = _agrupar(pendentes)[0]
+            aceito = self.filtro.aceita(registro)
+            if aceito:
+                encontrados.append(registro)
+            if self._ultimo_aceito is None:
+                self._ultimo_aceito = aceito
+            pendentes.clear()
+        
+        with open(self.caminho, 'rb') as f:
+            while posicao > 0 and len(encontrados) < self.registros.maxlen and tamanho - posicao < self.limite_busca:
+                leitura = min(self.TAMANHO_BLOCO, posicao)
+                posicao -= leitura
+                f.seek(posicao)
+                dados = f.read(leitura) + resto
+                self.bytes_lidos += leitura
+                
+                if fim is None:
+                    # Linha final ainda sem \n fica para a próxima atualização
+                    quebra = dados.rfind(b'\n')
+                    if quebra < 0 and posicao > 0:
+                        resto = dados
+                        continue
+                    fim = posicao + quebra + 1
+                    dados = dados[:quebra + 1]
+                
+                linhas = dados.split(b'\n')
+                resto = linhas.pop(0) if posicao > 0 else b''
+                
+                for linha in reversed(linhas):
+                    if not linha:
+                        continue
+                    pendentes.insert(0, linha)
+                    if PADRAO_REGISTRO.match(linha):
+                        fechar_registro()
+                        if len(encontrados) >= self.registros.maxlen:
+                            break
+        
+        # Início do arquivo com linhas sem cabeçalho
+        if pendentes and posicao == 0 and len(encontrados) < self.registros.maxlen:
+            fechar_registro()
+        
+        self.registros.extend(reversed(encontrados))
+        self.offset = fim if fim is not None else tamanho
+    
+    def _ler_acrescimos(self, tamanho: int):
+        """Lê apenas as linhas completas acrescentadas desde o último offset"""
+        with open(self.caminho, 'rb') as f:
+            f.seek(self.offset)
+            dados = f.read(tamanho - self.offset)
+        self.bytes_lidos += len(dados)
+        
+        completos = dados[:dados.rfind(b'\n') + 1]
+        if not completos:
+            return
+        self.offset += len(completos)
+        
+        linhas = completos.split(b'\n')[:-1]
+        # Continuação do registro anterior (traceback gravado depois do cabeçalho)
+        while linhas and not PADRAO_REGISTRO.match(linhas[0]):
+            continuacao = linhas.pop(0).decode('utf-8', errors='replace').rstrip('\r')
+            if self._ultimo_aceito and self.registros:
+                self.registros[-1].texto += '\n' + continuacao
+        
+        for registro in _agrupar(linhas):
+            self._ultimo_aceito = self.filtro.aceita(registro)
+            if self._ultimo_aceito:
+                self.registros.append(registro)
+    
+    def texto(self) -> str:
+        """Registros atuais como texto"""
+        return '\n'.join(registro.texto for registro in self.registros)
@@ -0,0 +1,208 @@
+"""
+Recursos compartilhados do frontend Streamlit
+
+Guarda os clientes caros de montar (gerenciadores LLM e scraper) por provedor, modelo
+e configuração, para que cliques e sessões seguintes reaproveitem conexões, o pool
+de navegadores e o cache de resumos em vez de recriá-los.
+
+As tarefas em segundo plano tomam o gerenciador LLM emprestado (emprestar_llm): um
+gerenciador descartado pelo LRU enquanto emprestado só é fechado na devolução.
+"""
+
+import os
+import sys
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Dict, Iterator, Optional, Tuple
+
+# Adiciona o diretório raiz ao path
+root_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if root_dir not in sys.path:
+    sys.path.insert(0, root_dir)
+
+if TYPE_CHECKING:
+    from modulo_arquivo import ArquivoPublicacoes
+    from modulo_llm import CacheResumos, LLMManager
+    from modulo_report import IndiceRelatorios
+    from modulo_scraper import BACENScraper
+
+
+def impressao_config(config) -> str:
+    """
+    Hash dos valores da configuração (chave do st.cache_resource)
+    
+    Args:
+        config: Objeto de configuração
+    
+    Returns:
+        SHA-256 em hexadecimal
+    """
+    valores = sorted((nome, repr(valor)) for nome, valor in vars(config).items())
+    return hashlib.sha256(repr(valores).encode('utf-8')).hexdigest()
+
+
+class RecursosFrontend:
+    """Gerenciadores LLM e scraper reutilizados por todas as sessões"""
+    
+    def __init__(self, config, max_gerenciadores: int = 4):
+        """
+        Inicializa os recursos (nada é criado antes do primeiro uso)
+        
+        Args:
+            config: Objeto de configuração
+            max_gerenciadores: Gerenciadores LLM mantidos; o menos usado é fechado (ao ser devolvido,
+                se estiver emprestado a uma tarefa)
+        """
+        self.config = config
+        self.max_gerenciadores = max_gerenciadores
+        self.logger = logging.getLogger(__name__)
+        self._gerenciadores: "OrderedDict[Tuple[str, Optional[str], str], LLMManager]" = OrderedDict()
+        self._scraper: Optional["BACENScraper"] = None
+        self._cache: Optional["CacheResumos"] = None
+        self._arquivo: Optional["ArquivoPublicacoes"] = None
+        self._indice_relatorios: Optional["IndiceRelatorios"] = None
+        # Empréstimos por gerenciador (id) e descartados à espera da última devolução
+        self._emprestimos: Dict[int, int] = {}
+        self._fechar_na_devolucao: Dict[int, "LLMManager"] = {}
+        # Reentrante: a criação de um gerenciador consulta cache_resumos com o lock tomado
+        self._lock = threading.RLock()
+    
+    @property
+    def cache_resumos(self) -> Optional["CacheResumos"]:
+        """Cache de resumos compartilhado com o agendador (None se desativado)"""
+        if self._cache is None and self.config.LLM_CACHE_ENABLED:
+            with self._lock:
+                if self._cache is None:
+                    from modulo_llm import CacheResumos
+                    self._cache = CacheResumos(self.config.LLM_CACHE_PATH, self.config.LLM_CACHE_DIAS)
+        return self._cache
+    
+    @property
+    def arquivo(self) -> Optional["ArquivoPublicacoes"]:
+        """Arquivo pesquisável das publicações (None se desativado)"""
+        if self._arquivo is None and self.config.ARQUIVO_ENABLED:
+            with self._lock:
+                if self._arquivo is None:
+                    from modulo_arquivo import ArquivoPublicacoes
+                    self._arquivo = ArquivoPublicacoes(self.config.ARQUIVO_DB_PATH)
+        return self._arquivo
+    
+    @property
+    def indice_relatorios(self) -> "IndiceRelatorios":
+        """Índice dos PDFs (reconciliado com o diretório uma vez, na criação)"""
+        if self._indice_relatorios is None:
+            with self._lock:
+                if self._indice_relatorios is None:
+                    from modulo_report import IndiceRelatorios
+                    indice = IndiceRelatorios(self.config.RELATORIOS_DIR)
+                    indice.sincronizar()
+                    self._indice_relatorios = indice
+        return self._indice_relatorios
+    
+    def _obter_llm(self, provider_name: str, api_key: Optional[str]) -> "LLMManager":
+        """Busca ou cria o gerenciador, descartando o menos usado (chamado com o lock)"""
+        from modulo_llm import LLMManager
+        
+        modelo = getattr(self.config, f"{provider_name.upper()}_MODEL", None)
+        chave = (provider_name, modelo, hashlib.sha256((api_key or '').encode('utf-8')).hexdigest())
+        
+        if chave in self._gerenciadores:
+            self._gerenciadores.move_to_end(chave)
+            return self._gerenciadores[chave]
+        
+        kwargs = {'model': modelo} if modelo else {}
+        if provider_name == 'ollama':
+            kwargs['base_url'] = self.config.OLLAMA_BASE_URL
+        gerenciador = LLMManager(provider_name=provider_name, api_key=api_key, cache=self.cache_resumos, **kwargs)
+        self._gerenciadores[chave] = gerenciador
+        self.logger.info(f"Gerenciador LLM criado: {provider_name} ({modelo or 'modelo padrão'})")
+        
+        while len(self._gerenciadores) > self.max_gerenciadores:
+            (antigo, _, _), descartado = self._gerenciadores.popitem(last=False)
+            if self._emprestimos.get(id(descartado)):
+                self._fechar_na_devolucao[id(descartado)] = descartado
+                self.logger.info(f"Gerenciador LLM descartado, fechado ao fim das tarefas: {antigo}")
+            else:
+                descartado.fechar()
+                self.logger.info(f"Gerenciador LLM fechado: {antigo}")
+        return gerenciador
+    
+    def llm_manager(self, provider_name: str, api_key: Optional[str] = None) -> "LLMManager":
+        """
+        Gerenciador LLM do provedor, criado uma vez por provedor, modelo e chave
+        
+        Para uso imediato na thread do script; tarefas em segundo plano usam emprestar_llm.
+        
+        Args:
+            provider_name: Provedor escolhido na interface
+            api_key: Chave da API informada
+        
+        Returns:
+            Gerenciador com o cache de resumos
+        """
+        with self._lock:
+            return self._obter_llm(provider_name, api_key)
+    
+    @contextmanager
+    def emprestar_llm(self, provider_name: str, api_key: Optional[str] = None) -> Iterator["LLMManager"]:
+        """
+        Empresta o gerenciador LLM por toda a duração de uma tarefa
+        
+        Se o LRU o descartar nesse meio tempo, o fechamento fica para a última devolução.
+        
+        Args:
+            provider_name: Provedor escolhido na interface
+            api_key: Chave da API informada
+        """
+        with self._lock:
+            gerenciador = self._obter_llm(provider_name, api_key)
+            self._emprestimos[id(gerenciador)] = self._emprestimos.get(id(gerenciador), 0) + 1
+        
+        try:
+            yield gerenciador
+        finally:
+            with self._lock:
+                restantes = self._emprestimos[id(gerenciador)] - 1
+                if restantes:
+                    self._emprestimos[id(gerenciador)] = restantes
+                    descartado = None
+                else:
+                    del self._emprestimos[id(gerenciador)]
+                    descartado = self._fechar_na_devolucao.pop(id(gerenciador), None)
+            if descartado is not None:
+                descartado.fechar()
+                self.logger.info(f"Gerenciador LLM fechado após a devolução: {provider_name}")
+    
+    def scraper(self) -> "BACENScraper":
+        """Scraper da configuração (usa o pool de navegadores do processo, se habilitado)"""
+        with self._lock:
+            if self._scraper is None:
+                from modulo_scraper import BACENScraper
+                self._scraper = BACENScraper(self.config)
+            return self._scraper
+    
+    def encerrar(self):
+        """Fecha os clientes LLM e o scraper"""
+        with self._lock:
+            for gerenciador in [*self._gerenciadores.values(), *self._fechar_na_devolucao.values()]:
+                gerenciador.fechar()
+            self._gerenciadores.clear()
+            self._fechar_na_devolucao.clear()
+            if self._scraper is not None:
+                self._scraper.fechar()
+                self._scraper = None
+
+
+if __name__ == "__main__":
+    # Teste do módulo: monta os recursos e acessa cada propriedade preguiçosa, como a
+    # barra lateral do Streamlit faz a cada renderização
+    from config.config import Config
+    
+    recursos = RecursosFrontend(Config())
+    print(f"Cache de resumos: {recursos.cache_resumos}")
+    print(f"Arquivo: {recursos.arquivo}")
+    print(f"Relatórios indexados: {recursos.indice_relatorios.total()}")
+    recursos.encerrar()
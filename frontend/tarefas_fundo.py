@@ -0,0 +1,290 @@
+"""
+Tarefas em segundo plano do frontend Streamlit
+
+A coleta e os resumos rodam num pool de threads do processo, compartilhado por todas
+as sessões. O script do Streamlit só submete a tarefa e, a cada atualização, lê um
+instantâneo do progresso e dos resultados parciais; um rerun ou outra sessão não
+interrompe o trabalho em andamento.
+"""
+
+import os
+import sys
+import uuid
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional
+
+# Adiciona o diretório raiz ao path
+root_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if root_dir not in sys.path:
+    sys.path.insert(0, root_dir)
+
+if TYPE_CHECKING:
+    from modulo_scraper import Publicacao
+
+
+STATUS_ATIVOS = ('pendente', 'executando')
+
+
+class TarefaFundo:
+    """Estado de uma tarefa submetida ao pool (lido pelo Streamlit via instantaneo)"""
+    
+    def __init__(self, tipo: str, descricao: str = "", chave: Optional[str] = None):
+        """
+        Args:
+            tipo: Tipo da tarefa (coleta, resumos)
+            descricao: Texto exibido na interface
+            chave: Identifica tarefas equivalentes (evita duas coletas simultâneas)
+        """
+        self.id = uuid.uuid4().hex[:12]
+        self.tipo = tipo
+        self.descricao = descricao
+        self.chave = chave
+        self.status = 'pendente'
+        self.concluidos = 0
+        self.total: Optional[int] = None
+        self.resultados: List[Dict] = []
+        self.resultado_final: Optional[List[Dict]] = None
+        self.erro: Optional[str] = None
+        self.criada_em = datetime.now()
+        self.iniciada_em: Optional[datetime] = None
+        self.encerrada_em: Optional[datetime] = None
+        self._lock = threading.Lock()
+    
+    @property
+    def ativa(self) -> bool:
+        """Tarefa ainda na fila ou em execução"""
+        return self.status in STATUS_ATIVOS
+    
+    def avancar(self, item: Optional[Dict] = None, concluidos: Optional[int] = None, total: Optional[int] = None):
+        """
+        Registra progresso (chamado pela thread do pool)
+        
+        Args:
+            item: Resultado parcial a exibir
+            concluidos: Itens concluídos até agora (padrão: incrementa 1)
+            total: Total de itens, quando conhecido
+        """
+        with self._lock:
+            if item is not None:
+                self.resultados.append(item)
+            self.concluidos = concluidos if concluidos is not None else self.concluidos + 1
+            if total is not None:
+                self.total = total
+    
+    def instantaneo(self) -> Dict:
+        """
+        Cópia consistente do estado, para exibição
+        
+        Returns:
+            Dicionário com status, progresso (0 a 1 ou None), resultados parciais e final
+        """
+        with self._lock:
+            fim = self.encerrada_em or datetime.now()
+            return {
+                'id': self.id,
+                'tipo': self.tipo,
+                'descricao': self.descricao,
+                'status': self.status,
+                'concluidos': self.concluidos,
+                'total': self.total,
+                'progresso': min(self.concluidos / self.total, 1.0) if self.total else None,
+                'resultados': list(self.resultados),
+                'resultado_final': self.resultado_final,
+                'erro': self.erro,
+                'duracao_s': (fim - self.iniciada_em).total_seconds() if self.iniciada_em else 0.0,
+            }
+
+
+class GerenciadorTarefas:
+    """Pool de threads e registro das tarefas do frontend"""
+    
+    def __init__(self, max_workers: int = 2, retencao_minutos: int = 60):
+        """
+        Inicializa o gerenciador
+        
+        Args:
+            max_workers: Tarefas executadas ao mesmo tempo (as demais aguardam na fila)
+            retencao_minutos: Tempo que uma tarefa encerrada continua consultável
+        """
+        self.executor = ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="frontend-tarefa")
+        self.retencao = timedelta(minutes=retencao_minutos)
+        self.logger = logging.getLogger(__name__)
+        self._tarefas: Dict[str, TarefaFundo] = {}
+        self._lock = threading.Lock()
+    
+    def submeter(
+        self,
+        tipo: str,
+        funcao: Callable[..., List[Dict]],
+        *args,
+        descricao: str = "",
+        chave: Optional[str] = None,
+        **kwargs
+    ) -> str:
+        """
+        Enfileira uma tarefa
+        
+        Args:
+            tipo: Tipo da tarefa
+            funcao: Recebe (tarefa, *args, **kwargs) e devolve o resultado final
+            descricao: Texto exibido na interface
+            chave: Se já houver tarefa ativa com a mesma chave, ela é reaproveitada
+        
+        Returns:
+            ID da tarefa
+        """
+        with self._lock:
+            self._limpar()
+            if chave:
+                for tarefa in self._tarefas.values():
+                    if tarefa.chave == chave and tarefa.ativa:
+                        self.logger.info(f"Tarefa {tarefa.id} ({chave}) já em andamento; reaproveitada")
+                        return tarefa.id
+            
+            tarefa = TarefaFundo(tipo, descricao, chave)
+            self._tarefas[tarefa.id] = tarefa
+        
+        self.executor.submit(self._executar, tarefa, funcao, args, kwargs)
+        self.logger.info(f"Tarefa {tarefa.id} ({tipo}) enfileirada")
+        return tarefa.id
+    
+    def _executar(self, tarefa: TarefaFundo, funcao: Callable[..., List[Dict]], args: tuple, kwargs: dict):
+        """Roda a tarefa na thread do pool e registra o desfecho"""
+        with tarefa._lock:
+            tarefa.status = 'executando'
+            tarefa.iniciada_em = datetime.now()
+        
+        try:
+            resultado = funcao(tarefa, *args, **kwargs)
+            with tarefa._lock:
+                tarefa.resultado_final = resultado
+                tarefa.status = 'concluida'
+                tarefa.encerrada_em = datetime.now()
+            self.logger.info(f"Tarefa {tarefa.id} ({tarefa.tipo}) concluída: {len(resultado or [])} itens")
+        except Exception as e:
+            with tarefa._lock:
+                tarefa.erro = str(e)
+                tarefa.status = 'erro'
+                tarefa.encerrada_em = datetime.now()
+            self.logger.error(f"Tarefa {tarefa.id} ({tarefa.tipo}) falhou: {str(e)}", exc_info=True)
+    
+    def _limpar(self):
+        """Descarta tarefas encerradas há mais que a retenção (chamado com o lock)"""
+        limite = datetime.now() - self.retencao
+        for tarefa_id in [
+            t.id for t in self._tarefas.values()
+            if not t.ativa and t.encerrada_em and t.encerrada_em < limite
+        ]:
+            del self._tarefas[tarefa_id]
+    
+    def obter(self, tarefa_id: Optional[str]) -> Optional[Dict]:
+        """
+        Instantâneo de uma tarefa
+        
+        Args:
+            tarefa_id: ID devolvido por submeter
+        
+        Returns:
+            Estado da tarefa ou None se não existir (ou já tiver sido descartada)
+        """
+        with self._lock:
+            tarefa = self._tarefas.get(tarefa_id) if tarefa_id else None
+        return tarefa.instantaneo() if tarefa else None
+    
+    def listar(self) -> List[Dict]:
+        """
+        Tarefas conhecidas, da mais recente para a mais antiga (sem os resultados)
+        
+        Returns:
+            Lista de instantâneos
+        """
+        with self._lock:
+            self._limpar()
+            tarefas = sorted(self._tarefas.values(), key=lambda t: t.criada_em, reverse=True)
+        resumo = []
+        for tarefa in tarefas:
+            estado = tarefa.instantaneo()
+            estado.pop('resultados')
+            estado.pop('resultado_final')
+            resumo.append(estado)
+        return resumo
+    
+    def encerrar(self, aguardar: bool = False):
+        """Encerra o pool (tarefas em andamento terminam se aguardar=True)"""
+        self.executor.shutdown(wait=aguardar, cancel_futures=True)
+
+
+def tarefa_coleta(tarefa: TarefaFundo, scraper, data_referencia: Optional[str] = None) -> List[Dict]:
+    """
+    Coleta as publicações, publicando cada item assim que seu conteúdo é obtido
+    
+    Args:
+        tarefa: Tarefa em execução
+        scraper: BACENScraper compartilhado (ver frontend.recursos)
+        data_referencia: Dia a coletar (DD/MM/YYYY; padrão: dia anterior)
+    
+    Returns:
+        Publicações coletadas
+    """
+    return scraper.executar_coleta(
+        data_referencia,
+        progresso=lambda item, concluidos, total: tarefa.avancar(item, concluidos, total)
+    )
+
+
+def tarefa_resumos(
+    tarefa: TarefaFundo,
+    itens: List["Publicacao"],
+    recursos,
+    provider_name: str,
+    api_key: Optional[str] = None,
+    max_lines: int = 5
+) -> List["Publicacao"]:
+    """
+    Resume as publicações com o LLM, publicando cada resumo ao ficar pronto
+    
+    Args:
+        tarefa: Tarefa em execução
+        itens: Publicações coletadas (não são alteradas; cada resultado é uma cópia)
+        recursos: RecursosFrontend; o LLMManager compartilhado (resumos já feitos vêm do
+            cache) fica emprestado à tarefa até o fim, para não ser fechado no meio
+        provider_name: Provedor escolhido na interface
+        api_key: Chave da API informada
+        max_lines: Número máximo de linhas do resumo
+    
+    Returns:
+        Publicações com o campo 'resumo'
+    """
+    with recursos.emprestar_llm(provider_name, api_key) as llm_manager:
+        return _resumir(tarefa, itens, llm_manager, max_lines)
+
+
+def _resumir(tarefa: TarefaFundo, itens: List["Publicacao"], llm_manager, max_lines: int) -> List["Publicacao"]:
+    """Resume os itens com um gerenciador já obtido (ver tarefa_resumos)"""
+    logger = logging.getLogger(__name__)
+    tarefa.avancar(concluidos=0, total=len(itens))
+    
+    processadas = []
+    for item in itens:
+        processado = item.copiar()
+        try:
+            if item.conteudo_completo:
+                processado.resumo = llm_manager.summarize(
+                    texto=item.conteudo_completo,
+                    titulo=item.titulo,
+                    link=item.link,
+                    max_lines=max_lines
+                )
+            else:
+                processado.resumo = "Conteúdo não disponível."
+        except Exception as e:
+            logger.error(f"Erro ao processar item {item.titulo}: {str(e)}")
+            processado.resumo = "Erro ao processar conteúdo."
+        
+        processadas.append(processado)
+        tarefa.avancar(processado)
+    
+    return processadas
@@ -6,20 +6,34 @@ Integra todos os módulos em um pipeline completo
 import os
 import sys
 import logging
+import html
+import threading
 from datetime import datetime
 from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional
+
+import pytz
 
 # Adiciona o diretório raiz ao path
 root_dir = os.path.dirname(os.path.abspath(__file__))
 if root_dir not in sys.path:
     sys.path.insert(0, root_dir)
 
-from modulo_scraper import BACENScraper
-from modulo_llm import LLMManager
-from modulo_report import PDFGenerator
-from modulo_email import EmailSender
-from modulo_scheduler import TaskScheduler
+# Apenas módulos leves (biblioteca padrão) no topo: Selenium, reportlab, SDKs de LLM e
+# APScheduler são importados no primeiro uso, para que a CLI e os workers partam rápido
+from modulo_scheduler.registro_execucoes import RegistroExecucoes
+from modulo_scheduler.links_vistos import LinksVistos
+from modulo_scheduler.historico_execucoes import ExecucaoPipeline, HistoricoExecucoes
+from modulo_arquivo import ArquivoPublicacoes
+from modulo_scheduler.trava_execucao import Concessao, ConcessaoPerdida, TravaOcupada, criar_trava
 from config.config import Config
+from config.logging_config import configurar_logging
+
+if TYPE_CHECKING:
+    from modulo_scraper import BACENScraper, Publicacao
+    from modulo_llm import LLMManager
+    from modulo_report import PDFGenerator
+    from modulo_email import EmailSender
 
 
 class SistemaMonitoramentoBACEN:
@@ -35,53 +49,145 @@ class SistemaMonitoramentoBACEN:
         self.config = config or Config()
         self.setup_logging()
         
-        # Inicializa componentes
-        self.scraper = BACENScraper(self.config)
-        self.llm_manager = LLMManager(
-            provider_name=self.config.LLM_PROVIDER,
-            api_key=self.config.get_llm_api_key(),
-            model=getattr(self.config, f"{self.config.LLM_PROVIDER.upper()}_MODEL", None)
-        )
-        self.pdf_generator = PDFGenerator(str(self.config.RELATORIOS_DIR))
-        self.email_sender = EmailSender(self.config)
+        # Scraper, LLM, PDF e email são criados no primeiro uso (ver _componente)
+        self._componentes: Dict[str, object] = {}
+        self._lock_componentes = threading.Lock()
+        self.registro_execucoes = RegistroExecucoes(self.config.AGENDADOR_DB_PATH)
+        self.links_vistos = LinksVistos(self.config.AGENDADOR_DB_PATH)
+        self.historico_execucoes = HistoricoExecucoes(self.config.AGENDADOR_DB_PATH)
+        self.trava = criar_trava(self.config)
+        self.arquivo = ArquivoPublicacoes(self.config.ARQUIVO_DB_PATH) if self.config.ARQUIVO_ENABLED else None
+        self.parquet = None
+        if self.config.PARQUET_ENABLED:
+            try:
+                # pyarrow só é carregado com a exportação habilitada
+                from modulo_arquivo import ExportadorParquet
+                self.parquet = ExportadorParquet(self.config.PARQUET_DIR, self.config.PARQUET_COMPRESSAO)
+            except ImportError as e:
+                self.logger.warning(f"Exportação Parquet desativada: {str(e)}")
         
         self.logger.info("Sistema de Monitoramento BACEN inicializado")
     
-    def setup_logging(self):
-        """Configura o sistema de logging principal"""
-        os.makedirs(self.config.LOGS_DIR, exist_ok=True)
+    def _componente(self, nome: str, criar: Callable[[], object]):
+        """
+        Devolve um componente, criando-o (e importando suas dependências) no primeiro acesso
         
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(self.config.LOGS_DIR / 'sistema_monitoramento.log'),
-                logging.StreamHandler()
-            ]
-        )
+        Args:
+            nome: Chave do componente
+            criar: Função que importa e instancia o componente
+        """
+        componente = self._componentes.get(nome)
+        if componente is None:
+            with self._lock_componentes:
+                componente = self._componentes.get(nome)
+                if componente is None:
+                    componente = self._componentes[nome] = criar()
+        return componente
+    
+    @property
+    def scraper(self) -> "BACENScraper":
+        """Scraper da coleta diária"""
+        def criar():
+            from modulo_scraper import BACENScraper
+            return BACENScraper(self.config)
+        return self._componente('scraper', criar)
+    
+    @property
+    def llm_manager(self) -> "LLMManager":
+        """Gerenciador do provedor de LLM configurado"""
+        def criar():
+            from modulo_llm import LLMManager, CacheResumos
+            cache = None
+            if self.config.LLM_CACHE_ENABLED:
+                cache = CacheResumos(self.config.LLM_CACHE_PATH, self.config.LLM_CACHE_DIAS)
+                cache.limpar_vencidos()
+            kwargs = {}
+            if self.config.LLM_PROVIDER == 'ollama':
+                kwargs['base_url'] = self.config.OLLAMA_BASE_URL
+            return LLMManager(
+                provider_name=self.config.LLM_PROVIDER,
+                api_key=self.config.get_llm_api_key(),
+                cache=cache,
+                model=getattr(self.config, f"{self.config.LLM_PROVIDER.upper()}_MODEL", None),
+                **kwargs
+            )
+        return self._componente('llm_manager', criar)
+    
+    @property
+    def pdf_generator(self) -> "PDFGenerator":
+        """Gerador do relatório em PDF"""
+        def criar():
+            from modulo_report import PDFGenerator
+            return PDFGenerator(str(self.config.RELATORIOS_DIR))
+        return self._componente('pdf_generator', criar)
+    
+    @property
+    def email_sender(self) -> "EmailSender":
+        """Envio de relatórios e notificações"""
+        def criar():
+            from modulo_email import EmailSender
+            return EmailSender(self.config)
+        return self._componente('email_sender', criar)
+    
+    def setup_logging(self):
+        """Configura o sistema de logging principal (fila única; ver config.logging_config)"""
+        configurar_logging(self.config)
         self.logger = logging.getLogger(__name__)
     
-    def executar_processo_completo(self):
+    @staticmethod
+    def _chave_trava(data_referencia: str) -> str:
+        """Chave da trava do relatório de um dia"""
+        return f"relatorio_{datetime.strptime(data_referencia, '%d/%m/%Y').date().isoformat()}"
+    
+    def executar_processo_completo(
+        self,
+        data_referencia: Optional[str] = None,
+        concessao: Optional[Concessao] = None
+    ) -> int:
         """
         Executa o processo completo de monitoramento:
         1. Coleta de dados
         2. Processamento com LLM
         3. Geração de PDF
         4. Envio de email
+        
+        Args:
+            data_referencia: Dia do relatório (DD/MM/YYYY; padrão: dia anterior)
+            concessao: Concessão da trava do dia já obtida pelo chamador; se omitida, é adquirida aqui
+        
+        Returns:
+            Número de publicações incluídas no relatório
+        
+        Raises:
+            TravaOcupada: Se outra instância está produzindo (ou já produziu) o relatório do dia
+            ConcessaoPerdida: Se a concessão foi perdida antes de uma gravação ou do envio
         """
+        if concessao is None:
+            chave = self._chave_trava(data_referencia or self.scraper.get_yesterday_date())
+            with self.trava.manter(chave) as concessao:
+                return self.executar_processo_completo(data_referencia, concessao)
+        
+        execucao = ExecucaoPipeline(data_referencia)
+        self.llm_manager.reiniciar_uso()
+        
         try:
             self.logger.info("=" * 60)
             self.logger.info("INICIANDO PROCESSO DE MONITORAMENTO BACEN")
+            if data_referencia:
+                self.logger.info(f"Data de referência: {data_referencia}")
             self.logger.info("=" * 60)
             
             # Etapa 1: Coleta de dados
             self.logger.info("ETAPA 1: Coletando dados do BACEN...")
-            dados_coletados = self.scraper.executar_coleta()
+            with execucao.etapa('coleta'):
+                dados_coletados = self.scraper.executar_coleta(data_referencia)
+            execucao.itens_coletados = len(dados_coletados)
             
             if not dados_coletados:
                 self.logger.warning("Nenhum dado foi coletado. Enviando notificação...")
                 self.enviar_notificacao_sem_dados()
-                return
+                execucao.status = 'sem_dados'
+                return 0
             
             self.logger.info(f"Coleta concluída: {len(dados_coletados)} itens encontrados")
             
@@ -89,49 +195,69 @@ class SistemaMonitoramentoBACEN:
             self.logger.info("ETAPA 2: Processando com LLM...")
             informacoes_processadas = []
             
-            for idx, item in enumerate(dados_coletados):
-                try:
-                    self.logger.info(f"Processando {idx+1}/{len(dados_coletados)}: {item['titulo'][:50]}...")
-                    
-                    texto = item.get('conteudo_completo', '')
-                    titulo = item.get('titulo', '')
-                    link = item.get('link', '')
-                    
-                    if texto:
-                        resumo = self.llm_manager.summarize(
-                            texto=texto,
-                            titulo=titulo,
-                            link=link,
-                            max_lines=5
-                        )
-                        item['resumo'] = resumo
-                    else:
-                        item['resumo'] = "Conteúdo não disponível."
-                    
-                    informacoes_processadas.append(item)
-                    
-                except Exception as e:
-                    self.logger.error(f"Erro ao processar item {item.get('titulo', 'desconhecido')}: {str(e)}")
-                    # Adiciona item mesmo com erro
-                    item['resumo'] = "Erro ao processar conteúdo."
-                    informacoes_processadas.append(item)
+            with execucao.etapa('resumos'):
+                for idx, item in enumerate(dados_coletados):
+                    try:
+                        self.logger.info(f"Processando {idx+1}/{len(dados_coletados)}: {item.titulo[:50]}...")
+                        
+                        if item.conteudo_completo:
+                            item.resumo = self.llm_manager.summarize(
+                                texto=item.conteudo_completo,
+                                titulo=item.titulo,
+                                link=item.link,
+                                max_lines=5
+                            )
+                        else:
+                            item.resumo = "Conteúdo não disponível."
+                        
+                        informacoes_processadas.append(item)
+                        
+                    except Exception as e:
+                        self.logger.error(f"Erro ao processar item {item.titulo}: {str(e)}")
+                        # Adiciona item mesmo com erro
+                        item.resumo = "Erro ao processar conteúdo."
+                        informacoes_processadas.append(item)
             
+            execucao.itens_processados = len(informacoes_processadas)
             self.logger.info(f"Processamento concluído: {len(informacoes_processadas)} itens processados")
             
+            # Fencing: daqui em diante cada gravação é visível (PDF, índice, arquivo, Parquet, email);
+            # se a concessão expirou durante a coleta, outra réplica pode ter assumido o dia
+            self.trava.validar(concessao)
+            
             # Etapa 3: Geração de PDF
             self.logger.info("ETAPA 3: Gerando relatório PDF...")
-            try:
-                caminho_pdf = self.pdf_generator.generate_pdf(informacoes_processadas)
-                self.logger.info(f"PDF gerado: {caminho_pdf}")
-            except Exception as e:
-                self.logger.error(f"Erro ao gerar PDF: {str(e)}")
-                caminho_pdf = None
+            with execucao.etapa('pdf'):
+                try:
+                    caminho_pdf = self.pdf_generator.generate_pdf(informacoes_processadas, data_referencia)
+                    self.logger.info(f"PDF gerado: {caminho_pdf}")
+                except Exception as e:
+                    self.logger.error(f"Erro ao gerar PDF: {str(e)}")
+                    caminho_pdf = None
+            execucao.caminho_pdf = caminho_pdf
+            
+            # Arquivo pesquisável (aba Histórico do Streamlit)
+            if self.arquivo:
+                self.trava.validar(concessao)
+                try:
+                    self.arquivo.arquivar(informacoes_processadas, caminho_pdf)
+                except Exception as e:
+                    self.logger.warning(f"Erro ao arquivar publicações: {str(e)}")
+            
+            # Dataset Parquet para análise (só acréscimos)
+            if self.parquet:
+                self.trava.validar(concessao)
+                try:
+                    self.parquet.exportar(informacoes_processadas, caminho_pdf)
+                except Exception as e:
+                    self.logger.warning(f"Erro ao exportar publicações em Parquet: {str(e)}")
             
             # Etapa 4: Envio de email
             self.logger.info("ETAPA 4: Enviando relatório por email...")
-            try:
-                assunto = f"Relatório BACEN - {datetime.now().strftime('%d/%m/%Y')}"
-                corpo_html = self.email_sender.criar_corpo_email_html(informacoes_processadas)
+            self.trava.validar(concessao)
+            with execucao.etapa('email'):
+                assunto = f"Relatório BACEN - {data_referencia or datetime.now().strftime('%d/%m/%Y')}"
+                corpo_html = self.email_sender.criar_corpo_email_html(informacoes_processadas, data_referencia)
                 
                 resultado = self.email_sender.enviar_email_com_anexo(
                     assunto=assunto,
@@ -139,21 +265,38 @@ class SistemaMonitoramentoBACEN:
                     caminho_pdf=caminho_pdf
                 )
                 
-                if resultado['sucesso']:
-                    self.logger.info(f"Email enviado para {resultado['total_enviados']} destinatário(s)")
-                else:
-                    self.logger.error(f"Falha no envio do email: {resultado.get('erro', 'Erro desconhecido')}")
-                    
-            except Exception as e:
-                self.logger.error(f"Erro ao enviar email: {str(e)}")
+                # Sem email o dia não está concluído: a falha sobe, o dia fica como 'erro'
+                # em execucoes_diarias e a recuperação de dias atrasados tenta de novo
+                if not resultado['sucesso']:
+                    raise RuntimeError(f"Falha no envio do email: {resultado.get('erro', 'Erro desconhecido')}")
+                self.logger.info(f"Email enviado para {resultado['total_enviados']} destinatário(s)")
             
             self.logger.info("PROCESSO CONCLUÍDO COM SUCESSO!")
             self.logger.info("=" * 60)
+            execucao.status = 'sucesso'
+            return len(informacoes_processadas)
+        
+        except ConcessaoPerdida as e:
+            # Outra réplica assumiu o dia: não é falha do sistema, não há o que notificar
+            self.logger.warning(f"{str(e)}; relatório interrompido nesta instância")
+            execucao.status = 'outra_instancia'
+            execucao.erro = str(e)
+            raise
             
         except Exception as e:
             self.logger.error(f"Erro durante o processo de monitoramento: {str(e)}")
+            execucao.status = 'erro'
+            execucao.erro = str(e)
             self.enviar_notificacao_erro(str(e))
             raise
+        
+        finally:
+            execucao.requisicoes = self.scraper.limitador.estatisticas['requisicoes']
+            execucao.tokens = self.llm_manager.reiniciar_uso()
+            try:
+                self.historico_execucoes.registrar(execucao)
+            except Exception as e:
+                self.logger.warning(f"Erro ao gravar histórico da execução: {str(e)}")
     
     def enviar_notificacao_sem_dados(self):
         """Envia notificação quando não há dados"""
@@ -211,25 +354,180 @@ class SistemaMonitoramentoBACEN:
         except Exception as e:
             self.logger.error(f"Erro ao enviar notificação de erro: {str(e)}")
     
+    def executar_execucao_diaria(self, data_referencia: Optional[str] = None):
+        """
+        Produz o relatório de um dia uma única vez, registrando o resultado em execucoes_diarias
+        
+        Args:
+            data_referencia: Dia a reprocessar (DD/MM/YYYY); None na execução agendada normal
+        """
+        dia_str = data_referencia or self.scraper.get_yesterday_date()
+        dia = datetime.strptime(dia_str, "%d/%m/%Y").date()
+        
+        # Tarefa diária vencida e recuperação podem disparar juntas na inicialização;
+        # entre réplicas do agendador, a trava do dia faz o mesmo papel
+        with _lock_execucao:
+            if self.registro_execucoes.concluida(dia):
+                self.logger.info(f"Relatório de {dia_str} já foi produzido; execução ignorada")
+                return
+            
+            try:
+                with self.trava.manter(self._chave_trava(dia_str)) as concessao:
+                    self.registro_execucoes.iniciar(dia)
+                    try:
+                        itens = self.executar_processo_completo(data_referencia, concessao)
+                    except ConcessaoPerdida as e:
+                        self.registro_execucoes.concluir(dia, 'outra_instancia', erro=str(e))
+                        return
+                    except Exception as e:
+                        self.registro_execucoes.concluir(dia, 'erro', erro=str(e))
+                        raise
+                    self.registro_execucoes.concluir(dia, 'sucesso' if itens else 'sem_dados', itens)
+                    concessao.concluida = True
+            except TravaOcupada as e:
+                self.logger.info(f"{str(e)}; relatório de {dia_str} ignorado nesta instância")
+                if e.concluida:
+                    self.registro_execucoes.iniciar(dia)
+                    self.registro_execucoes.concluir(dia, 'outra_instancia')
+    
+    @property
+    def scraper_polling(self) -> "BACENScraper":
+        """Scraper das verificações de novidades (mesmo limitador da coleta diária: taxa e orçamento)"""
+        # Fora de criar(): _componente não é reentrante
+        limitador = self.scraper.limitador
+        
+        def criar():
+            from modulo_scraper import BACENScraper
+            return BACENScraper(self.config, limitador=limitador)
+        return self._componente('scraper_polling', criar)
+    
+    def verificar_novidades(self, chave_categoria: str) -> List["Publicacao"]:
+        """
+        Lista uma categoria (sem conteúdo nem LLM) e alerta sobre links ainda não vistos
+        
+        Args:
+            chave_categoria: Chave da categoria no registro
+        
+        Returns:
+            Publicações novas
+        """
+        # O orçamento é o da coleta diária (reiniciado por ela); a verificação não o zera
+        hoje = datetime.now(pytz.timezone(self.config.FUSO_HORARIO)).strftime("%d/%m/%Y")
+        itens = self.scraper_polling.executar_listagem([chave_categoria], data_referencia=hoje)
+        if itens is None:
+            # Sem listagem confiável não há linha de base nem novidades
+            self.logger.warning(f"Listagem de {chave_categoria} falhou; verificação ignorada")
+            return []
+        novos = self.links_vistos.registrar(chave_categoria, itens)
+        
+        if novos:
+            self.logger.info(f"{len(novos)} nova(s) publicação(ões) em {chave_categoria}")
+            if self.config.ALERTAS_EMAIL_ENABLED:
+                self.enviar_alerta_novidades(novos)
+        return novos
+    
+    def enviar_alerta_novidades(self, itens: List["Publicacao"]):
+        """
+        Envia um alerta curto com as publicações recém-detectadas
+        
+        Args:
+            itens: Publicações novas
+        """
+        try:
+            linhas = "".join(
+                f"<li><strong>{html.escape(item.tipo or '')}</strong>: "
+                f"<a href=\"{html.escape(item.link)}\">{html.escape(item.titulo)}</a></li>"
+                for item in itens
+            )
+            resultado = self.email_sender.enviar_email_com_anexo(
+                assunto=f"Alerta BACEN - {len(itens)} nova(s) publicação(ões)",
+                corpo_html=(
+                    f"<p>Novas publicações detectadas em {datetime.now().strftime('%d/%m/%Y às %H:%M')}:</p>"
+                    f"<ul>{linhas}</ul><p>O resumo completo segue no relatório diário.</p>"
+                )
+            )
+            
+            if resultado['sucesso']:
+                self.logger.info("Alerta de novidades enviado")
+            else:
+                self.logger.warning("Falha ao enviar alerta de novidades")
+                
+        except Exception as e:
+            self.logger.error(f"Erro ao enviar alerta de novidades: {str(e)}")
+    
     def executar_teste(self):
         """Executa um teste do sistema"""
         self.logger.info("Executando teste do sistema...")
-        self.executar_processo_completo()
+        try:
+            self.executar_processo_completo()
+        except (TravaOcupada, ConcessaoPerdida) as e:
+            self.logger.warning(str(e))
+    
+    def metricas_coleta(self) -> Dict[str, float]:
+        """Métricas da última coleta para o endpoint /metrics"""
+        estatisticas = self.scraper.limitador.estatisticas
+        metricas = {
+            'bacen_coleta_requisicoes': estatisticas['requisicoes'],
+            'bacen_coleta_limitacoes': estatisticas['limitacoes'],
+            'bacen_coleta_espera_segundos': round(estatisticas['espera_total'], 3),
+        }
+        if self.scraper.http_cache:
+            for chave, valor in self.scraper.http_cache.estatisticas.items():
+                metricas[f'bacen_cache_http_{chave}'] = valor
+        return metricas
     
     def executar_com_agendamento(self):
         """Executa o sistema com agendamento automático"""
+        global _sistema
+        servidor_controle = None
+        
         try:
             self.logger.info("Iniciando sistema de agendamento...")
             
-            scheduler = TaskScheduler(self.config)
+            # As tarefas persistidas apontam para funções do módulo, que usam esta instância
+            _sistema = self
+            
+            # Com a API de controle, o agendador roda em segundo plano e a thread principal só aguarda a parada
+            from modulo_scheduler import TaskScheduler
+            scheduler = TaskScheduler(self.config, em_segundo_plano=self.config.CONTROLE_API_ENABLED)
             scheduler.agendar_tarefa_diaria(
-                self.executar_processo_completo,
+                tarefa_diaria_bacen,
                 hora=self.config.HORA_EXECUCAO
             )
             
+            # Reprocessa os dias perdidos enquanto o sistema esteve parado
+            pendentes = self.registro_execucoes.datas_pendentes(
+                scheduler.ultima_referencia_devida(),
+                self.config.RECUPERACAO_MAX_DIAS
+            )
+            scheduler.agendar_recuperacao(recuperar_execucoes, pendentes)
+            
+            # Verificações leves de novidades entre os relatórios diários
+            scheduler.agendar_polling_categorias(
+                tarefa_polling_categoria,
+                self.config.POLLING_CATEGORIAS,
+                self.config.POLLING_INTERVALO_MINUTOS
+            )
+            
+            # Abre o navegador antes da primeira execução para evitar a partida a frio
+            if self.config.WEBDRIVER_POOL_ENABLED and self.config.SCRAPER_BACKEND == "selenium":
+                from modulo_scraper.driver_pool import obter_pool
+                obter_pool(self.config).aquecer()
+            
             # Envia notificação de inicialização
             self.enviar_notificacao_inicializacao()
             
+            if self.config.CONTROLE_API_ENABLED:
+                from modulo_scheduler.api_controle import ServidorControle
+                servidor_controle = ServidorControle(
+                    scheduler,
+                    host=self.config.CONTROLE_API_HOST,
+                    porta=self.config.CONTROLE_API_PORTA,
+                    token=self.config.CONTROLE_API_TOKEN,
+                    registro_execucoes=self.registro_execucoes,
+                    fontes_metricas=[self.metricas_coleta]
+                ).iniciar()
+            
             # Inicia o agendador
             scheduler.executar()
             
@@ -238,6 +536,9 @@ class SistemaMonitoramentoBACEN:
         except Exception as e:
             self.logger.error(f"Erro no agendador: {str(e)}")
             raise
+        finally:
+            if servidor_controle:
+                servidor_controle.parar()
     
     def enviar_notificacao_inicializacao(self):
         """Envia notificação de inicialização"""
@@ -267,6 +568,99 @@ class SistemaMonitoramentoBACEN:
             self.logger.error(f"Erro ao enviar notificação de inicialização: {str(e)}")
 
 
+_sistema: Optional[SistemaMonitoramentoBACEN] = None
+_lock_execucao = threading.Lock()
+
+
+def obter_sistema() -> SistemaMonitoramentoBACEN:
+    """Retorna a instância do sistema usada pelas tarefas agendadas"""
+    global _sistema
+    if _sistema is None:
+        _sistema = SistemaMonitoramentoBACEN()
+    return _sistema
+
+
+def tarefa_diaria_bacen():
+    """Tarefa diária (referenciada pelo nome no job store persistente)"""
+    obter_sistema().executar_execucao_diaria()
+
+
+def tarefa_polling_categoria(chave_categoria: str):
+    """Verificação periódica de novidades de uma categoria"""
+    obter_sistema().verificar_novidades(chave_categoria)
+
+
+def recuperar_execucoes(datas: List[str]):
+    """
+    Reprocessa, em ordem, os dias sem relatório
+    
+    Args:
+        datas: Datas de referência (DD/MM/YYYY)
+    """
+    sistema = obter_sistema()
+    for data_referencia in datas:
+        try:
+            sistema.executar_execucao_diaria(data_referencia)
+        except Exception as e:
+            sistema.logger.error(f"Erro ao recuperar relatório de {data_referencia}: {str(e)}")
+
+
+def exibir_historico(config: Config, limite: int):
+    """
+    Imprime as últimas execuções e os percentis de duração
+    
+    Args:
+        config: Objeto de configuração
+        limite: Número de execuções consideradas
+    """
+    historico = HistoricoExecucoes(config.AGENDADOR_DB_PATH)
+    execucoes = historico.ultimas(limite)
+    if not execucoes:
+        print("Nenhuma execução registrada.")
+        return
+    
+    def segundos(valor: Optional[float]) -> str:
+        return f"{valor:.1f}s" if valor is not None else "-"
+    
+    print(f"Últimas {len(execucoes)} execuções:\n")
+    print(f"{'ID':>5}  {'Referência':<10}  {'Início':<19}  {'Status':<10}  {'Itens':>5}  "
+          f"{'Duração':>8}  {'Tokens':>8}  Etapas")
+    for e in execucoes:
+        etapas = ' '.join(f"{nome}={segundos(valor)}" for nome, valor in e['etapas'].items())
+        print(f"{e['id']:>5}  {e['data_referencia'] or '-':<10}  {e['inicio']:<19}  {e['status']:<10}  "
+              f"{e['itens_processados']:>5}  {segundos(e['duracao_s']):>8}  "
+              f"{e['tokens_entrada'] + e['tokens_saida']:>8}  {etapas}")
+        if e['erro']:
+            print(f"{'':>7}erro: {e['erro'][:100]}")
+    
+    resumo = historico.resumo(limite)
+    print(f"\nSucesso: {resumo['taxa_sucesso']:.0%} ({resumo['falhas']} falha(s))")
+    if resumo['itens_por_minuto'] is not None:
+        print(f"Vazão: {resumo['itens_por_minuto']:.1f} itens/min")
+    print(f"Tokens: {resumo['tokens_entrada']} entrada, {resumo['tokens_saida']} saída")
+    print(f"\n{'':<10}{'p50':>9}{'p90':>9}{'p95':>9}{'max':>9}")
+    for nome, p in [('total', resumo['duracao'])] + list(resumo['etapas'].items()):
+        print(f"{nome:<10}" + ''.join(f"{segundos(p[chave]):>9}" for chave in ('p50', 'p90', 'p95', 'max')))
+
+
+def exportar_parquet(config: Config):
+    """
+    Exporta todo o arquivo de publicações para o dataset Parquet (carga inicial)
+    
+    Cada chamada acrescenta uma nova cópia das publicações; a mais recente de cada link
+    é a de maior exportado_em.
+    
+    Args:
+        config: Objeto de configuração
+    """
+    from modulo_arquivo import ExportadorParquet
+    
+    arquivo = ArquivoPublicacoes(config.ARQUIVO_DB_PATH)
+    exportador = ExportadorParquet(config.PARQUET_DIR, config.PARQUET_COMPRESSAO)
+    total = sum(exportador.exportar(lote) for lote in arquivo.lotes())
+    print(f"{total} publicação(ões) exportada(s) para {config.PARQUET_DIR}")
+
+
 def main():
     """Função principal"""
     import argparse
@@ -287,9 +681,30 @@ def main():
         action='store_true',
         help='Inicia a interface web Streamlit'
     )
+    parser.add_argument(
+        '--historico',
+        nargs='?',
+        const=20,
+        type=int,
+        metavar='N',
+        help='Mostra as últimas N execuções (padrão: 20) com percentis de duração'
+    )
+    parser.add_argument(
+        '--exportar-parquet',
+        action='store_true',
+        help='Exporta todo o arquivo de publicações para o dataset Parquet'
+    )
     
     args = parser.parse_args()
     
+    # Consulta apenas o banco local; não depende das demais configurações
+    if args.historico:
+        exibir_historico(Config(), args.historico)
+        return
+    if args.exportar_parquet:
+        exportar_parquet(Config())
+        return
+    
     # Valida configurações
     config = Config()
     errors = config.validate()
@@ -301,12 +716,10 @@ def main():
         print("\nConfigure o arquivo .env antes de continuar.")
         return
     
-    sistema = SistemaMonitoramentoBACEN(config)
-    
     if args.teste:
-        sistema.executar_teste()
+        SistemaMonitoramentoBACEN(config).executar_teste()
     elif args.agendador:
-        sistema.executar_com_agendamento()
+        SistemaMonitoramentoBACEN(config).executar_com_agendamento()
     elif args.streamlit:
         print("Iniciando interface Streamlit...")
         os.system("streamlit run frontend/app.py")
@@ -316,6 +729,8 @@ def main():
         print("  python main.py --teste      : Executa um teste do sistema")
         print("  python main.py --agendador  : Inicia o agendador para execução diária")
         print("  python main.py --streamlit  : Inicia a interface web Streamlit")
+        print("  python main.py --historico [N] : Mostra as últimas execuções e percentis de duração")
+        print("  python main.py --exportar-parquet : Exporta o arquivo de publicações em Parquet")
 
 
 if __name__ == "__main__":
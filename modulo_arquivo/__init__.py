@@ -0,0 +1,21 @@
+"""
+Arquivo __init__.py para o módulo arquivo
+
+ExportadorParquet é importado no primeiro acesso, para que o arquivo SQLite não
+carregue o pyarrow.
+"""
+
+from typing import TYPE_CHECKING
+
+from config.importacao import carregar_preguicoso
+
+from .arquivo_publicacoes import ArquivoPublicacoes
+
+if TYPE_CHECKING:
+    from .exportador_parquet import ExportadorParquet
+
+_MODULOS = {'ExportadorParquet': '.exportador_parquet'}
+
+__all__ = ['ArquivoPublicacoes', 'ExportadorParquet']
+
+__getattr__, __dir__ = carregar_preguicoso(__name__, _MODULOS)
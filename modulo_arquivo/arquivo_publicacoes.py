@@ -0,0 +1,279 @@
+"""
+Arquivo das publicações coletadas
+Guarda cada publicação (com resumo, conteúdo e o PDF em que saiu) em SQLite, com índice
+de texto completo (FTS5), para navegar pelo histórico com paginação feita no banco
+"""
+
+import sqlite3
+import logging
+import threading
+from datetime import date, datetime
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence
+
+
+def _fts5_disponivel() -> bool:
+    """Verifica se o SQLite do Python foi compilado com FTS5"""
+    try:
+        sqlite3.connect(':memory:').execute("CREATE VIRTUAL TABLE teste USING fts5(texto)")
+        return True
+    except sqlite3.OperationalError:
+        return False
+
+
+FTS5_DISPONIVEL = _fts5_disponivel()
+
+# Colunas devolvidas nas listagens (o conteúdo completo só vem em obter())
+COLUNAS_LISTAGEM = ('id', 'titulo', 'tipo', 'categoria', 'data', 'link', 'resumo', 'caminho_pdf', 'arquivado_em')
+
+
+def _data_iso(data: Optional[str]) -> Optional[str]:
+    """Converte DD/MM/YYYY em YYYY-MM-DD (ordenável), ou None se inválida"""
+    try:
+        return datetime.strptime(data or '', "%d/%m/%Y").strftime("%Y-%m-%d")
+    except ValueError:
+        return None
+
+
+def _consulta_fts(texto: str) -> str:
+    """
+    Monta a consulta FTS5 a partir do texto digitado
+    
+    Cada palavra vira um termo entre aspas (sem operadores do usuário) e a última
+    aceita prefixo, para a busca funcionar enquanto se digita.
+    """
+    termos = ['"' + termo.replace('"', '""') + '"' for termo in texto.split()]
+    if termos:
+        termos[-1] += '*'
+    return ' '.join(termos)
+
+
+class ArquivoPublicacoes:
+    """Tabela publicacoes em SQLite, com índice FTS5 sobre título, resumo e conteúdo"""
+    
+    def __init__(self, caminho_db):
+        """
+        Inicializa o arquivo
+        
+        Args:
+            caminho_db: Caminho do banco SQLite
+        """
+        self.caminho_db = Path(caminho_db)
+        self.caminho_db.parent.mkdir(parents=True, exist_ok=True)
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+        self._criar_tabelas()
+    
+    def _conectar(self) -> sqlite3.Connection:
+        """Abre uma conexão com o banco"""
+        conn = sqlite3.connect(str(self.caminho_db), timeout=30)
+        conn.row_factory = sqlite3.Row
+        return conn
+    
+    def _criar_tabelas(self):
+        """Cria tabela, índices e, se houver FTS5, o índice de texto mantido por gatilhos"""
+        with self._lock, self._conectar() as conn:
+            # WAL: o Streamlit consulta enquanto o agendador arquiva
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS publicacoes (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    link TEXT NOT NULL UNIQUE,
+                    titulo TEXT NOT NULL,
+                    tipo TEXT,
+                    categoria TEXT,
+                    data TEXT,
+                    data_iso TEXT,
+                    resumo TEXT,
+                    conteudo TEXT,
+                    caminho_pdf TEXT,
+                    arquivado_em TEXT NOT NULL
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_publicacoes_data ON publicacoes (data_iso DESC, id DESC)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_publicacoes_tipo ON publicacoes (tipo, data_iso DESC)")
+            
+            if not FTS5_DISPONIVEL:
+                self.logger.warning("SQLite sem FTS5: a busca no arquivo usará LIKE")
+                return
+            
+            conn.execute("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS publicacoes_fts USING fts5(
+                    titulo, resumo, conteudo,
+                    content='publicacoes', content_rowid='id',
+                    tokenize='unicode61 remove_diacritics 2'
+                )
+            """)
+            conn.executescript("""
+                CREATE TRIGGER IF NOT EXISTS publicacoes_ai AFTER INSERT ON publicacoes BEGIN
+                    INSERT INTO publicacoes_fts (rowid, titulo, resumo, conteudo)
+                    VALUES (new.id, new.titulo, new.resumo, new.conteudo);
+                END;
+                CREATE TRIGGER IF NOT EXISTS publicacoes_ad AFTER DELETE ON publicacoes BEGIN
+                    INSERT INTO publicacoes_fts (publicacoes_fts, rowid, titulo, resumo, conteudo)
+                    VALUES ('delete', old.id, old.titulo, old.resumo, old.conteudo);
+                END;
+                CREATE TRIGGER IF NOT EXISTS publicacoes_au AFTER UPDATE ON publicacoes BEGIN
+                    INSERT INTO publicacoes_fts (publicacoes_fts, rowid, titulo, resumo, conteudo)
+                    VALUES ('delete', old.id, old.titulo, old.resumo, old.conteudo);
+                    INSERT INTO publicacoes_fts (rowid, titulo, resumo, conteudo)
+                    VALUES (new.id, new.titulo, new.resumo, new.conteudo);
+                END;
+            """)
+    
+    def arquivar(self, itens: List[Dict], caminho_pdf: Optional[str] = None) -> int:
+        """
+        Grava as publicações de um relatório (a mesma publicação, pelo link, é atualizada)
+        
+        Args:
+            itens: Publicações processadas (titulo, link, tipo, data, resumo, conteudo_completo)
+            caminho_pdf: PDF em que as publicações saíram
+        
+        Returns:
+            Número de publicações gravadas
+        """
+        agora = datetime.now().isoformat(timespec='seconds')
+        linhas = [
+            (
+                item['link'], item.get('titulo') or item['link'], item.get('tipo'), item.get('categoria'),
+                item.get('data'), _data_iso(item.get('data')), item.get('resumo'),
+                item.get('conteudo_completo'), caminho_pdf, agora
+            )
+            for item in itens if item.get('link')
+        ]
+        
+        with self._lock, self._conectar() as conn:
+            conn.executemany("""
+                INSERT INTO publicacoes (
+                    link, titulo, tipo, categoria, data, data_iso, resumo, conteudo, caminho_pdf, arquivado_em
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (link) DO UPDATE SET
+                    titulo = excluded.titulo,
+                    tipo = excluded.tipo,
+                    categoria = excluded.categoria,
+                    data = excluded.data,
+                    data_iso = excluded.data_iso,
+                    resumo = COALESCE(excluded.resumo, publicacoes.resumo),
+                    conteudo = COALESCE(excluded.conteudo, publicacoes.conteudo),
+                    caminho_pdf = COALESCE(excluded.caminho_pdf, publicacoes.caminho_pdf),
+                    arquivado_em = excluded.arquivado_em
+            """, linhas)
+        
+        self.logger.info(f"{len(linhas)} publicação(ões) arquivada(s)")
+        return len(linhas)
+    
+    def buscar(
+        self,
+        texto: str = "",
+        tipos: Optional[Sequence[str]] = None,
+        data_inicio: Optional[date] = None,
+        data_fim: Optional[date] = None,
+        pagina: int = 1,
+        por_pagina: int = 50
+    ) -> Dict:
+        """
+        Busca paginada, da publicação mais recente para a mais antiga
+        
+        Args:
+            texto: Palavras procuradas no título, resumo e conteúdo (vazio = todas)
+            tipos: Tipos aceitos (vazio = todos)
+            data_inicio: Primeiro dia (inclusive)
+            data_fim: Último dia (inclusive)
+            pagina: Página desejada (a partir de 1)
+            por_pagina: Publicações por página
+        
+        Returns:
+            Dicionário com 'itens' (sem o conteúdo completo; com 'trecho' quando há
+            busca por texto), 'total', 'pagina' e 'paginas'
+        """
+        condicoes, parametros = [], []
+        colunas = ', '.join(f"p.{coluna}" for coluna in COLUNAS_LISTAGEM)
+        origem = "publicacoes p"
+        trecho = "NULL"
+        
+        if texto.strip():
+            if FTS5_DISPONIVEL:
+                origem = "publicacoes_fts JOIN publicacoes p ON p.id = publicacoes_fts.rowid"
+                condicoes.append("publicacoes_fts MATCH ?")
+                parametros.append(_consulta_fts(texto))
+                trecho = "snippet(publicacoes_fts, -1, '**', '**', '…', 24)"
+            else:
+                condicoes.append("(p.titulo LIKE ? OR p.resumo LIKE ? OR p.conteudo LIKE ?)")
+                parametros.extend([f"%{texto.strip()}%"] * 3)
+        if tipos:
+            condicoes.append(f"p.tipo IN ({', '.join('?' * len(tipos))})")
+            parametros.extend(tipos)
+        if data_inicio:
+            condicoes.append("p.data_iso >= ?")
+            parametros.append(data_inicio.isoformat())
+        if data_fim:
+            condicoes.append("p.data_iso <= ?")
+            parametros.append(data_fim.isoformat())
+        
+        where = f"WHERE {' AND '.join(condicoes)}" if condicoes else ""
+        por_pagina = max(1, por_pagina)
+        
+        with self._conectar() as conn:
+            total = conn.execute(f"SELECT COUNT(*) FROM {origem} {where}", parametros).fetchone()[0]
+            paginas = max(1, -(-total // por_pagina))
+            pagina = min(max(1, pagina), paginas)
+            linhas = conn.execute(
+                f"SELECT {colunas}, {trecho} AS trecho FROM {origem} {where} "
+                f"ORDER BY p.data_iso DESC, p.id DESC LIMIT ? OFFSET ?",
+                parametros + [por_pagina, (pagina - 1) * por_pagina]
+            ).fetchall()
+        
+        return {
+            'itens': [dict(linha) for linha in linhas],
+            'total': total,
+            'pagina': pagina,
+            'paginas': paginas
+        }
+    
+    def obter(self, publicacao_id: int) -> Optional[Dict]:
+        """
+        Publicação completa, com o conteúdo
+        
+        Args:
+            publicacao_id: ID da publicação
+        
+        Returns:
+            Dicionário da publicação ou None se não existir
+        """
+        with self._conectar() as conn:
+            linha = conn.execute("SELECT * FROM publicacoes WHERE id = ?", (publicacao_id,)).fetchone()
+        return dict(linha) if linha else None
+    
+    def lotes(self, tamanho: int = 500) -> Iterator[List[Dict]]:
+        """
+        Percorre todas as publicações, com o conteúdo, em lotes (exportação)
+        
+        Args:
+            tamanho: Publicações por lote
+        
+        Returns:
+            Iterador de listas de publicações, em ordem de id
+        """
+        ultimo_id = 0
+        while True:
+            with self._conectar() as conn:
+                linhas = conn.execute(
+                    "SELECT * FROM publicacoes WHERE id > ? ORDER BY id LIMIT ?", (ultimo_id, tamanho)
+                ).fetchall()
+            if not linhas:
+                return
+            ultimo_id = linhas[-1]['id']
+            yield [dict(linha) for linha in linhas]
+    
+    def tipos(self) -> List[str]:
+        """Tipos de publicação presentes no arquivo"""
+        with self._conectar() as conn:
+            linhas = conn.execute(
+                "SELECT DISTINCT tipo FROM publicacoes WHERE tipo IS NOT NULL ORDER BY tipo"
+            ).fetchall()
+        return [linha[0] for linha in linhas]
+    
+    def total(self) -> int:
+        """Número de publicações arquivadas"""
+        with self._conectar() as conn:
+            return conn.execute("SELECT COUNT(*) FROM publicacoes").fetchone()[0]
@@ -0,0 +1,147 @@
+"""
+Exportação das publicações em Parquet, para análise (DuckDB, pandas, Spark)
+
+Cada exportação acrescenta arquivos novos, particionados no estilo Hive por ano, mês
+e categoria (ano=2024/mes=3/categoria=resolucao/parte-....parquet); nada é reescrito.
+A partição usa a chave ASCII do registro de categorias, não o nome do tipo, para que
+os diretórios não dependam de codificação de acentos. Leitura:
+    
+    duckdb: SELECT * FROM read_parquet('dados/parquet/**/*.parquet', hive_partitioning = true)
+    pandas: pd.read_parquet('dados/parquet')
+
+Uma publicação exportada de novo (relatório refeito) gera outra linha; a versão mais
+recente de cada link é a de maior exportado_em.
+"""
+
+import uuid
+import logging
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+COLUNAS_PARTICAO = ('ano', 'mes', 'categoria')
+
+
+def _esquema():
+    """Esquema das linhas exportadas (colunas de partição incluídas)"""
+    return pa.schema([
+        ('link', pa.string()),
+        ('titulo', pa.string()),
+        ('data', pa.date32()),
+        ('ano', pa.int16()),
+        ('mes', pa.int8()),
+        ('tipo', pa.string()),
+        ('categoria', pa.string()),
+        ('resumo', pa.string()),
+        ('conteudo', pa.string()),
+        ('caminho_pdf', pa.string()),
+        ('exportado_em', pa.timestamp('s')),
+    ])
+
+
+class ExportadorParquet:
+    """Dataset Parquet particionado por ano/mês/categoria, só com acréscimos"""
+    
+    def __init__(self, diretorio, compressao: str = 'zstd'):
+        """
+        Inicializa o exportador
+        
+        Args:
+            diretorio: Raiz do dataset
+            compressao: Codec do Parquet (zstd, snappy, gzip...)
+        
+        Raises:
+            ImportError: Se o pyarrow não estiver instalado
+        """
+        if not PYARROW_AVAILABLE:
+            raise ImportError("pyarrow não instalado. Execute: pip install pyarrow")
+        
+        self.diretorio = Path(diretorio)
+        self.diretorio.mkdir(parents=True, exist_ok=True)
+        self.compressao = compressao
+        self.logger = logging.getLogger(__name__)
+        self.esquema = _esquema()
+        self.particionamento = ds.partitioning(
+            pa.schema([self.esquema.field(coluna) for coluna in COLUNAS_PARTICAO]), flavor='hive'
+        )
+    
+    def _linhas(self, itens: List[Dict], caminho_pdf: Optional[str]) -> Dict[str, list]:
+        """Converte as publicações em colunas do esquema"""
+        colunas = {campo.name: [] for campo in self.esquema}
+        agora = datetime.now().replace(microsecond=0)
+        
+        for item in itens:
+            if not item.get('link'):
+                continue
+            try:
+                data = datetime.strptime(item.get('data') or '', "%d/%m/%Y").date()
+            except ValueError:
+                data = None
+            
+            colunas['link'].append(item['link'])
+            colunas['titulo'].append(item.get('titulo'))
+            colunas['data'].append(data)
+            colunas['ano'].append(data.year if data else None)
+            colunas['mes'].append(data.month if data else None)
+            colunas['tipo'].append(item.get('tipo'))
+            colunas['categoria'].append(item.get('categoria'))
+            colunas['resumo'].append(item.get('resumo'))
+            colunas['conteudo'].append(item.get('conteudo_completo') or item.get('conteudo'))
+            colunas['caminho_pdf'].append(item.get('caminho_pdf') or caminho_pdf)
+            colunas['exportado_em'].append(agora)
+        return colunas
+    
+    def exportar(self, itens: List[Dict], caminho_pdf: Optional[str] = None) -> int:
+        """
+        Acrescenta as publicações ao dataset (um arquivo novo por partição tocada)
+        
+        Args:
+            itens: Publicações processadas (Publicacao, dicionários com as mesmas chaves
+                ou linhas de ArquivoPublicacoes.lotes)
+            caminho_pdf: PDF em que as publicações saíram (se o item não tiver o seu)
+        
+        Returns:
+            Número de publicações exportadas
+        """
+        tabela = pa.table(self._linhas(itens, caminho_pdf), schema=self.esquema)
+        if not tabela.num_rows:
+            return 0
+        
+        # Nome único por exportação: arquivos anteriores nunca são sobrescritos
+        prefixo = f"parte-{datetime.now().strftime('%Y%m%d%H%M%S')}-{uuid.uuid4().hex[:8]}"
+        ds.write_dataset(
+            tabela,
+            self.diretorio,
+            format='parquet',
+            partitioning=self.particionamento,
+            basename_template=prefixo + "-{i}.parquet",
+            existing_data_behavior='overwrite_or_ignore',
+            file_options=ds.ParquetFileFormat().make_write_options(compression=self.compressao)
+        )
+        
+        self.logger.info(f"{tabela.num_rows} publicação(ões) exportada(s) em Parquet")
+        return tabela.num_rows
+    
+    def ler(self, **filtros) -> "pa.Table":
+        """
+        Lê o dataset inteiro (ou as partições filtradas), com as colunas de partição
+        
+        Args:
+            filtros: Igualdades sobre colunas, ex.: ano=2024, categoria='resolucao'
+        
+        Returns:
+            Tabela do pyarrow (use .to_pandas() para um DataFrame)
+        """
+        dataset = ds.dataset(self.diretorio, format='parquet', partitioning=self.particionamento)
+        expressao = None
+        for coluna, valor in filtros.items():
+            condicao = ds.field(coluna) == valor
+            expressao = condicao if expressao is None else expressao & condicao
+        return dataset.to_table(filter=expressao)
@@ -3,6 +3,7 @@ Módulo de Envio de Email Refatorado
 """
 
 import os
+import base64
 import smtplib
 import logging
 from datetime import datetime
@@ -10,7 +11,6 @@ from typing import List, Optional
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from email.mime.base import MIMEBase
-from email import encoders
 import sys
 
 # Adiciona o diretório raiz ao path
@@ -18,14 +18,21 @@ root_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 if root_dir not in sys.path:
     sys.path.insert(0, root_dir)
 
+from modulo_scraper.categorias import RegistroCategorias
+
 try:
     from config.config import Config
+    from config.logging_config import configurar_logging
 except ImportError:
+    def configurar_logging(config=None):
+        logging.basicConfig(level=logging.INFO)
+    
     # Fallback para configuração básica
     class Config:
         EMAIL_PROVIDER = "gmail"
         SMTP_SERVER = "smtp.gmail.com"
         SMTP_PORT = 587
+        SMTP_STARTTLS = True
         EMAIL_USER = ""
         EMAIL_PASSWORD = ""
         DESTINATARIOS = []
@@ -34,6 +41,9 @@ except ImportError:
 class EmailSender:
     """Enviador de emails com suporte a anexos PDF"""
     
+    # Bytes lidos por vez ao codificar anexos (múltiplo de 57: linhas base64 de 76 caracteres)
+    BLOCO_ANEXO = 57 * 1024
+    
     def __init__(self, config: Optional[Config] = None):
         """
         Inicializa o enviador de email
@@ -45,18 +55,8 @@ class EmailSender:
         self.setup_logging()
     
     def setup_logging(self):
-        """Configura logging"""
-        log_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'logs')
-        os.makedirs(log_dir, exist_ok=True)
-        
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(os.path.join(log_dir, 'email_sender.log')),
-                logging.StreamHandler()
-            ]
-        )
+        """Configura logging (compartilhado; ver config.logging_config)"""
+        configurar_logging(self.config)
         self.logger = logging.getLogger(__name__)
     
     def configurar_servidor_smtp(self):
@@ -71,7 +71,8 @@ class EmailSender:
             self.logger.info(f"Servidor: {self.config.SMTP_SERVER}:{self.config.SMTP_PORT}")
             
             server = smtplib.SMTP(self.config.SMTP_SERVER, self.config.SMTP_PORT)
-            server.starttls()
+            if self.config.SMTP_STARTTLS:
+                server.starttls()
             server.login(self.config.EMAIL_USER, self.config.EMAIL_PASSWORD)
             
             self.logger.info("Conexão SMTP estabelecida com sucesso")
@@ -81,6 +82,32 @@ class EmailSender:
             self.logger.error(f"Erro ao configurar servidor SMTP: {str(e)}")
             raise e
     
+    def criar_anexo_pdf(self, caminho_pdf: str) -> MIMEBase:
+        """
+        Monta a parte MIME do PDF, codificando em base64 bloco a bloco
+        
+        O arquivo não é carregado inteiro na memória antes da codificação.
+        
+        Args:
+            caminho_pdf: Caminho do arquivo PDF
+        
+        Returns:
+            Parte MIME pronta para anexar
+        """
+        linhas = []
+        with open(caminho_pdf, 'rb') as f:
+            for bloco in iter(lambda: f.read(self.BLOCO_ANEXO), b''):
+                linhas.append(base64.encodebytes(bloco).decode('ascii'))
+        
+        anexo = MIMEBase('application', 'pdf')
+        anexo.set_payload(''.join(linhas))
+        anexo['Content-Transfer-Encoding'] = 'base64'
+        anexo.add_header(
+            'Content-Disposition',
+            f'attachment; filename= {os.path.basename(caminho_pdf)}'
+        )
+        return anexo
+    
     def enviar_email_com_anexo(
         self,
         assunto: str,
@@ -107,29 +134,24 @@ class EmailSender:
             destinatarios_sucesso = []
             destinatarios_falharam = []
             
+            # Mensagem montada uma vez (o PDF é lido e codificado uma única vez);
+            # por destinatário muda apenas o cabeçalho To
+            msg = MIMEMultipart('alternative')
+            msg['Subject'] = assunto
+            msg['From'] = self.config.EMAIL_USER
+            msg['To'] = ''
+            
+            # Adiciona corpo HTML
+            html_part = MIMEText(corpo_html, 'html', 'utf-8')
+            msg.attach(html_part)
+            
+            # Adiciona anexo PDF se fornecido
+            if caminho_pdf and os.path.exists(caminho_pdf):
+                msg.attach(self.criar_anexo_pdf(caminho_pdf))
+            
             for destinatario in destinatarios:
                 try:
-                    msg = MIMEMultipart('alternative')
-                    msg['Subject'] = assunto
-                    msg['From'] = self.config.EMAIL_USER
-                    msg['To'] = destinatario
-                    
-                    # Adiciona corpo HTML
-                    html_part = MIMEText(corpo_html, 'html', 'utf-8')
-                    msg.attach(html_part)
-                    
-                    # Adiciona anexo PDF se fornecido
-                    if caminho_pdf and os.path.exists(caminho_pdf):
-                        with open(caminho_pdf, 'rb') as f:
-                            anexo = MIMEBase('application', 'pdf')
-                            anexo.set_payload(f.read())
-                            encoders.encode_base64(anexo)
-                            anexo.add_header(
-                                'Content-Disposition',
-                                f'attachment; filename= {os.path.basename(caminho_pdf)}'
-                            )
-                            msg.attach(anexo)
-                    
+                    msg.replace_header('To', destinatario)
                     server.send_message(msg)
                     destinatarios_sucesso.append(destinatario)
                     self.logger.info(f"Email enviado com sucesso para: {destinatario}")
@@ -164,7 +186,8 @@ class EmailSender:
         Cria o corpo do email em HTML
         
         Args:
-            informacoes_processadas: Lista de documentos processados
+            informacoes_processadas: Publicações processadas (Publicacao ou dicionários
+                com as mesmas chaves)
             data_referencia: Data de referência
             
         Returns:
@@ -173,9 +196,10 @@ class EmailSender:
         if data_referencia is None:
             data_referencia = datetime.now().strftime("%d/%m/%Y")
         
-        comunicados = [item for item in informacoes_processadas if item.get('tipo') == 'Comunicado']
-        resolucoes = [item for item in informacoes_processadas if item.get('tipo') == 'Resolução']
-        circulares = [item for item in informacoes_processadas if item.get('tipo') == 'Circular']
+        grupos = RegistroCategorias.agrupar_por_tipo(informacoes_processadas)
+        contagens = " | \n                       ".join(
+            f"<strong>{plural}:</strong> {len(documentos)}" for plural, documentos in grupos
+        )
         
         html = f"""
         <!DOCTYPE html>
@@ -204,17 +228,15 @@ class EmailSender:
                 </div>
                 <div class="resumo-executivo">
                     <h3>Resumo Executivo</h3>
-                    <p><strong>Total:</strong> {len(informacoes_processadas)} | 
-                       <strong>Comunicados:</strong> {len(comunicados)} | 
-                       <strong>Resoluções:</strong> {len(resolucoes)} | 
-                       <strong>Circulares:</strong> {len(circulares)}</p>
+                    <p><strong>Total:</strong> {len(informacoes_processadas)}{' | ' if contagens else ''}
+                       {contagens}</p>
                 </div>
         """
         
         # Adiciona documentos por tipo
-        for tipo, documentos in [('COMUNICADOS', comunicados), ('RESOLUÇÕES', resolucoes), ('CIRCULARES', circulares)]:
+        for plural, documentos in grupos:
             if documentos:
-                html += f"<h2 style='color: #0066cc;'>{tipo}</h2>"
+                html += f"<h2 style='color: #0066cc;'>{plural.upper()}</h2>"
                 for item in documentos:
                     titulo = item.get('titulo', 'Sem título')
                     resumo = item.get('resumo', '').replace('**', '<strong>').replace('**', '</strong>')
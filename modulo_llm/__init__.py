@@ -1,20 +1,38 @@
 """
 Arquivo __init__.py para o módulo LLM
+
+Os provedores são importados no primeiro acesso: openai e anthropic só
+carregam quando o provedor correspondente é usado.
 """
 
+from typing import TYPE_CHECKING
+
+from config.importacao import carregar_preguicoso
+
 from .base import LLMProvider, FallbackSummarizer
 from .factory import LLMProviderFactory, LLMManager
-from .openai_provider import OpenAIProvider
-from .claude_provider import ClaudeProvider
-from .ollama_provider import OllamaProvider
+from .cache_resumos import CacheResumos
+
+if TYPE_CHECKING:
+    from .openai_provider import OpenAIProvider
+    from .claude_provider import ClaudeProvider
+    from .ollama_provider import OllamaProvider
+
+_MODULOS = {
+    'OpenAIProvider': '.openai_provider',
+    'ClaudeProvider': '.claude_provider',
+    'OllamaProvider': '.ollama_provider',
+}
 
 __all__ = [
     'LLMProvider',
     'FallbackSummarizer',
     'LLMProviderFactory',
     'LLMManager',
+    'CacheResumos',
     'OpenAIProvider',
     'ClaudeProvider',
     'OllamaProvider'
 ]
 
+__getattr__, __dir__ = carregar_preguicoso(__name__, _MODULOS)
@@ -6,6 +6,7 @@ Classe base abstrata para provedores de LLM
 from abc import ABC, abstractmethod
 from typing import Optional, Dict
 import logging
+import threading
 
 
 class LLMProvider(ABC):
@@ -20,7 +21,11 @@ class LLMProvider(ABC):
             **kwargs: Parâmetros adicionais específicos do provedor
         """
         self.api_key = api_key
-        self.logger = logging.getLogger(self.__class__.__name__)
+        # Sob modulo_llm para ir ao llm.log junto com provedores registrados externamente
+        self.logger = logging.getLogger(f"modulo_llm.{self.__class__.__name__}")
+        self.uso_tokens = {'chamadas': 0, 'entrada': 0, 'saida': 0}
+        self._lock_uso = threading.Lock()
+        self._estado_thread = threading.local()
         self.setup_provider(**kwargs)
     
     @abstractmethod
@@ -43,6 +48,60 @@ class LLMProvider(ABC):
         """
         pass
     
+    def registrar_uso(self, entrada: Optional[int], saida: Optional[int]):
+        """
+        Acumula os tokens informados pela API numa chamada
+        
+        Args:
+            entrada: Tokens do prompt
+            saida: Tokens gerados
+        """
+        with self._lock_uso:
+            self.uso_tokens['chamadas'] += 1
+            self.uso_tokens['entrada'] += entrada or 0
+            self.uso_tokens['saida'] += saida or 0
+    
+    def reiniciar_uso(self) -> Dict[str, int]:
+        """Zera o contador de tokens, devolvendo o acumulado até aqui"""
+        with self._lock_uso:
+            uso = dict(self.uso_tokens)
+            self.uso_tokens = {'chamadas': 0, 'entrada': 0, 'saida': 0}
+        return uso
+    
+    def resumo_fallback(self, texto: str, titulo: str, max_lines: int = 5) -> str:
+        """
+        Resumo local por palavras-chave, usado quando a chamada ao LLM falha
+        
+        O resumo é marcado (por thread) para não ser guardado no cache de resumos.
+        
+        Args:
+            texto: Texto completo
+            titulo: Título do documento
+            max_lines: Número máximo de linhas
+            
+        Returns:
+            Resumo formatado
+        """
+        self._estado_thread.fallback = True
+        resumo = FallbackSummarizer.summarize_text(texto, titulo, max_lines)
+        return self.format_summary(titulo, resumo, "")
+    
+    def consumir_fallback(self) -> bool:
+        """Indica se o último resumo desta thread veio do fallback (e limpa a marca)"""
+        fallback = getattr(self._estado_thread, 'fallback', False)
+        self._estado_thread.fallback = False
+        return fallback
+    
+    def fechar(self):
+        """Fecha o cliente HTTP do provedor, se houver"""
+        for atributo in ('client', 'session'):
+            cliente = getattr(self, atributo, None)
+            if cliente is not None and hasattr(cliente, 'close'):
+                try:
+                    cliente.close()
+                except Exception as e:
+                    self.logger.warning(f"Erro ao fechar cliente do provedor: {str(e)}")
+    
     def format_summary(self, titulo: str, resumo: str, link: str) -> str:
         """
         Formata o resumo no padrão esperado
@@ -0,0 +1,124 @@
+"""
+Cache de resumos do LLM em SQLite
+Compartilhado pelo agendador e pelo Streamlit: o mesmo documento, resumido pelo mesmo
+provedor e modelo, não é enviado de novo ao LLM
+"""
+
+import time
+import sqlite3
+import hashlib
+import logging
+import threading
+from pathlib import Path
+from typing import Optional
+
+
+class CacheResumos:
+    """Resumos indexados por provedor, modelo, tamanho pedido e conteúdo do documento"""
+    
+    def __init__(self, caminho_db, validade_dias: int = 90):
+        """
+        Inicializa o cache
+        
+        Args:
+            caminho_db: Caminho do banco SQLite
+            validade_dias: Idade máxima de um resumo reaproveitado (0 = sem limite)
+        """
+        self.caminho_db = Path(caminho_db)
+        self.caminho_db.parent.mkdir(parents=True, exist_ok=True)
+        self.validade_s = validade_dias * 86400
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+        self.estatisticas = {'acertos': 0, 'faltas': 0, 'gravados': 0}
+        self._criar_tabela()
+    
+    def _conectar(self) -> sqlite3.Connection:
+        """Abre uma conexão com o banco"""
+        return sqlite3.connect(str(self.caminho_db), timeout=30)
+    
+    def _criar_tabela(self):
+        """Cria a tabela do cache, se necessário"""
+        with self._lock, self._conectar() as conn:
+            # WAL: leitores (Streamlit) não esperam a gravação do agendador
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS resumos (
+                    chave TEXT PRIMARY KEY,
+                    provedor TEXT NOT NULL,
+                    modelo TEXT,
+                    resumo TEXT NOT NULL,
+                    criado_em REAL NOT NULL
+                )
+            """)
+    
+    @staticmethod
+    def chave(provedor: str, modelo: Optional[str], titulo: str, texto: str, max_lines: int) -> str:
+        """
+        Chave do resumo
+        
+        Args:
+            provedor: Nome da classe do provedor
+            modelo: Modelo usado
+            titulo: Título do documento
+            texto: Texto completo
+            max_lines: Número máximo de linhas pedido
+        
+        Returns:
+            SHA-256 em hexadecimal
+        """
+        conteudo = '\x00'.join([provedor, modelo or '', str(max_lines), titulo, texto])
+        return hashlib.sha256(conteudo.encode('utf-8')).hexdigest()
+    
+    def obter(self, chave: str) -> Optional[str]:
+        """
+        Busca um resumo
+        
+        Args:
+            chave: Chave gerada por chave()
+        
+        Returns:
+            Resumo guardado ou None se ausente ou vencido
+        """
+        with self._conectar() as conn:
+            linha = conn.execute(
+                "SELECT resumo, criado_em FROM resumos WHERE chave = ?", (chave,)
+            ).fetchone()
+        
+        with self._lock:
+            if linha and (not self.validade_s or time.time() - linha[1] < self.validade_s):
+                self.estatisticas['acertos'] += 1
+                return linha[0]
+            self.estatisticas['faltas'] += 1
+            return None
+    
+    def salvar(self, chave: str, resumo: str, provedor: str, modelo: Optional[str] = None):
+        """
+        Grava (ou substitui) um resumo
+        
+        Args:
+            chave: Chave gerada por chave()
+            resumo: Resumo devolvido pelo provedor
+            provedor: Nome da classe do provedor
+            modelo: Modelo usado
+        """
+        with self._lock, self._conectar() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO resumos (chave, provedor, modelo, resumo, criado_em) VALUES (?, ?, ?, ?, ?)",
+                (chave, provedor, modelo, resumo, time.time())
+            )
+            self.estatisticas['gravados'] += 1
+    
+    def limpar_vencidos(self) -> int:
+        """
+        Remove resumos mais antigos que a validade
+        
+        Returns:
+            Número de resumos removidos
+        """
+        if not self.validade_s:
+            return 0
+        with self._lock, self._conectar() as conn:
+            cursor = conn.execute("DELETE FROM resumos WHERE criado_em < ?", (time.time() - self.validade_s,))
+        if cursor.rowcount:
+            self.logger.info(f"Cache de resumos: {cursor.rowcount} resumos vencidos removidos")
+        return cursor.rowcount
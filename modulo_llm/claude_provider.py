@@ -4,7 +4,7 @@ Provedor Anthropic (Claude) para LLM
 
 from typing import Optional
 import logging
-from .base import LLMProvider, FallbackSummarizer
+from .base import LLMProvider
 
 try:
     import anthropic
@@ -73,12 +73,12 @@ Resumo:"""
                 ]
             )
             
+            if getattr(message, 'usage', None):
+                self.registrar_uso(message.usage.input_tokens, message.usage.output_tokens)
             resumo = message.content[0].text.strip()
             return self.format_summary(titulo, resumo, "")
             
         except Exception as e:
             self.logger.error(f"Erro ao gerar resumo com Claude: {str(e)}")
-            fallback = FallbackSummarizer()
-            resumo = fallback.summarize_text(texto, titulo, max_lines)
-            return self.format_summary(titulo, resumo, "")
+            return self.resumo_fallback(texto, titulo, max_lines)
 
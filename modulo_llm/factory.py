@@ -4,23 +4,33 @@ Factory e gerenciador de provedores LLM
 
 import os
 import logging
-from typing import Optional, Dict, Type
-from .base import LLMProvider, FallbackSummarizer
-from .openai_provider import OpenAIProvider
-from .claude_provider import ClaudeProvider
-from .ollama_provider import OllamaProvider
+from importlib import import_module
+from typing import Optional, Dict, Type, Union
+from .base import LLMProvider
+from .cache_resumos import CacheResumos
 
 
 class LLMProviderFactory:
     """Factory para criar instâncias de provedores LLM"""
     
-    _providers: Dict[str, Type[LLMProvider]] = {
-        'openai': OpenAIProvider,
-        'claude': ClaudeProvider,
-        'anthropic': ClaudeProvider,  # Alias
-        'ollama': OllamaProvider,
+    # Provedores embutidos como "módulo:Classe": o SDK de cada um só é importado quando escolhido
+    _providers: Dict[str, Union[Type[LLMProvider], str]] = {
+        'openai': '.openai_provider:OpenAIProvider',
+        'claude': '.claude_provider:ClaudeProvider',
+        'anthropic': '.claude_provider:ClaudeProvider',  # Alias
+        'ollama': '.ollama_provider:OllamaProvider',
     }
     
+    @classmethod
+    def _resolver(cls, provider_name: str) -> Type[LLMProvider]:
+        """Importa a classe do provedor na primeira vez que ele é usado"""
+        provider_class = cls._providers[provider_name]
+        if isinstance(provider_class, str):
+            modulo, classe = provider_class.split(':')
+            provider_class = getattr(import_module(modulo, __package__), classe)
+            cls._providers[provider_name] = provider_class
+        return provider_class
+    
     @classmethod
     def create_provider(
         cls,
@@ -50,9 +60,8 @@ class LLMProviderFactory:
                 f"Provedores disponíveis: {', '.join(cls._providers.keys())}"
             )
         
-        provider_class = cls._providers[provider_name]
-        
         try:
+            provider_class = cls._resolver(provider_name)
             return provider_class(api_key=api_key, **kwargs)
         except Exception as e:
             logging.error(f"Erro ao criar provedor {provider_name}: {str(e)}")
@@ -90,21 +99,26 @@ class FallbackLLMProvider(LLMProvider):
         Returns:
             Resumo formatado
         """
-        fallback = FallbackSummarizer()
-        resumo = fallback.summarize_text(texto, titulo, max_lines)
-        return self.format_summary(titulo, resumo, "")
+        return self.resumo_fallback(texto, titulo, max_lines)
 
 
 class LLMManager:
     """Gerenciador centralizado de LLM"""
     
-    def __init__(self, provider_name: str, api_key: Optional[str] = None, **kwargs):
+    def __init__(
+        self,
+        provider_name: str,
+        api_key: Optional[str] = None,
+        cache: Optional[CacheResumos] = None,
+        **kwargs
+    ):
         """
         Inicializa o gerenciador LLM
         
         Args:
             provider_name: Nome do provedor
             api_key: Chave da API
+            cache: Cache de resumos compartilhado (opcional)
             **kwargs: Parâmetros adicionais
         """
         self.provider = LLMProviderFactory.create_provider(
@@ -112,8 +126,18 @@ class LLMManager:
             api_key=api_key,
             **kwargs
         )
+        self.cache = cache
         self.logger = logging.getLogger(__name__)
     
+    def reiniciar_uso(self) -> Dict[str, int]:
+        """
+        Zera o contador de tokens do provedor
+        
+        Returns:
+            Uso acumulado desde o último reinício (chamadas, entrada, saida)
+        """
+        return self.provider.reiniciar_uso()
+    
     def summarize(self, texto: str, titulo: str, link: str = "", max_lines: int = 5) -> str:
         """
         Gera resumo de um documento
@@ -127,7 +151,16 @@ class LLMManager:
         Returns:
             Resumo formatado completo
         """
-        resumo = self.provider.summarize_text(texto, titulo, max_lines)
+        provedor = type(self.provider).__name__
+        modelo = getattr(self.provider, 'model', None)
+        chave = CacheResumos.chave(provedor, modelo, titulo, texto, max_lines) if self.cache else None
+        resumo = self.cache.obter(chave) if chave else None
+        
+        if resumo is None:
+            resumo = self.provider.summarize_text(texto, titulo, max_lines)
+            # Resumos de fallback (LLM indisponível) não vão para o cache
+            if not self.provider.consumir_fallback() and chave:
+                self.cache.salvar(chave, resumo, provedor, modelo)
         
         # Adiciona link se fornecido
         if link and "🔗 Leia na íntegra:" not in resumo:
@@ -137,4 +170,8 @@ class LLMManager:
             resumo = resumo.replace("🔗 Leia na íntegra: ", f"🔗 Leia na íntegra: {link}")
         
         return resumo
+    
+    def fechar(self):
+        """Libera o cliente do provedor"""
+        self.provider.fechar()
 
@@ -5,7 +5,7 @@ Provedor OLLAMA para LLM local
 from typing import Optional
 import logging
 import requests
-from .base import LLMProvider, FallbackSummarizer
+from .base import LLMProvider
 
 
 class OllamaProvider(LLMProvider):
@@ -22,6 +22,8 @@ class OllamaProvider(LLMProvider):
         """
         self.base_url = base_url
         self.model = model
+        # Sessão reutilizada: mantém a conexão com o servidor entre os resumos
+        self.session = requests.Session()
         self.logger.info(f"OLLAMA Provider configurado com modelo: {model} em {base_url}")
     
     def summarize_text(self, texto: str, titulo: str, max_lines: int = 5) -> str:
@@ -51,7 +53,7 @@ Conteúdo:
 
 Resumo:"""
             
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}/api/generate",
                 json={
                     "model": self.model,
@@ -67,6 +69,7 @@ Resumo:"""
             
             response.raise_for_status()
             result = response.json()
+            self.registrar_uso(result.get('prompt_eval_count'), result.get('eval_count'))
             resumo = result.get('response', '').strip()
             
             if not resumo:
@@ -76,7 +79,5 @@ Resumo:"""
             
         except Exception as e:
             self.logger.error(f"Erro ao gerar resumo com OLLAMA: {str(e)}")
-            fallback = FallbackSummarizer()
-            resumo = fallback.summarize_text(texto, titulo, max_lines)
-            return self.format_summary(titulo, resumo, "")
+            return self.resumo_fallback(texto, titulo, max_lines)
 
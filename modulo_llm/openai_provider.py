@@ -4,7 +4,7 @@ Provedor OpenAI para LLM
 
 from typing import Optional
 import logging
-from .base import LLMProvider, FallbackSummarizer
+from .base import LLMProvider
 
 try:
     from openai import OpenAI
@@ -72,13 +72,13 @@ Resumo:"""
                 temperature=0.3
             )
             
+            if response.usage:
+                self.registrar_uso(response.usage.prompt_tokens, response.usage.completion_tokens)
             resumo = response.choices[0].message.content.strip()
             return self.format_summary(titulo, resumo, "")
             
         except Exception as e:
             self.logger.error(f"Erro ao gerar resumo com OpenAI: {str(e)}")
             # Fallback para sumarizador simples
-            fallback = FallbackSummarizer()
-            resumo = fallback.summarize_text(texto, titulo, max_lines)
-            return self.format_summary(titulo, resumo, "")
+            return self.resumo_fallback(texto, titulo, max_lines)
 
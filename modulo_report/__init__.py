@@ -1,8 +1,21 @@
 """
 Arquivo __init__.py para o módulo report
+
+O reportlab só é carregado quando PDFGenerator é acessado; o índice de relatórios
+usa apenas a biblioteca padrão.
 """
 
-from .pdf_generator import PDFGenerator
+from typing import TYPE_CHECKING
+
+from config.importacao import carregar_preguicoso
+
+from .indice_relatorios import IndiceRelatorios
+
+if TYPE_CHECKING:
+    from .pdf_generator import PDFGenerator
+
+_MODULOS = {'PDFGenerator': '.pdf_generator'}
 
-__all__ = ['PDFGenerator']
+__all__ = ['PDFGenerator', 'IndiceRelatorios']
 
+__getattr__, __dir__ = carregar_preguicoso(__name__, _MODULOS)
@@ -0,0 +1,214 @@
+"""
+Índice dos relatórios PDF gerados
+Mantido pelo PDFGenerator a cada relatório, com tamanho, hash, período e número de
+itens, para que a interface liste e ordene os relatórios sem varrer o diretório
+"""
+
+import os
+import re
+import sqlite3
+import hashlib
+import logging
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+NOME_INDICE = "indice_relatorios.db"
+PADRAO_NOME = re.compile(r'relatorio_bacen_(\d{8})')
+
+
+def _data_iso(data: Optional[str]) -> Optional[str]:
+    """Converte DD/MM/YYYY em YYYY-MM-DD, ou None se inválida"""
+    try:
+        return datetime.strptime(data or '', "%d/%m/%Y").strftime("%Y-%m-%d")
+    except ValueError:
+        return None
+
+
+def calcular_sha256(caminho: str) -> str:
+    """SHA-256 do arquivo, lido em blocos"""
+    resumo = hashlib.sha256()
+    with open(caminho, 'rb') as f:
+        for bloco in iter(lambda: f.read(64 * 1024), b''):
+            resumo.update(bloco)
+    return resumo.hexdigest()
+
+
+class IndiceRelatorios:
+    """Tabela relatorios em SQLite, dentro do próprio diretório de relatórios"""
+    
+    def __init__(self, diretorio, caminho_db: Optional[str] = None):
+        """
+        Inicializa o índice
+        
+        Args:
+            diretorio: Diretório dos PDFs
+            caminho_db: Caminho do banco SQLite (padrão: <diretorio>/indice_relatorios.db)
+        """
+        self.diretorio = Path(diretorio)
+        self.diretorio.mkdir(parents=True, exist_ok=True)
+        self.caminho_db = Path(caminho_db) if caminho_db else self.diretorio / NOME_INDICE
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+        self._criar_tabela()
+    
+    def _conectar(self) -> sqlite3.Connection:
+        """Abre uma conexão com o banco"""
+        conn = sqlite3.connect(str(self.caminho_db), timeout=30)
+        conn.row_factory = sqlite3.Row
+        return conn
+    
+    def _criar_tabela(self):
+        """Cria a tabela do índice, se necessário"""
+        with self._lock, self._conectar() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS relatorios (
+                    nome TEXT PRIMARY KEY,
+                    data_referencia TEXT,
+                    periodo_inicio TEXT,
+                    periodo_fim TEXT,
+                    itens INTEGER,
+                    tamanho INTEGER NOT NULL,
+                    sha256 TEXT NOT NULL,
+                    criado_em REAL NOT NULL
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_relatorios_criado ON relatorios (criado_em DESC)")
+    
+    def registrar(
+        self,
+        caminho: str,
+        data_referencia: Optional[str] = None,
+        itens: Optional[List[Dict]] = None
+    ) -> Dict:
+        """
+        Registra (ou atualiza) um relatório recém-gerado
+        
+        Args:
+            caminho: Caminho do PDF
+            data_referencia: Dia do relatório (DD/MM/YYYY)
+            itens: Publicações do relatório (para contagem e período)
+        
+        Returns:
+            Entrada gravada no índice
+        """
+        estado = os.stat(caminho)
+        datas = sorted(filter(None, (_data_iso(item.get('data')) for item in itens or [])))
+        entrada = {
+            'nome': os.path.basename(caminho),
+            'data_referencia': data_referencia,
+            'periodo_inicio': datas[0] if datas else _data_iso(data_referencia),
+            'periodo_fim': datas[-1] if datas else _data_iso(data_referencia),
+            'itens': len(itens) if itens is not None else None,
+            'tamanho': estado.st_size,
+            'sha256': calcular_sha256(caminho),
+            'criado_em': estado.st_mtime,
+        }
+        
+        with self._lock, self._conectar() as conn:
+            conn.execute("""
+                INSERT OR REPLACE INTO relatorios
+                    (nome, data_referencia, periodo_inicio, periodo_fim, itens, tamanho, sha256, criado_em)
+                VALUES (:nome, :data_referencia, :periodo_inicio, :periodo_fim, :itens, :tamanho, :sha256, :criado_em)
+            """, entrada)
+        return entrada
+    
+    def listar(self, limite: int = 10, deslocamento: int = 0) -> List[Dict]:
+        """
+        Relatórios do mais recente para o mais antigo
+        
+        Args:
+            limite: Número máximo de relatórios
+            deslocamento: Relatórios a pular (paginação)
+        
+        Returns:
+            Entradas do índice, com 'caminho' absoluto
+        """
+        with self._conectar() as conn:
+            linhas = conn.execute(
+                "SELECT * FROM relatorios ORDER BY criado_em DESC LIMIT ? OFFSET ?", (limite, deslocamento)
+            ).fetchall()
+        return [dict(linha, caminho=str(self.diretorio / linha['nome'])) for linha in linhas]
+    
+    def ultimo(self) -> Optional[Dict]:
+        """Relatório mais recente, ou None se não houver"""
+        relatorios = self.listar(1)
+        return relatorios[0] if relatorios else None
+    
+    def total(self) -> int:
+        """Número de relatórios indexados"""
+        with self._conectar() as conn:
+            return conn.execute("SELECT COUNT(*) FROM relatorios").fetchone()[0]
+    
+    def remover(self, nome: str):
+        """
+        Apaga o PDF e sua entrada no índice
+        
+        Args:
+            nome: Nome do arquivo
+        """
+        (self.diretorio / os.path.basename(nome)).unlink(missing_ok=True)
+        with self._lock, self._conectar() as conn:
+            conn.execute("DELETE FROM relatorios WHERE nome = ?", (nome,))
+        self.logger.info(f"Relatório removido: {nome}")
+    
+    def sincronizar(self) -> Tuple[int, int]:
+        """
+        Reconcilia o índice com o diretório (PDFs anteriores ao índice, copiados ou
+        apagados à mão); percorre o diretório, então não deve rodar a cada página
+        
+        Returns:
+            Tupla (relatórios adicionados, entradas removidas)
+        """
+        with self._conectar() as conn:
+            indexados = {linha[0] for linha in conn.execute("SELECT nome FROM relatorios")}
+        no_disco = {
+            entrada.name for entrada in os.scandir(self.diretorio)
+            # Arquivos vazios são relatórios reservados ainda em geração
+            if entrada.is_file() and entrada.name.lower().endswith('.pdf') and entrada.stat().st_size > 0
+        }
+        
+        for nome in sorted(no_disco - indexados):
+            encontrado = PADRAO_NOME.match(nome)
+            data_referencia = None
+            if encontrado:
+                data_referencia = datetime.strptime(encontrado.group(1), "%Y%m%d").strftime("%d/%m/%Y")
+            try:
+                self.registrar(str(self.diretorio / nome), data_referencia)
+            except OSError as e:
+                self.logger.warning(f"Erro ao indexar {nome}: {str(e)}")
+        
+        ausentes = indexados - no_disco
+        if ausentes:
+            with self._lock, self._conectar() as conn:
+                conn.executemany("DELETE FROM relatorios WHERE nome = ?", [(nome,) for nome in ausentes])
+        
+        adicionados = len(no_disco - indexados)
+        if adicionados or ausentes:
+            self.logger.info(f"Índice de relatórios: {adicionados} adicionado(s), {len(ausentes)} removido(s)")
+        return adicionados, len(ausentes)
+    
+    def reservar_caminho(self, data_referencia: str) -> str:
+        """
+        Cria (vazio) o arquivo de um novo relatório do dia, com nome único
+        
+        A criação exclusiva evita que duas gerações simultâneas escolham o mesmo nome.
+        
+        Args:
+            data_referencia: Dia do relatório (DD/MM/YYYY)
+        
+        Returns:
+            Caminho de relatorio_bacen_YYYYMMDD_HHMMSS.pdf (com sufixo se já existir)
+        """
+        data_arquivo = datetime.strptime(data_referencia, "%d/%m/%Y").strftime("%Y%m%d")
+        base = f"relatorio_bacen_{data_arquivo}_{datetime.now().strftime('%H%M%S')}"
+        nome, sufixo = f"{base}.pdf", 2
+        while True:
+            caminho = self.diretorio / nome
+            try:
+                with open(caminho, 'x'):
+                    return str(caminho)
+            except FileExistsError:
+                nome, sufixo = f"{base}_{sufixo}.pdf", sufixo + 1
@@ -3,6 +3,7 @@ Módulo de Geração de Relatórios PDF
 """
 
 import os
+import sys
 import logging
 from datetime import datetime
 from typing import List, Dict
@@ -15,6 +16,20 @@ from reportlab.lib.colors import HexColor
 from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
 
+# Adiciona o diretório raiz ao path
+root_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if root_dir not in sys.path:
+    sys.path.insert(0, root_dir)
+
+from modulo_scraper.categorias import RegistroCategorias
+from modulo_report.indice_relatorios import IndiceRelatorios
+
+try:
+    from config.logging_config import configurar_logging
+except ImportError:
+    def configurar_logging(config=None):
+        logging.basicConfig(level=logging.INFO)
+
 
 class PDFGenerator:
     """Gerador de relatórios PDF profissionais"""
@@ -28,23 +43,14 @@ class PDFGenerator:
         """
         self.output_dir = output_dir
         os.makedirs(output_dir, exist_ok=True)
+        self.indice = IndiceRelatorios(output_dir)
         self.setup_logging()
         self.setup_fonts()
         self.setup_styles()
     
     def setup_logging(self):
-        """Configura logging"""
-        log_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'logs')
-        os.makedirs(log_dir, exist_ok=True)
-        
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(os.path.join(log_dir, 'pdf_generator.log')),
-                logging.StreamHandler()
-            ]
-        )
+        """Configura logging (compartilhado; ver config.logging_config)"""
+        configurar_logging()
         self.logger = logging.getLogger(__name__)
     
     def setup_fonts(self):
@@ -135,20 +141,20 @@ class PDFGenerator:
         Gera relatório PDF completo
         
         Args:
-            informacoes_processadas: Lista de documentos processados
+            informacoes_processadas: Publicações processadas (Publicacao ou dicionários
+                com as mesmas chaves)
             data_referencia: Data de referência (formato DD/MM/YYYY)
             
         Returns:
             Caminho do arquivo PDF gerado
         """
+        caminho_completo = None
         try:
             if data_referencia is None:
                 data_referencia = datetime.now().strftime("%d/%m/%Y")
             
-            # Nome do arquivo
-            data_arquivo = datetime.now().strftime("%Y%m%d")
-            nome_arquivo = f"relatorio_bacen_{data_arquivo}.pdf"
-            caminho_completo = os.path.join(self.output_dir, nome_arquivo)
+            # Nome único por geração (data de referência + hora): nada é sobrescrito
+            caminho_completo = self.indice.reservar_caminho(data_referencia)
             
             # Cria o documento PDF
             doc = SimpleDocTemplate(
@@ -169,29 +175,21 @@ class PDFGenerator:
             story.append(Paragraph(f"Data: {data_referencia}", self.body_style))
             story.append(Spacer(1, 0.5*cm))
             
-            # Resumo executivo
-            comunicados = [item for item in informacoes_processadas if item.get('tipo') == 'Comunicado']
-            resolucoes = [item for item in informacoes_processadas if item.get('tipo') == 'Resolução']
-            circulares = [item for item in informacoes_processadas if item.get('tipo') == 'Circular']
+            # Resumo executivo (grupos na ordem do registro de categorias)
+            grupos = RegistroCategorias.agrupar_por_tipo(informacoes_processadas)
             
             resumo_texto = (
                 f"<b>Resumo Executivo</b><br/>"
                 f"Total de documentos: {len(informacoes_processadas)}<br/>"
-                f"Comunicados: {len(comunicados)} | "
-                f"Resoluções: {len(resolucoes)} | "
-                f"Circulares: {len(circulares)}"
+                + " | ".join(f"{plural}: {len(documentos)}" for plural, documentos in grupos)
             )
             story.append(Paragraph(resumo_texto, self.body_style))
             story.append(Spacer(1, 0.5*cm))
             
             # Agrupa por tipo
-            tipos_ordem = ['Comunicado', 'Resolução', 'Circular']
-            
-            for tipo in tipos_ordem:
-                documentos_tipo = [item for item in informacoes_processadas if item.get('tipo') == tipo]
-                
+            for plural, documentos_tipo in grupos:
                 if documentos_tipo:
-                    story.append(Paragraph(f"<b>{tipo.upper()}S</b>", self.subtitle_style))
+                    story.append(Paragraph(f"<b>{plural.upper()}</b>", self.subtitle_style))
                     
                     for item in documentos_tipo:
                         # Título do documento
@@ -232,11 +230,19 @@ class PDFGenerator:
             doc.build(story)
             
             self.logger.info(f"PDF gerado com sucesso: {caminho_completo}")
-            return caminho_completo
             
         except Exception as e:
             self.logger.error(f"Erro ao gerar PDF: {str(e)}")
+            if caminho_completo and os.path.exists(caminho_completo):
+                os.remove(caminho_completo)
             raise
+        
+        # Falha no índice não invalida o relatório (sincronizar() o recupera depois)
+        try:
+            self.indice.registrar(caminho_completo, data_referencia, informacoes_processadas)
+        except Exception as e:
+            self.logger.warning(f"Erro ao registrar relatório no índice: {str(e)}")
+        return caminho_completo
 
 
 if __name__ == "__main__":
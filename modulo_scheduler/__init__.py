@@ -1,8 +1,19 @@
 """
 Arquivo __init__.py para o módulo scheduler
+
+TaskScheduler (APScheduler e SQLAlchemy) é importado no primeiro acesso; os
+registros em SQLite deste pacote usam apenas a biblioteca padrão.
 """
 
-from .task_scheduler import TaskScheduler
+from typing import TYPE_CHECKING
+
+from config.importacao import carregar_preguicoso
+
+if TYPE_CHECKING:
+    from .task_scheduler import TaskScheduler
+
+_MODULOS = {'TaskScheduler': '.task_scheduler'}
 
 __all__ = ['TaskScheduler']
 
+__getattr__, __dir__ = carregar_preguicoso(__name__, _MODULOS)
@@ -0,0 +1,203 @@
+"""
+API HTTP local de controle do agendador
+Lista tarefas, dispara execuções, pausa/retoma e expõe estatísticas e métricas no mesmo processo
+
+Rotas:
+    GET  /saude
+    GET  /tarefas
+    POST /tarefas/<id>/executar
+    POST /tarefas/<id>/pausar
+    POST /tarefas/<id>/retomar
+    GET  /estatisticas
+    GET  /metrics            (formato texto do Prometheus)
+"""
+
+import json
+import hmac
+import logging
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, List, Optional
+
+from apscheduler.jobstores.base import JobLookupError
+
+
+def _escapar_rotulo(valor: str) -> str:
+    """Escapa um valor de rótulo do formato de exposição do Prometheus"""
+    return str(valor).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+class ManipuladorControle(BaseHTTPRequestHandler):
+    """Atende as rotas da API de controle"""
+    
+    def _autorizado(self) -> bool:
+        """Confere o token (Authorization: Bearer <token>), se configurado"""
+        token = self.server.token
+        if not token:
+            return True
+        recebido = self.headers.get('Authorization', '')
+        return hmac.compare_digest(recebido, f"Bearer {token}")
+    
+    def do_GET(self):
+        if not self._autorizado():
+            self._json({'erro': 'não autorizado'}, status=401)
+            return
+        
+        caminho = self.path.split('?')[0].rstrip('/')
+        agendador = self.server.agendador
+        
+        if caminho == '/saude':
+            self._json({'status': 'ok', 'agendador_ativo': agendador.scheduler.running})
+        elif caminho == '/tarefas':
+            self._json(agendador.descrever_tarefas())
+        elif caminho == '/estatisticas':
+            self._json(self.server.estatisticas())
+        elif caminho == '/metrics':
+            self._responder(200, self.server.metricas().encode('utf-8'), 'text/plain; version=0.0.4')
+        else:
+            self._json({'erro': 'rota não encontrada'}, status=404)
+    
+    def do_POST(self):
+        if not self._autorizado():
+            self._json({'erro': 'não autorizado'}, status=401)
+            return
+        
+        partes = self.path.split('?')[0].strip('/').split('/')
+        if len(partes) != 3 or partes[0] != 'tarefas':
+            self._json({'erro': 'rota não encontrada'}, status=404)
+            return
+        
+        _, job_id, acao = partes
+        agendador = self.server.agendador
+        acoes: Dict[str, Callable[[str], None]] = {
+            'executar': agendador.disparar_agora,
+            'pausar': agendador.pausar_tarefa,
+            'retomar': agendador.retomar_tarefa,
+        }
+        if acao not in acoes:
+            self._json({'erro': f"ação desconhecida: {acao}"}, status=404)
+            return
+        
+        try:
+            acoes[acao](job_id)
+        except (KeyError, JobLookupError):
+            self._json({'erro': f"tarefa não encontrada: {job_id}"}, status=404)
+            return
+        
+        self._json({'tarefa': job_id, 'acao': acao, 'ok': True}, status=202 if acao == 'executar' else 200)
+    
+    def _json(self, corpo, status: int = 200):
+        """Responde JSON"""
+        dados = json.dumps(corpo, ensure_ascii=False, default=str).encode('utf-8')
+        self._responder(status, dados, 'application/json; charset=utf-8')
+    
+    def _responder(self, status: int, corpo: bytes, content_type: str):
+        """Envia status, cabeçalhos e corpo"""
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(corpo)))
+        self.end_headers()
+        self.wfile.write(corpo)
+    
+    def log_message(self, formato, *args):
+        """Registra os acessos no logger do módulo em vez do stderr"""
+        self.server.logger.debug(f"{self.address_string()} - {formato % args}")
+
+
+class ServidorControle(ThreadingHTTPServer):
+    """Servidor da API de controle, executado em thread própria"""
+    
+    daemon_threads = True
+    
+    def __init__(
+        self,
+        agendador,
+        host: str = "127.0.0.1",
+        porta: int = 8790,
+        token: str = "",
+        registro_execucoes=None,
+        fontes_metricas: Optional[List[Callable[[], Dict[str, float]]]] = None
+    ):
+        """
+        Inicializa o servidor
+        
+        Args:
+            agendador: TaskScheduler controlado
+            host: Endereço de escuta (padrão: apenas local)
+            porta: Porta de escuta
+            token: Token exigido em Authorization: Bearer (vazio = sem autenticação)
+            registro_execucoes: RegistroExecucoes para as estatísticas diárias (opcional)
+            fontes_metricas: Funções extras que devolvem {nome_metrica: valor}
+        """
+        super().__init__((host, porta), ManipuladorControle)
+        self.agendador = agendador
+        self.token = token
+        self.registro_execucoes = registro_execucoes
+        self.fontes_metricas = fontes_metricas or []
+        self.logger = logging.getLogger(__name__)
+        self._thread: Optional[threading.Thread] = None
+    
+    def estatisticas(self) -> Dict:
+        """Estatísticas das tarefas e das últimas execuções diárias"""
+        resultado = {'tarefas': self.agendador.descrever_tarefas()}
+        if self.registro_execucoes:
+            resultado['execucoes_diarias'] = self.registro_execucoes.ultimas(10)
+        return resultado
+    
+    def metricas(self) -> str:
+        """Métricas no formato texto do Prometheus"""
+        linhas = []
+        
+        def metrica(nome: str, tipo: str, ajuda: str, amostras: List[tuple]):
+            linhas.append(f"# HELP {nome} {ajuda}")
+            linhas.append(f"# TYPE {nome} {tipo}")
+            for rotulos, valor in amostras:
+                texto_rotulos = ','.join(f'{k}="{_escapar_rotulo(v)}"' for k, v in rotulos.items())
+                linhas.append(f"{nome}{{{texto_rotulos}}} {valor}" if rotulos else f"{nome} {valor}")
+        
+        tarefas = self.agendador.descrever_tarefas()
+        
+        def por_tarefa(campo: str) -> List[tuple]:
+            return [
+                ({'tarefa': t['id']}, t['estatisticas'][campo])
+                for t in tarefas if t['estatisticas'].get(campo) is not None
+            ]
+        
+        metrica('bacen_agendador_ativo', 'gauge', 'Agendador em execução',
+                [({}, int(self.agendador.scheduler.running))])
+        metrica('bacen_tarefa_pausada', 'gauge', 'Tarefa pausada',
+                [({'tarefa': t['id']}, int(t['pausada'])) for t in tarefas])
+        metrica('bacen_tarefa_execucoes_total', 'counter', 'Execuções concluídas', por_tarefa('execucoes'))
+        metrica('bacen_tarefa_falhas_total', 'counter', 'Execuções com erro', por_tarefa('falhas'))
+        metrica('bacen_tarefa_perdidas_total', 'counter', 'Execuções perdidas (misfire)', por_tarefa('perdidas'))
+        metrica('bacen_tarefa_em_execucao', 'gauge', 'Execuções em andamento', por_tarefa('em_execucao'))
+        metrica('bacen_tarefa_ultima_duracao_segundos', 'gauge', 'Duração da última execução',
+                por_tarefa('ultima_duracao_s'))
+        metrica('bacen_tarefa_ultima_execucao_timestamp', 'gauge', 'Fim da última execução (epoch)',
+                por_tarefa('ultima_execucao'))
+        
+        if self.registro_execucoes:
+            metrica('bacen_execucoes_diarias', 'gauge', 'Dias registrados por situação',
+                    [({'status': status}, total)
+                     for status, total in self.registro_execucoes.contagem_por_status().items()])
+        
+        for fonte in self.fontes_metricas:
+            try:
+                for nome, valor in fonte().items():
+                    metrica(nome, 'gauge', nome, [({}, valor)])
+            except Exception as e:
+                self.logger.warning(f"Erro ao coletar métricas extras: {str(e)}")
+        
+        return '\n'.join(linhas) + '\n'
+    
+    def iniciar(self) -> "ServidorControle":
+        """Atende requisições em segundo plano"""
+        self._thread = threading.Thread(target=self.serve_forever, name="api-controle", daemon=True)
+        self._thread.start()
+        self.logger.info(f"API de controle em http://{self.server_address[0]}:{self.server_address[1]}")
+        return self
+    
+    def parar(self):
+        """Encerra o servidor"""
+        self.shutdown()
+        self.server_close()
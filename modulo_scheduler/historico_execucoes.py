@@ -0,0 +1,217 @@
+"""
+Histórico de execuções do pipeline
+Uma linha por execução (agendada, recuperação ou manual), com duração de cada etapa,
+volumes, tokens do LLM, erro e caminho do PDF, para acompanhar tendências de desempenho
+"""
+
+import json
+import time
+import sqlite3
+import logging
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+
+ETAPAS = ('coleta', 'resumos', 'pdf', 'email')
+
+
+def percentil(valores: List[float], p: float) -> Optional[float]:
+    """
+    Percentil com interpolação linear entre as amostras vizinhas
+    
+    Args:
+        valores: Amostras
+        p: Percentil entre 0 e 100
+    
+    Returns:
+        Valor do percentil ou None sem amostras
+    """
+    if not valores:
+        return None
+    ordenados = sorted(valores)
+    posicao = (len(ordenados) - 1) * p / 100
+    inferior = int(posicao)
+    superior = min(inferior + 1, len(ordenados) - 1)
+    return ordenados[inferior] + (ordenados[superior] - ordenados[inferior]) * (posicao - inferior)
+
+
+class ExecucaoPipeline:
+    """Medições de uma execução em andamento"""
+    
+    def __init__(self, data_referencia: Optional[str] = None):
+        """
+        Args:
+            data_referencia: Dia do relatório (DD/MM/YYYY)
+        """
+        self.data_referencia = data_referencia
+        self.inicio = datetime.now()
+        self._inicio_relogio = time.perf_counter()
+        self.etapas: Dict[str, float] = {}
+        self.status = 'em_andamento'
+        self.itens_coletados = 0
+        self.itens_processados = 0
+        self.requisicoes = 0
+        self.tokens = {'chamadas': 0, 'entrada': 0, 'saida': 0}
+        self.caminho_pdf: Optional[str] = None
+        self.erro: Optional[str] = None
+    
+    @contextmanager
+    def etapa(self, nome: str) -> Iterator[None]:
+        """Mede a duração de uma etapa (acumula se a etapa se repetir)"""
+        inicio = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.etapas[nome] = self.etapas.get(nome, 0.0) + time.perf_counter() - inicio
+    
+    @property
+    def duracao_s(self) -> float:
+        """Tempo decorrido desde o início"""
+        return time.perf_counter() - self._inicio_relogio
+
+
+class HistoricoExecucoes:
+    """Tabela historico_execucoes em SQLite, no mesmo banco do agendador"""
+    
+    def __init__(self, caminho_db):
+        """
+        Inicializa o histórico
+        
+        Args:
+            caminho_db: Caminho do banco SQLite
+        """
+        self.caminho_db = Path(caminho_db)
+        self.caminho_db.parent.mkdir(parents=True, exist_ok=True)
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+        self._criar_tabela()
+    
+    def _conectar(self) -> sqlite3.Connection:
+        """Abre uma conexão com o banco"""
+        return sqlite3.connect(str(self.caminho_db), timeout=30)
+    
+    def _criar_tabela(self):
+        """Cria a tabela do histórico, se necessário"""
+        with self._conectar() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS historico_execucoes (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    data_referencia TEXT,
+                    inicio TEXT NOT NULL,
+                    fim TEXT NOT NULL,
+                    duracao_s REAL NOT NULL,
+                    status TEXT NOT NULL,
+                    itens_coletados INTEGER DEFAULT 0,
+                    itens_processados INTEGER DEFAULT 0,
+                    requisicoes INTEGER DEFAULT 0,
+                    chamadas_llm INTEGER DEFAULT 0,
+                    tokens_entrada INTEGER DEFAULT 0,
+                    tokens_saida INTEGER DEFAULT 0,
+                    etapas TEXT,
+                    caminho_pdf TEXT,
+                    erro TEXT
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_historico_inicio ON historico_execucoes (inicio)")
+    
+    def registrar(self, execucao: ExecucaoPipeline) -> int:
+        """
+        Grava uma execução encerrada
+        
+        Args:
+            execucao: Medições da execução
+        
+        Returns:
+            ID da linha gravada
+        """
+        with self._lock, self._conectar() as conn:
+            cursor = conn.execute("""
+                INSERT INTO historico_execucoes (
+                    data_referencia, inicio, fim, duracao_s, status, itens_coletados,
+                    itens_processados, requisicoes, chamadas_llm, tokens_entrada, tokens_saida,
+                    etapas, caminho_pdf, erro
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, (
+                execucao.data_referencia,
+                execucao.inicio.isoformat(timespec='seconds'),
+                datetime.now().isoformat(timespec='seconds'),
+                round(execucao.duracao_s, 3),
+                execucao.status,
+                execucao.itens_coletados,
+                execucao.itens_processados,
+                execucao.requisicoes,
+                execucao.tokens.get('chamadas', 0),
+                execucao.tokens.get('entrada', 0),
+                execucao.tokens.get('saida', 0),
+                json.dumps({nome: round(segundos, 3) for nome, segundos in execucao.etapas.items()}),
+                execucao.caminho_pdf,
+                execucao.erro
+            ))
+            return cursor.lastrowid
+    
+    def ultimas(self, limite: int = 20) -> List[Dict]:
+        """
+        Lista as execuções mais recentes
+        
+        Args:
+            limite: Número máximo de execuções
+        
+        Returns:
+            Lista de dicionários, da mais recente para a mais antiga
+        """
+        with self._conectar() as conn:
+            conn.row_factory = sqlite3.Row
+            linhas = conn.execute(
+                "SELECT * FROM historico_execucoes ORDER BY id DESC LIMIT ?", (limite,)
+            ).fetchall()
+        
+        execucoes = []
+        for linha in linhas:
+            execucao = dict(linha)
+            execucao['etapas'] = json.loads(execucao['etapas'] or '{}')
+            execucoes.append(execucao)
+        return execucoes
+    
+    def resumo(self, limite: int = 20) -> Dict:
+        """
+        Estatísticas das últimas execuções
+        
+        Args:
+            limite: Número de execuções consideradas
+        
+        Returns:
+            Dicionário com totais, taxa de sucesso, vazão e percentis (p50/p90/p95/max)
+            da duração total e de cada etapa
+        """
+        execucoes = self.ultimas(limite)
+        if not execucoes:
+            return {'execucoes': 0}
+        
+        def percentis(valores: List[float]) -> Dict[str, Optional[float]]:
+            return {
+                'p50': percentil(valores, 50),
+                'p90': percentil(valores, 90),
+                'p95': percentil(valores, 95),
+                'max': max(valores) if valores else None
+            }
+        
+        concluidas = [e for e in execucoes if e['status'] != 'erro']
+        duracao_total = sum(e['duracao_s'] for e in concluidas)
+        itens = sum(e['itens_processados'] for e in concluidas)
+        
+        return {
+            'execucoes': len(execucoes),
+            'falhas': len(execucoes) - len(concluidas),
+            'taxa_sucesso': len(concluidas) / len(execucoes),
+            'itens_por_minuto': itens / (duracao_total / 60) if duracao_total else None,
+            'tokens_entrada': sum(e['tokens_entrada'] for e in execucoes),
+            'tokens_saida': sum(e['tokens_saida'] for e in execucoes),
+            'duracao': percentis([e['duracao_s'] for e in concluidas]),
+            'etapas': {
+                etapa: percentis([e['etapas'][etapa] for e in concluidas if etapa in e['etapas']])
+                for etapa in ETAPAS
+            }
+        }
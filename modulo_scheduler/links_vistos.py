@@ -0,0 +1,99 @@
+"""
+Registro dos links já vistos pelas verificações periódicas de novidades
+Permite alertar apenas sobre publicações que surgiram desde a última verificação
+"""
+
+import sqlite3
+import logging
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, List
+
+if TYPE_CHECKING:
+    from modulo_scraper import Publicacao
+
+
+class LinksVistos:
+    """Tabela links_vistos em SQLite, no mesmo banco do agendador"""
+    
+    def __init__(self, caminho_db):
+        """
+        Inicializa o registro
+        
+        Args:
+            caminho_db: Caminho do banco SQLite
+        """
+        self.caminho_db = Path(caminho_db)
+        self.caminho_db.parent.mkdir(parents=True, exist_ok=True)
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+        self._criar_tabela()
+    
+    def _conectar(self) -> sqlite3.Connection:
+        """Abre uma conexão com o banco"""
+        return sqlite3.connect(str(self.caminho_db), timeout=30)
+    
+    def _criar_tabela(self):
+        """Cria as tabelas de links e de linhas de base, se necessário"""
+        with self._conectar() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS links_vistos (
+                    link TEXT PRIMARY KEY,
+                    categoria TEXT NOT NULL,
+                    titulo TEXT,
+                    data TEXT,
+                    visto_em TEXT NOT NULL
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_links_vistos_categoria ON links_vistos (categoria)")
+            # Marca a primeira verificação de cada categoria, mesmo com listagem vazia
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS linhas_de_base (
+                    categoria TEXT PRIMARY KEY,
+                    formada_em TEXT NOT NULL
+                )
+            """)
+            # Bancos anteriores à tabela: categorias com links já têm linha de base
+            conn.execute("""
+                INSERT OR IGNORE INTO linhas_de_base (categoria, formada_em)
+                SELECT categoria, MIN(visto_em) FROM links_vistos GROUP BY categoria
+            """)
+    
+    def registrar(self, categoria: str, itens: List["Publicacao"]) -> List["Publicacao"]:
+        """
+        Grava os links listados e devolve os que ainda não tinham sido vistos
+        
+        A primeira verificação de uma categoria apenas forma a linha de base, sem novidades,
+        para não alertar sobre toda a listagem atual. A linha de base fica registrada mesmo
+        se a listagem vier vazia, para que a primeira publicação depois dela gere alerta;
+        por isso só deve receber listagens bem-sucedidas.
+        
+        Args:
+            categoria: Chave da categoria verificada
+            itens: Publicações listadas
+        
+        Returns:
+            Publicações novas
+        """
+        agora = datetime.now().isoformat(timespec='seconds')
+        novos = []
+        
+        with self._lock, self._conectar() as conn:
+            linha_de_base = conn.execute(
+                "INSERT OR IGNORE INTO linhas_de_base (categoria, formada_em) VALUES (?, ?)",
+                (categoria, agora)
+            ).rowcount == 1
+            
+            for item in itens:
+                cursor = conn.execute("""
+                    INSERT OR IGNORE INTO links_vistos (link, categoria, titulo, data, visto_em)
+                    VALUES (?, ?, ?, ?, ?)
+                """, (item.link, categoria, item.titulo, item.data, agora))
+                if cursor.rowcount:
+                    novos.append(item)
+        
+        if linha_de_base:
+            self.logger.info(f"Linha de base de {categoria}: {len(novos)} link(s) registrados")
+            return []
+        return novos
@@ -0,0 +1,164 @@
+"""
+Registro persistente das execuções diárias
+Guarda, por data de referência, o resultado de cada relatório para permitir a recuperação de dias perdidos
+"""
+
+import sqlite3
+import logging
+import threading
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional
+
+
+# Situações que encerram um dia (erros são tentados novamente na recuperação);
+# 'outra_instancia' indica relatório produzido por outra réplica do agendador
+STATUS_CONCLUIDOS = ('sucesso', 'sem_dados', 'outra_instancia')
+
+
+class RegistroExecucoes:
+    """Tabela execucoes_diarias em SQLite, compartilhada com o job store do agendador"""
+    
+    def __init__(self, caminho_db):
+        """
+        Inicializa o registro
+        
+        Args:
+            caminho_db: Caminho do banco SQLite
+        """
+        self.caminho_db = Path(caminho_db)
+        self.caminho_db.parent.mkdir(parents=True, exist_ok=True)
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+        self._criar_tabela()
+    
+    def _conectar(self) -> sqlite3.Connection:
+        """Abre uma conexão com o banco"""
+        return sqlite3.connect(str(self.caminho_db), timeout=30)
+    
+    def _criar_tabela(self):
+        """Cria a tabela de execuções, se necessário"""
+        with self._conectar() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS execucoes_diarias (
+                    data_referencia TEXT PRIMARY KEY,
+                    status TEXT NOT NULL,
+                    inicio TEXT NOT NULL,
+                    fim TEXT,
+                    itens INTEGER DEFAULT 0,
+                    erro TEXT,
+                    tentativas INTEGER DEFAULT 0
+                )
+            """)
+    
+    @staticmethod
+    def _chave(data_referencia: date) -> str:
+        """Datas são gravadas em ISO para que a ordenação textual seja cronológica"""
+        return data_referencia.isoformat()
+    
+    def iniciar(self, data_referencia: date):
+        """
+        Marca o início da execução de uma data
+        
+        Args:
+            data_referencia: Dia a que o relatório se refere
+        """
+        with self._lock, self._conectar() as conn:
+            conn.execute("""
+                INSERT INTO execucoes_diarias (data_referencia, status, inicio, tentativas)
+                VALUES (?, 'em_andamento', ?, 1)
+                ON CONFLICT(data_referencia) DO UPDATE SET
+                    status = 'em_andamento', inicio = excluded.inicio, fim = NULL,
+                    erro = NULL, tentativas = tentativas + 1
+            """, (self._chave(data_referencia), datetime.now().isoformat(timespec='seconds')))
+    
+    def concluir(self, data_referencia: date, status: str, itens: int = 0, erro: Optional[str] = None):
+        """
+        Registra o resultado da execução de uma data
+        
+        Args:
+            data_referencia: Dia a que o relatório se refere
+            status: 'sucesso', 'sem_dados', 'outra_instancia' ou 'erro'
+            itens: Publicações incluídas no relatório
+            erro: Mensagem de erro (opcional)
+        """
+        with self._lock, self._conectar() as conn:
+            conn.execute("""
+                UPDATE execucoes_diarias SET status = ?, fim = ?, itens = ?, erro = ?
+                WHERE data_referencia = ?
+            """, (
+                status, datetime.now().isoformat(timespec='seconds'), itens, erro,
+                self._chave(data_referencia)
+            ))
+    
+    def concluida(self, data_referencia: date) -> bool:
+        """Indica se o relatório da data já foi produzido"""
+        with self._conectar() as conn:
+            linha = conn.execute(
+                "SELECT status FROM execucoes_diarias WHERE data_referencia = ?",
+                (self._chave(data_referencia),)
+            ).fetchone()
+        return bool(linha) and linha[0] in STATUS_CONCLUIDOS
+    
+    def datas_pendentes(self, ultima_devida: date, max_dias: int) -> List[date]:
+        """
+        Lista as datas que deveriam ter relatório e não têm
+        
+        Só considera dias posteriores à primeira execução registrada, para que uma
+        instalação nova não dispare relatórios retroativos.
+        
+        Args:
+            ultima_devida: Data de referência da última execução agendada que já passou
+            max_dias: Janela máxima de recuperação
+        
+        Returns:
+            Datas pendentes em ordem cronológica
+        """
+        if max_dias <= 0:
+            return []
+        
+        with self._conectar() as conn:
+            primeira = conn.execute("SELECT MIN(data_referencia) FROM execucoes_diarias").fetchone()[0]
+            if primeira is None:
+                return []
+            
+            inicio = max(date.fromisoformat(primeira), ultima_devida - timedelta(days=max_dias - 1))
+            concluidas = {
+                linha[0] for linha in conn.execute(
+                    f"SELECT data_referencia FROM execucoes_diarias "
+                    f"WHERE status IN ({', '.join('?' * len(STATUS_CONCLUIDOS))})",
+                    STATUS_CONCLUIDOS
+                )
+            }
+        
+        pendentes = []
+        dia = inicio
+        while dia <= ultima_devida:
+            if self._chave(dia) not in concluidas:
+                pendentes.append(dia)
+            dia += timedelta(days=1)
+        return pendentes
+    
+    def ultimas(self, limite: int = 10) -> List[Dict]:
+        """
+        Lista as execuções mais recentes
+        
+        Args:
+            limite: Número máximo de registros
+        
+        Returns:
+            Lista de dicionários, da data mais recente para a mais antiga
+        """
+        with self._conectar() as conn:
+            conn.row_factory = sqlite3.Row
+            linhas = conn.execute(
+                "SELECT * FROM execucoes_diarias ORDER BY data_referencia DESC LIMIT ?", (limite,)
+            ).fetchall()
+        return [dict(linha) for linha in linhas]
+    
+    def contagem_por_status(self) -> Dict[str, int]:
+        """Quantidade de dias registrados por situação"""
+        with self._conectar() as conn:
+            return dict(conn.execute(
+                "SELECT status, COUNT(*) FROM execucoes_diarias GROUP BY status"
+            ).fetchall())
@@ -3,15 +3,33 @@ Módulo Scheduler - Agendamento de Tarefas
 """
 
 import logging
+import pickle
+import signal
+import sqlite3
+import threading
 import time
-from datetime import datetime
-from typing import Callable, Optional
+from datetime import date, datetime, timedelta
+from typing import Callable, Dict, List, Optional
 from apscheduler.schedulers.blocking import BlockingScheduler
+from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.interval import IntervalTrigger
+from apscheduler.executors.base import run_job
+from apscheduler.executors.pool import ThreadPoolExecutor
+from apscheduler.events import (
+    EVENT_SCHEDULER_STARTED, EVENT_JOB_SUBMITTED, EVENT_JOB_EXECUTED, EVENT_JOB_ERROR, EVENT_JOB_MISSED
+)
+from apscheduler.util import obj_to_ref
 import pytz
 import sys
 import os
 
+try:
+    from apscheduler.jobstores.sqlalchemy import SQLAlchemyJobStore
+    SQLALCHEMY_AVAILABLE = True
+except ImportError:
+    SQLALCHEMY_AVAILABLE = False
+
 # Adiciona o diretório raiz ao path
 root_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 if root_dir not in sys.path:
@@ -19,40 +37,111 @@ if root_dir not in sys.path:
 
 try:
     from config.config import Config
+    from config.logging_config import configurar_logging
 except ImportError:
+    def configurar_logging(config=None):
+        logging.basicConfig(level=logging.INFO)
+    
     # Fallback para configuração básica
     class Config:
         FUSO_HORARIO = "America/Sao_Paulo"
         HORA_EXECUCAO = "07:00"
+        AGENDADOR_DB_PATH = None
+        AGENDADOR_WORKERS = 4
+        MISFIRE_GRACE_TIME = 3600
+
+
+def _executar_medindo(job, jobstore_alias, run_times, logger_name):
+    """run_job do APScheduler, anotando nos eventos a duração medida na própria thread"""
+    inicio = time.monotonic()
+    eventos = run_job(job, jobstore_alias, run_times, logger_name)
+    duracao = time.monotonic() - inicio
+    for evento in eventos:
+        evento.duracao_s = duracao
+    return eventos
+
+
+class ExecutorMedido(ThreadPoolExecutor):
+    """
+    Pool de threads que mede a duração real das tarefas
+    
+    O horário agendado inclui a espera na fila do pool e o atraso de misfire, e o
+    evento de submissão pode chegar depois do fim de uma tarefa rápida; medir em
+    volta do run_job dá só o tempo de execução.
+    """
+    
+    def _do_submit_job(self, job, run_times):
+        def callback(futuro):
+            excecao = futuro.exception()
+            if excecao:
+                self._run_job_error(job.id, excecao, excecao.__traceback__)
+            else:
+                self._run_job_success(job.id, futuro.result())
+        
+        futuro = self._pool.submit(_executar_medindo, job, job._jobstore_alias, run_times, self._logger.name)
+        futuro.add_done_callback(callback)
 
 
 class TaskScheduler:
     """Agendador de tarefas usando APScheduler"""
     
-    def __init__(self, config: Optional[Config] = None):
+    PREFIXO_POLLING = 'polling_'
+    # Execuções disparadas pela API de controle contam nas estatísticas da tarefa original
+    SUFIXO_MANUAL = '_manual'
+    
+    def __init__(self, config: Optional[Config] = None, em_segundo_plano: bool = False):
         """
         Inicializa o agendador
         
         Args:
             config: Objeto de configuração
+            em_segundo_plano: Usa BackgroundScheduler, deixando a thread principal livre
         """
         self.config = config or Config()
-        self.scheduler = BlockingScheduler(timezone=pytz.timezone(self.config.FUSO_HORARIO))
+        self.em_segundo_plano = em_segundo_plano
         self.setup_logging()
+        
+        # Job store persistente: tarefas e horários sobrevivem a reinicializações
+        self.caminho_db = self.config.AGENDADOR_DB_PATH
+        jobstores = {}
+        if self.caminho_db and SQLALCHEMY_AVAILABLE:
+            jobstores['default'] = SQLAlchemyJobStore(url=f"sqlite:///{self.caminho_db}")
+        elif self.caminho_db:
+            self.logger.warning(
+                "SQLAlchemy não está instalado; tarefas ficarão apenas em memória. "
+                "Execute: pip install sqlalchemy"
+            )
+        
+        # Tarefas em threads: a verificação de novidades roda enquanto o relatório diário é gerado
+        classe_agendador = BackgroundScheduler if em_segundo_plano else BlockingScheduler
+        self.scheduler = classe_agendador(
+            jobstores=jobstores,
+            executors={'default': ExecutorMedido(self.config.AGENDADOR_WORKERS)},
+            job_defaults={
+                'coalesce': True,
+                'max_instances': 1,
+                'misfire_grace_time': self.config.MISFIRE_GRACE_TIME
+            },
+            timezone=pytz.timezone(self.config.FUSO_HORARIO)
+        )
+        
+        self._ids_polling: Optional[set] = None
+        self.scheduler.add_listener(self._remover_polling_obsoleto, EVENT_SCHEDULER_STARTED)
+        
+        # Estatísticas por tarefa (execuções, falhas, duração da última execução)
+        self.estatisticas: Dict[str, Dict] = {}
+        # Saldo submetidas - concluídas: o APScheduler pode emitir o fim antes da submissão
+        self._em_execucao: Dict[str, int] = {}
+        self._lock_estatisticas = threading.Lock()
+        self._parada = threading.Event()
+        self.scheduler.add_listener(
+            self._registrar_evento,
+            EVENT_JOB_SUBMITTED | EVENT_JOB_EXECUTED | EVENT_JOB_ERROR | EVENT_JOB_MISSED
+        )
     
     def setup_logging(self):
-        """Configura logging"""
-        log_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'logs')
-        os.makedirs(log_dir, exist_ok=True)
-        
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(os.path.join(log_dir, 'scheduler.log')),
-                logging.StreamHandler()
-            ]
-        )
+        """Configura logging (compartilhado; ver config.logging_config)"""
+        configurar_logging(self.config)
         self.logger = logging.getLogger(__name__)
     
     def agendar_tarefa_diaria(
@@ -70,15 +159,22 @@ class TaskScheduler:
             minuto: Minuto da execução (formato MM)
         """
         try:
-            hora_int = int(hora.split(':')[0]) if ':' in hora else int(hora)
-            minuto_int = int(minuto) if minuto else 0
+            hora_int, minuto_int = self._hora_minuto(hora, minuto)
+            trigger = CronTrigger(hour=hora_int, minute=minuto_int, timezone=self.scheduler.timezone)
             
-            if ':' in hora:
-                hora_int, minuto_int = map(int, hora.split(':'))
+            # Mantém a tarefa persistida se nada mudou: preserva o next_run_time vencido,
+            # que o APScheduler executa uma vez (coalesce) dentro do misfire_grace_time
+            persistida = self._tarefa_persistida('tarefa_diaria_bacen')
+            if (persistida and persistida.get('func') == obj_to_ref(funcao)
+                    and str(persistida.get('trigger')) == str(trigger)):
+                self.logger.info(
+                    f"Tarefa diária persistida mantida (próxima execução: {persistida.get('next_run_time')})"
+                )
+                return
             
             self.scheduler.add_job(
                 funcao,
-                trigger=CronTrigger(hour=hora_int, minute=minuto_int),
+                trigger=trigger,
                 id='tarefa_diaria_bacen',
                 name='Monitoramento Diário BACEN',
                 replace_existing=True
@@ -90,15 +186,252 @@ class TaskScheduler:
             self.logger.error(f"Erro ao agendar tarefa: {str(e)}")
             raise
     
+    @staticmethod
+    def _hora_minuto(hora: str, minuto: str = "00") -> tuple:
+        """Converte "HH:MM" (ou hora e minuto separados) em inteiros"""
+        if ':' in hora:
+            hora_int, minuto_int = map(int, hora.split(':'))
+            return hora_int, minuto_int
+        return int(hora), int(minuto) if minuto else 0
+    
+    def _tarefa_persistida(self, job_id: str) -> Optional[dict]:
+        """
+        Lê o estado de uma tarefa no job store SQLite antes de o agendador iniciar
+        
+        Args:
+            job_id: ID da tarefa
+        
+        Returns:
+            Estado da tarefa (func, trigger, next_run_time...) ou None
+        """
+        if not self.caminho_db or not SQLALCHEMY_AVAILABLE or not os.path.exists(self.caminho_db):
+            return None
+        
+        try:
+            with sqlite3.connect(str(self.caminho_db)) as conn:
+                # Antes da primeira inicialização o job store ainda não criou a tabela
+                if not conn.execute(
+                    "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'apscheduler_jobs'"
+                ).fetchone():
+                    return None
+                linha = conn.execute(
+                    "SELECT job_state FROM apscheduler_jobs WHERE id = ?", (job_id,)
+                ).fetchone()
+            return pickle.loads(linha[0]) if linha else None
+        except (sqlite3.Error, pickle.UnpicklingError, AttributeError, ImportError) as e:
+            self.logger.warning(f"Não foi possível ler a tarefa persistida {job_id}: {str(e)}")
+            return None
+    
+    def ultima_referencia_devida(self) -> date:
+        """
+        Data de referência da última execução diária que já deveria ter ocorrido
+        
+        Returns:
+            Ontem, se o horário de hoje já passou; senão, anteontem
+        """
+        hora_int, minuto_int = self._hora_minuto(self.config.HORA_EXECUCAO)
+        agora = datetime.now(pytz.timezone(self.config.FUSO_HORARIO))
+        execucao_hoje = agora.replace(hour=hora_int, minute=minuto_int, second=0, microsecond=0)
+        
+        ultima_execucao = agora.date() if agora >= execucao_hoje else agora.date() - timedelta(days=1)
+        return ultima_execucao - timedelta(days=1)
+    
+    def agendar_recuperacao(self, funcao: Callable, datas: List[date]):
+        """
+        Agenda uma execução imediata que reprocessa as datas perdidas, em ordem
+        
+        Args:
+            funcao: Função que recebe a lista de datas (formato DD/MM/YYYY)
+            datas: Datas de referência pendentes
+        """
+        if not datas:
+            return
+        
+        datas_str = [d.strftime("%d/%m/%Y") for d in datas]
+        self.scheduler.add_job(
+            funcao,
+            trigger='date',
+            args=[datas_str],
+            id='recuperacao_execucoes',
+            name='Recuperação de execuções perdidas',
+            replace_existing=True,
+            misfire_grace_time=None
+        )
+        self.logger.info(f"Recuperação agendada para {len(datas_str)} dia(s): {', '.join(datas_str)}")
+    
+    def agendar_tarefa_intervalo(
+        self,
+        funcao: Callable,
+        minutos: int,
+        job_id: str,
+        nome: str,
+        args: Optional[list] = None,
+        jitter: Optional[int] = None
+    ):
+        """
+        Agenda uma tarefa recorrente em intervalo fixo
+        
+        Args:
+            funcao: Função a ser executada (nível de módulo, para o job store persistente)
+            minutos: Intervalo entre execuções
+            job_id: ID da tarefa
+            nome: Nome legível
+            args: Argumentos posicionais da função
+            jitter: Variação aleatória (s) do horário, para espalhar tarefas simultâneas
+        """
+        self.scheduler.add_job(
+            funcao,
+            trigger=IntervalTrigger(minutes=minutos, jitter=jitter, timezone=self.scheduler.timezone),
+            args=args or [],
+            id=job_id,
+            name=nome,
+            replace_existing=True,
+            # Uma verificação atrasada ainda vale até o horário da seguinte
+            misfire_grace_time=minutos * 60
+        )
+        self.logger.info(f"Tarefa {job_id} agendada a cada {minutos} minuto(s)")
+    
+    def agendar_polling_categorias(self, funcao: Callable, chaves: List[str], minutos: int):
+        """
+        Agenda uma verificação de novidades por categoria
+        
+        Args:
+            funcao: Função que recebe a chave da categoria
+            chaves: Categorias verificadas
+            minutos: Intervalo entre verificações (0 desativa)
+        """
+        chaves = chaves if minutos > 0 else []
+        self._ids_polling = {f"{self.PREFIXO_POLLING}{chave}" for chave in chaves}
+        
+        for chave in chaves:
+            self.agendar_tarefa_intervalo(
+                funcao,
+                minutos,
+                job_id=f"{self.PREFIXO_POLLING}{chave}",
+                nome=f"Verificação de novidades: {chave}",
+                args=[chave],
+                jitter=min(60, minutos * 6)
+            )
+    
+    def _remover_polling_obsoleto(self, evento):
+        """Remove do job store verificações de categorias que deixaram de ser configuradas"""
+        if self._ids_polling is None:
+            return
+        
+        for job in self.scheduler.get_jobs():
+            if job.id.startswith(self.PREFIXO_POLLING) and job.id not in self._ids_polling:
+                self.remover_tarefa(job.id)
+    
+    def _registrar_evento(self, evento):
+        """Atualiza as estatísticas da tarefa a partir dos eventos do APScheduler"""
+        agora = time.time()
+        job_id = evento.job_id
+        if job_id.endswith(self.SUFIXO_MANUAL):
+            job_id = job_id[:-len(self.SUFIXO_MANUAL)]
+        
+        with self._lock_estatisticas:
+            stats = self.estatisticas.setdefault(job_id, {
+                'execucoes': 0, 'falhas': 0, 'perdidas': 0, 'em_execucao': 0,
+                'ultima_execucao': None, 'ultima_duracao_s': None, 'ultimo_erro': None
+            })
+            
+            if evento.code == EVENT_JOB_SUBMITTED:
+                self._em_execucao[job_id] = self._em_execucao.get(job_id, 0) + 1
+            elif evento.code == EVENT_JOB_MISSED:
+                stats['perdidas'] += 1
+            else:
+                self._em_execucao[job_id] = self._em_execucao.get(job_id, 0) - 1
+                stats['execucoes'] += 1
+                stats['ultima_execucao'] = agora
+                duracao = getattr(evento, 'duracao_s', None)
+                stats['ultima_duracao_s'] = round(duracao, 3) if duracao is not None else None
+                if evento.code == EVENT_JOB_ERROR:
+                    stats['falhas'] += 1
+                    stats['ultimo_erro'] = str(evento.exception)
+            
+            stats['em_execucao'] = max(0, self._em_execucao.get(job_id, 0))
+    
+    def descrever_tarefas(self) -> List[Dict]:
+        """
+        Descreve as tarefas agendadas com suas estatísticas
+        
+        Returns:
+            Lista de dicionários (id, nome, gatilho, próxima execução, pausada, estatísticas)
+        """
+        with self._lock_estatisticas:
+            estatisticas = {job_id: dict(stats) for job_id, stats in self.estatisticas.items()}
+        
+        return [
+            {
+                'id': job.id,
+                'nome': job.name,
+                'gatilho': str(job.trigger),
+                'proxima_execucao': job.next_run_time.isoformat() if job.next_run_time else None,
+                'pausada': job.next_run_time is None,
+                'estatisticas': estatisticas.get(job.id, {})
+            }
+            for job in self.scheduler.get_jobs()
+        ]
+    
+    def disparar_agora(self, job_id: str):
+        """
+        Executa uma tarefa imediatamente, sem alterar seu agendamento
+        
+        Args:
+            job_id: ID da tarefa
+        
+        Raises:
+            KeyError: Se a tarefa não existir
+        """
+        job = self.scheduler.get_job(job_id)
+        if job is None:
+            raise KeyError(job_id)
+        
+        self.scheduler.add_job(
+            job.func,
+            trigger='date',
+            args=job.args,
+            kwargs=job.kwargs,
+            id=f"{job_id}{self.SUFIXO_MANUAL}",
+            name=f"{job.name} (manual)",
+            replace_existing=True,
+            misfire_grace_time=None
+        )
+        self.logger.info(f"Execução manual de {job_id} solicitada")
+    
+    def pausar_tarefa(self, job_id: str):
+        """Suspende uma tarefa (o estado pausado fica no job store)"""
+        self.scheduler.pause_job(job_id)
+        self.logger.info(f"Tarefa {job_id} pausada")
+    
+    def retomar_tarefa(self, job_id: str):
+        """Retoma uma tarefa pausada"""
+        self.scheduler.resume_job(job_id)
+        self.logger.info(f"Tarefa {job_id} retomada")
+    
+    def solicitar_parada(self, *args):
+        """Encerra o agendador em segundo plano (também usado como tratador de SIGTERM)"""
+        self._parada.set()
+    
     def executar(self):
-        """Inicia o agendador em modo bloqueante"""
+        """Inicia o agendador (bloqueante ou em segundo plano, aguardando a parada)"""
         try:
             self.logger.info("Iniciando agendador de tarefas...")
             self.logger.info(f"Fuso horário: {self.config.FUSO_HORARIO}")
             self.logger.info(f"Horário de execução: {self.config.HORA_EXECUCAO}")
+            if self._ids_polling:
+                self.logger.info(f"Verificação de novidades: {', '.join(sorted(self._ids_polling))}")
             
             self.scheduler.start()
             
+            if self.em_segundo_plano:
+                if threading.current_thread() is threading.main_thread():
+                    signal.signal(signal.SIGTERM, self.solicitar_parada)
+                while not self._parada.wait(1):
+                    pass
+                self.logger.info("Parada solicitada; encerrando agendador")
+                self.scheduler.shutdown()
+            
         except KeyboardInterrupt:
             self.logger.info("Agendador interrompido pelo usuário")
             self.scheduler.shutdown()
@@ -123,6 +456,13 @@ class TaskScheduler:
         self.logger.info(f"Tarefas agendadas: {len(jobs)}")
         for job in jobs:
             self.logger.info(f"  - {job.id}: {job.name} - Próxima execução: {job.next_run_time}")
+            stats = self.estatisticas.get(job.id)
+            if stats and stats['ultima_execucao']:
+                ultima = datetime.fromtimestamp(stats['ultima_execucao']).strftime('%d/%m %H:%M:%S')
+                self.logger.info(
+                    f"      Última execução: {ultima} ({stats['ultima_duracao_s']}s) - "
+                    f"{stats['execucoes']} execução(ões), {stats['falhas']} falha(s)"
+                )
         return jobs
     
     def remover_tarefa(self, job_id: str):
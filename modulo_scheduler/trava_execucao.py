@@ -0,0 +1,397 @@
+"""
+Trava de execução com concessão (lease) e token de cercamento (fencing)
+Impede que réplicas do agendador produzam o mesmo relatório em paralelo
+
+Backends:
+    arquivo - flock num diretório local (várias instâncias no mesmo host)
+    sqlite  - tabela travas_execucao; substituto local do Redis com a mesma semântica
+    redis   - SET NX PX com token em INCR (várias máquinas)
+
+Uma concessão dura TRAVA_TTL_SEGUNDOS e é renovada em segundo plano enquanto a
+execução avança. O token cresce a cada aquisição; antes de cada gravação visível
+(PDF, arquivo, Parquet, email) a execução confirma que o token ainda é o vigente. Ao concluir, a chave
+fica marcada como concluída por TRAVA_RETENCAO_HORAS, para que outra réplica não
+refaça o mesmo relatório logo depois.
+"""
+
+import os
+import json
+import time
+import uuid
+import socket
+import sqlite3
+import logging
+import threading
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+try:
+    import fcntl
+    FCNTL_AVAILABLE = True
+except ImportError:
+    FCNTL_AVAILABLE = False
+    import msvcrt
+
+try:
+    import redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+
+class TravaOcupada(Exception):
+    """A chave está com outra instância (ou já foi concluída por ela)"""
+    
+    def __init__(self, nome: str, concluida: bool = False):
+        self.nome = nome
+        self.concluida = concluida
+        situacao = "já concluída" if concluida else "em uso"
+        super().__init__(f"Trava {nome} {situacao} por outra instância")
+
+
+class ConcessaoPerdida(Exception):
+    """A concessão expirou ou foi tomada por outra instância durante a execução"""
+
+
+@dataclass
+class Concessao:
+    """Concessão obtida sobre uma chave"""
+    nome: str
+    dono: str
+    token: int
+    concluida: bool = False
+    perdida: bool = False
+    recurso: Any = field(default=None, repr=False)
+
+
+class TravaExecucao(ABC):
+    """Classe base abstrata dos backends: aquisição, renovação periódica e liberação"""
+    
+    def __init__(self, ttl_segundos: int = 600, retencao_horas: int = 48):
+        """
+        Inicializa a trava
+        
+        Args:
+            ttl_segundos: Duração de cada concessão
+            retencao_horas: Tempo em que uma chave concluída continua bloqueada
+        """
+        self.ttl = ttl_segundos
+        self.retencao = retencao_horas * 3600
+        self.dono = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.logger = logging.getLogger(__name__)
+    
+    @abstractmethod
+    def adquirir(self, nome: str) -> Concessao:
+        """
+        Obtém a concessão de uma chave
+        
+        Raises:
+            TravaOcupada: Se outra instância detém ou já concluiu a chave
+        """
+        pass
+    
+    @abstractmethod
+    def renovar(self, concessao: Concessao) -> bool:
+        """Prorroga a concessão; False se ela não pertence mais a esta instância"""
+        pass
+    
+    @abstractmethod
+    def liberar(self, concessao: Concessao):
+        """Libera a chave (ou a marca como concluída, se concessao.concluida)"""
+        pass
+    
+    @abstractmethod
+    def _vigente(self, concessao: Concessao) -> bool:
+        """Confere no backend se o token da concessão ainda é o vigente"""
+        pass
+    
+    def validar(self, concessao: Concessao):
+        """
+        Confirma a concessão antes de um efeito externo
+        
+        Raises:
+            ConcessaoPerdida: Se a concessão expirou ou foi tomada
+        """
+        if concessao.perdida or not self._vigente(concessao):
+            concessao.perdida = True
+            raise ConcessaoPerdida(f"Concessão {concessao.nome} (token {concessao.token}) não é mais válida")
+    
+    @contextmanager
+    def manter(self, nome: str) -> Iterator[Concessao]:
+        """
+        Adquire a chave, renova a concessão em segundo plano e libera ao sair
+        
+        Marque concessao.concluida = True dentro do bloco para reter a chave como concluída.
+        
+        Args:
+            nome: Chave da trava (ex.: relatorio_2024-10-18)
+        
+        Raises:
+            TravaOcupada: Se outra instância detém ou já concluiu a chave
+        """
+        concessao = self.adquirir(nome)
+        self.logger.info(f"Trava {nome} adquirida (token {concessao.token})")
+        parar = threading.Event()
+        
+        def renovar_periodicamente():
+            while not parar.wait(self.ttl / 3):
+                try:
+                    renovada = self.renovar(concessao)
+                except Exception as e:
+                    self.logger.warning(f"Erro ao renovar trava {nome}: {str(e)}")
+                    continue
+                if not renovada:
+                    concessao.perdida = True
+                    self.logger.error(f"Concessão da trava {nome} perdida (token {concessao.token})")
+                    return
+        
+        renovacao = threading.Thread(target=renovar_periodicamente, name=f"trava-{nome}", daemon=True)
+        renovacao.start()
+        try:
+            yield concessao
+        finally:
+            parar.set()
+            renovacao.join()
+            if concessao.perdida:
+                concessao.concluida = False
+            try:
+                self.liberar(concessao)
+            except Exception as e:
+                self.logger.warning(f"Erro ao liberar trava {nome}: {str(e)}")
+
+
+class TravaArquivo(TravaExecucao):
+    """flock por chave; o estado (token, conclusão) fica num JSON ao lado do arquivo de trava"""
+    
+    def __init__(self, diretorio, **kwargs):
+        """
+        Args:
+            diretorio: Diretório dos arquivos de trava (local ao host)
+        """
+        super().__init__(**kwargs)
+        self.diretorio = Path(diretorio)
+        self.diretorio.mkdir(parents=True, exist_ok=True)
+    
+    def _estado(self, nome: str) -> dict:
+        caminho = self.diretorio / f"{nome}.json"
+        try:
+            return json.loads(caminho.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return {}
+    
+    def _gravar_estado(self, nome: str, estado: dict):
+        caminho = self.diretorio / f"{nome}.json"
+        temporario = caminho.with_suffix('.tmp')
+        temporario.write_text(json.dumps(estado), encoding='utf-8')
+        os.replace(temporario, caminho)
+    
+    @staticmethod
+    def _travar(arquivo) -> bool:
+        """Trava o arquivo sem bloquear"""
+        try:
+            if FCNTL_AVAILABLE:
+                fcntl.flock(arquivo.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            else:
+                arquivo.seek(0)
+                msvcrt.locking(arquivo.fileno(), msvcrt.LK_NBLCK, 1)
+            return True
+        except OSError:
+            return False
+    
+    @staticmethod
+    def _destravar(arquivo):
+        if FCNTL_AVAILABLE:
+            fcntl.flock(arquivo.fileno(), fcntl.LOCK_UN)
+        else:
+            arquivo.seek(0)
+            msvcrt.locking(arquivo.fileno(), msvcrt.LK_UNLCK, 1)
+    
+    def adquirir(self, nome: str) -> Concessao:
+        arquivo = open(self.diretorio / f"{nome}.lock", 'a+')
+        if not self._travar(arquivo):
+            arquivo.close()
+            raise TravaOcupada(nome)
+        
+        estado = self._estado(nome)
+        if estado.get('concluida') and estado.get('expira_em', 0) > time.time():
+            self._destravar(arquivo)
+            arquivo.close()
+            raise TravaOcupada(nome, concluida=True)
+        
+        token = estado.get('token', 0) + 1
+        self._gravar_estado(nome, {'dono': self.dono, 'token': token, 'concluida': False})
+        return Concessao(nome, self.dono, token, recurso=arquivo)
+    
+    def renovar(self, concessao: Concessao) -> bool:
+        # O flock dura enquanto o processo viver; basta conferir o token
+        return self._vigente(concessao)
+    
+    def liberar(self, concessao: Concessao):
+        try:
+            if concessao.concluida:
+                self._gravar_estado(concessao.nome, {
+                    'dono': concessao.dono, 'token': concessao.token,
+                    'concluida': True, 'expira_em': time.time() + self.retencao
+                })
+        finally:
+            self._destravar(concessao.recurso)
+            concessao.recurso.close()
+    
+    def _vigente(self, concessao: Concessao) -> bool:
+        estado = self._estado(concessao.nome)
+        return estado.get('token') == concessao.token and estado.get('dono') == concessao.dono
+
+
+class TravaSQLite(TravaExecucao):
+    """Tabela travas_execucao; mesma semântica do backend Redis, para um único host ou disco compartilhado"""
+    
+    def __init__(self, caminho_db, **kwargs):
+        """
+        Args:
+            caminho_db: Caminho do banco SQLite
+        """
+        super().__init__(**kwargs)
+        self.caminho_db = Path(caminho_db)
+        self.caminho_db.parent.mkdir(parents=True, exist_ok=True)
+        with self._conectar() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS travas_execucao (
+                    nome TEXT PRIMARY KEY,
+                    dono TEXT NOT NULL,
+                    token INTEGER NOT NULL,
+                    expira_em REAL NOT NULL,
+                    concluida INTEGER DEFAULT 0
+                )
+            """)
+    
+    def _conectar(self) -> sqlite3.Connection:
+        """Abre uma conexão com o banco"""
+        return sqlite3.connect(str(self.caminho_db), timeout=30)
+    
+    def adquirir(self, nome: str) -> Concessao:
+        conn = self._conectar()
+        conn.isolation_level = None
+        try:
+            # BEGIN IMMEDIATE serializa leitura e escrita entre processos
+            conn.execute("BEGIN IMMEDIATE")
+            linha = conn.execute(
+                "SELECT token, expira_em, concluida FROM travas_execucao WHERE nome = ?", (nome,)
+            ).fetchone()
+            agora = time.time()
+            
+            if linha and linha[1] > agora:
+                conn.execute("ROLLBACK")
+                raise TravaOcupada(nome, concluida=bool(linha[2]))
+            
+            token = (linha[0] if linha else 0) + 1
+            conn.execute("""
+                INSERT OR REPLACE INTO travas_execucao (nome, dono, token, expira_em, concluida)
+                VALUES (?, ?, ?, ?, 0)
+            """, (nome, self.dono, token, agora + self.ttl))
+            conn.execute("COMMIT")
+            return Concessao(nome, self.dono, token)
+        finally:
+            conn.close()
+    
+    def _atualizar(self, concessao: Concessao, expira_em: float, concluida: bool = False) -> bool:
+        with self._conectar() as conn:
+            cursor = conn.execute("""
+                UPDATE travas_execucao SET expira_em = ?, concluida = ?
+                WHERE nome = ? AND dono = ? AND token = ? AND concluida = 0
+            """, (expira_em, int(concluida), concessao.nome, concessao.dono, concessao.token))
+            return cursor.rowcount == 1
+    
+    def renovar(self, concessao: Concessao) -> bool:
+        return self._atualizar(concessao, time.time() + self.ttl)
+    
+    def liberar(self, concessao: Concessao):
+        # A linha é mantida (expirada) para que o token continue crescendo
+        if concessao.concluida:
+            self._atualizar(concessao, time.time() + self.retencao, concluida=True)
+        else:
+            self._atualizar(concessao, 0)
+    
+    def _vigente(self, concessao: Concessao) -> bool:
+        with self._conectar() as conn:
+            return conn.execute("""
+                SELECT 1 FROM travas_execucao
+                WHERE nome = ? AND dono = ? AND token = ? AND concluida = 0 AND expira_em > ?
+            """, (concessao.nome, concessao.dono, concessao.token, time.time())).fetchone() is not None
+
+
+class TravaRedis(TravaExecucao):
+    """SET NX PX por chave, com o token de cercamento num contador INCR"""
+    
+    # Operações condicionadas ao valor atual (só o dono renova ou libera)
+    _RENOVAR = "if redis.call('get', KEYS[1]) == ARGV[1] then return redis.call('pexpire', KEYS[1], ARGV[2]) end return 0"
+    _LIBERAR = "if redis.call('get', KEYS[1]) == ARGV[1] then return redis.call('del', KEYS[1]) end return 0"
+    _CONCLUIR = (
+        "if redis.call('get', KEYS[1]) == ARGV[1] then "
+        "return redis.call('set', KEYS[1], ARGV[2], 'PX', ARGV[3]) end return 0"
+    )
+    
+    def __init__(self, url: str, prefixo: str = "bacen:trava:", **kwargs):
+        """
+        Args:
+            url: URL do Redis (ex.: redis://host:6379/0)
+            prefixo: Prefixo das chaves
+        """
+        if not REDIS_AVAILABLE:
+            raise ImportError("Backend de trava 'redis' requer o pacote redis (pip install redis)")
+        super().__init__(**kwargs)
+        self.cliente = redis.Redis.from_url(url, decode_responses=True)
+        self.prefixo = prefixo
+    
+    @staticmethod
+    def _valor(concessao: Concessao) -> str:
+        return f"{concessao.dono}|{concessao.token}"
+    
+    def adquirir(self, nome: str) -> Concessao:
+        chave = self.prefixo + nome
+        token = self.cliente.incr(f"{chave}:token")
+        concessao = Concessao(nome, self.dono, token)
+        if not self.cliente.set(chave, self._valor(concessao), nx=True, px=self.ttl * 1000):
+            atual = self.cliente.get(chave) or ''
+            raise TravaOcupada(nome, concluida=atual.startswith('concluida|'))
+        return concessao
+    
+    def renovar(self, concessao: Concessao) -> bool:
+        return bool(self.cliente.eval(
+            self._RENOVAR, 1, self.prefixo + concessao.nome, self._valor(concessao), self.ttl * 1000
+        ))
+    
+    def liberar(self, concessao: Concessao):
+        chave = self.prefixo + concessao.nome
+        if concessao.concluida:
+            self.cliente.eval(
+                self._CONCLUIR, 1, chave, self._valor(concessao),
+                f"concluida|{concessao.token}", self.retencao * 1000
+            )
+        else:
+            self.cliente.eval(self._LIBERAR, 1, chave, self._valor(concessao))
+    
+    def _vigente(self, concessao: Concessao) -> bool:
+        return self.cliente.get(self.prefixo + concessao.nome) == self._valor(concessao)
+
+
+def criar_trava(config) -> TravaExecucao:
+    """
+    Cria a trava configurada em TRAVA_BACKEND
+    
+    Args:
+        config: Objeto de configuração
+    
+    Returns:
+        Instância do backend
+    """
+    opcoes = {'ttl_segundos': config.TRAVA_TTL_SEGUNDOS, 'retencao_horas': config.TRAVA_RETENCAO_HORAS}
+    backend = config.TRAVA_BACKEND
+    
+    if backend == 'redis':
+        return TravaRedis(config.TRAVA_REDIS_URL, **opcoes)
+    if backend == 'sqlite':
+        return TravaSQLite(config.TRAVA_SQLITE_PATH, **opcoes)
+    return TravaArquivo(config.TRAVA_DIR, **opcoes)
@@ -1,8 +1,21 @@
 """
 Arquivo __init__.py para o módulo scraper
+
+BACENScraper é importado no primeiro acesso, para que quem só usa categorias,
+o cache HTTP ou o registro Publicacao não carregue o Selenium.
 """
 
-from .bacen_scraper import BACENScraper
+from typing import TYPE_CHECKING
+
+from config.importacao import carregar_preguicoso
+
+from .publicacao import Publicacao, publicacoes_de_json, publicacoes_para_json
+
+if TYPE_CHECKING:
+    from .bacen_scraper import BACENScraper
+
+_MODULOS = {'BACENScraper': '.bacen_scraper'}
 
-__all__ = ['BACENScraper']
+__all__ = ['BACENScraper', 'Publicacao', 'publicacoes_para_json', 'publicacoes_de_json']
 
+__getattr__, __dir__ = carregar_preguicoso(__name__, _MODULOS)
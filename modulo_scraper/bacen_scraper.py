@@ -4,21 +4,25 @@ Responsável por navegar no site do BACEN e extrair publicações do dia anterio
 """
 
 import os
-import time
 import logging
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
-from bs4 import BeautifulSoup
-import requests
+from typing import TYPE_CHECKING, Callable, List, Dict, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
 import sys
 
+from .http_cache import HTTPCache, RespostaCache
+from .extrator_conteudo import ExtratorConteudo, charset_do_content_type
+from .extrator_pdf import ExtratorPDF, e_pdf
+from .rate_limiter import LimitadorTaxa, OrcamentoExcedido, PoliticaRetry, SessaoLimitada
+from .driver_pool import WebDriverPool, criar_driver, obter_pool
+from .categorias import CategoriaNormativa, RegistroCategorias
+from .coletor_api import ColetorAPI
+from .publicacao import Publicacao
+
+# Selenium só é importado quando uma página é de fato navegada (o backend "api" não o usa)
+if TYPE_CHECKING:
+    from selenium import webdriver
+
 # Adiciona o diretório raiz ao path para importar config
 root_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 if root_dir not in sys.path:
@@ -26,46 +30,110 @@ if root_dir not in sys.path:
 
 try:
     from config.config import Config
+    from config.logging_config import configurar_logging
 except ImportError:
+    def configurar_logging(config=None):
+        logging.basicConfig(level=logging.INFO)
+    
     # Fallback para configuração básica se config não estiver disponível
     class Config:
         HEADLESS_MODE = True
+        NAVEGACAO_ENXUTA = True
         TIMEOUT_PAGINA = 30
-        DELAY_ENTRE_REQUISICOES = 2
+        TAXA_REQUISICOES = 2.0
+        RAJADA_REQUISICOES = 4
+        MAX_TENTATIVAS = 3
+        ORCAMENTO_REQUISICOES = 0
+        MAX_WORKERS_CONTEUDO = 4
+        CATEGORIAS_ATIVAS = ['comunicado', 'resolucao', 'circular']
+        SCRAPER_BACKEND = "selenium"
+        BACEN_API_URL = "https://www.bcb.gov.br/api"
+        API_ITENS_POR_PAGINA = 50
+        API_MAX_PAGINAS = 20
+        WEBDRIVER_POOL_ENABLED = False
+        WEBDRIVER_POOL_TAMANHO = 1
+        WEBDRIVER_MAX_USOS = 20
+        WEBDRIVER_MAX_MEMORIA_MB = 1024
         FUSO_HORARIO = "America/Sao_Paulo"
         BACEN_BASE_URL = "https://www.bcb.gov.br"
         BACEN_COMUNICADOS_URL = "https://www.bcb.gov.br/estabilidadefinanceira/comunicados"
         BACEN_RESOLUCOES_URL = "https://www.bcb.gov.br/estabilidadefinanceira/resolucoes"
         BACEN_CIRCULARES_URL = "https://www.bcb.gov.br/estabilidadefinanceira/circular"
+        HTTP_CACHE_ENABLED = False
+        HTTP_CACHE_DIR = "cache/http"
+        PDF_MAX_PAGINAS = 50
+        PDF_WORKERS = 2
+        PDF_MIN_CARACTERES_PAGINA = 1000
 
 
 class BACENScraper:
     """Scraper para coletar publicações do Banco Central do Brasil"""
     
-    def __init__(self, config: Optional[Config] = None):
+    # Devolve [href, texto] de todas as âncoras que casam com o seletor, em uma só ida e volta
+    SCRIPT_ANCORAS = """
+        return Array.from(document.querySelectorAll(arguments[0])).map(
+            a => [a.href, (a.innerText || '').trim()]
+        );
+    """
+    
+    HEADERS_HTTP = {
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+    }
+    
+    def __init__(
+        self,
+        config: Optional[Config] = None,
+        pool: Optional[WebDriverPool] = None,
+        limitador: Optional[LimitadorTaxa] = None
+    ):
         """
         Inicializa o scraper
         
         Args:
             config: Objeto de configuração (opcional)
+            pool: Pool de navegadores aquecidos (opcional; usa o pool do processo se habilitado)
+            limitador: Limitador de outro scraper, para dividir taxa e orçamento (opcional)
         """
         self.config = config or Config()
-        self.driver: Optional[webdriver.Chrome] = None
+        self.driver: Optional["webdriver.Chrome"] = None
         self.setup_logging()
         
-    def setup_logging(self):
-        """Configura o sistema de logging"""
-        log_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'logs')
-        os.makedirs(log_dir, exist_ok=True)
-        
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(os.path.join(log_dir, 'scraper.log')),
-                logging.StreamHandler()
-            ]
+        if pool is None and self.config.WEBDRIVER_POOL_ENABLED and self.config.SCRAPER_BACKEND == "selenium":
+            pool = obter_pool(self.config)
+        self.pool = pool
+        self.categorias = RegistroCategorias.listar(self.config.CATEGORIAS_ATIVAS)
+        
+        # Limitador único para todo o I/O do scraper (Selenium e HTTP)
+        self.limitador = limitador or LimitadorTaxa(
+            taxa_por_segundo=self.config.TAXA_REQUISICOES,
+            capacidade=self.config.RAJADA_REQUISICOES,
+            orcamento=self.config.ORCAMENTO_REQUISICOES
+        )
+        self.session = SessaoLimitada(self.limitador, PoliticaRetry(self.config.MAX_TENTATIVAS))
+        self.session.headers.update(self.HEADERS_HTTP)
+        
+        self.http_cache: Optional[HTTPCache] = None
+        self.extrator = ExtratorConteudo()
+        self.extrator_pdf = ExtratorPDF(
+            max_paginas=self.config.PDF_MAX_PAGINAS,
+            max_workers=self.config.PDF_WORKERS
         )
+        
+        if self.config.HTTP_CACHE_ENABLED:
+            self.http_cache = HTTPCache(
+                str(self.config.HTTP_CACHE_DIR),
+                session=self.session,
+                timeout=30
+            )
+        
+        # Backend "api": listagem e texto pelos serviços JSON, sem navegador
+        self.coletor_api: Optional[ColetorAPI] = None
+        if self.config.SCRAPER_BACKEND == "api":
+            self.coletor_api = ColetorAPI(self.config, self.session, self.http_cache, self.extrator)
+        
+    def setup_logging(self):
+        """Configura o sistema de logging (compartilhado; ver config.logging_config)"""
+        configurar_logging(self.config)
         self.logger = logging.getLogger(__name__)
     
     def setup_driver(self) -> bool:
@@ -76,22 +144,7 @@ class BACENScraper:
             True se configurado com sucesso, False caso contrário
         """
         try:
-            chrome_options = Options()
-            
-            if self.config.HEADLESS_MODE:
-                chrome_options.add_argument("--headless")
-            
-            chrome_options.add_argument("--no-sandbox")
-            chrome_options.add_argument("--disable-dev-shm-usage")
-            chrome_options.add_argument("--disable-gpu")
-            chrome_options.add_argument("--window-size=1920,1080")
-            chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-            chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-            chrome_options.add_experimental_option('useAutomationExtension', False)
-            
-            service = Service(ChromeDriverManager().install())
-            self.driver = webdriver.Chrome(service=service, options=chrome_options)
-            self.driver.implicitly_wait(self.config.TIMEOUT_PAGINA)
+            self.driver = criar_driver(self.config)
             
             self.logger.info("Driver do Selenium configurado com sucesso")
             return True
@@ -100,6 +153,44 @@ class BACENScraper:
             self.logger.error(f"Erro ao configurar driver: {str(e)}")
             return False
     
+    def _navegar(self, url: str, driver: Optional["webdriver.Chrome"] = None):
+        """
+        Carrega uma página no navegador respeitando o limitador de taxa
+        
+        Args:
+            url: URL da página
+            driver: Driver a usar (padrão: self.driver)
+        """
+        self.limitador.adquirir()
+        (driver or self.driver).get(url)
+    
+    def _listar_ancoras(self, fragmento_href: str, driver: Optional["webdriver.Chrome"] = None) -> List[Tuple[str, str]]:
+        """
+        Obtém todas as âncoras da página atual em uma única chamada ao navegador
+        
+        Args:
+            fragmento_href: Trecho que o href deve conter
+            driver: Driver a usar (padrão: self.driver)
+            
+        Returns:
+            Lista de tuplas (href absoluto, texto visível)
+        """
+        from selenium.common.exceptions import WebDriverException
+        
+        driver = driver or self.driver
+        try:
+            return [tuple(ancora) for ancora in driver.execute_script(
+                self.SCRIPT_ANCORAS, f"a[href*='{fragmento_href}']"
+            )]
+        except WebDriverException as e:
+            # Fallback: snapshot do DOM analisado localmente com lxml
+            self.logger.warning(f"execute_script indisponível, usando page_source: {str(e)}")
+            return self.extrator.extrair_ancoras(
+                driver.page_source,
+                driver.current_url,
+                fragmento_href
+            )
+    
     def get_yesterday_date(self) -> str:
         """
         Retorna a data do dia anterior no formato usado pelo BACEN
@@ -126,162 +217,247 @@ class BACENScraper:
             ontem = datetime.now() - timedelta(days=1)
             return ontem.strftime("%d/%m/%Y")
     
-    def buscar_comunicados(self) -> List[Dict]:
+    def buscar_categoria(
+        self,
+        categoria: CategoriaNormativa,
+        driver: Optional["webdriver.Chrome"] = None,
+        data_referencia: Optional[str] = None,
+        propagar_erros: bool = False
+    ) -> List[Publicacao]:
         """
-        Busca comunicados do dia anterior
+        Busca as publicações de uma categoria do registro
         
+        Args:
+            categoria: Definição da categoria (URL, links, paginação, data)
+            driver: Driver a usar (padrão: self.driver)
+            data_referencia: Dia a coletar (DD/MM/YYYY); se informado, mantém só os links
+                com essa data no texto e pagina até passar dela (padrão: dia anterior, sem
+                filtro; links sem data recebem o dia anterior)
+            propagar_erros: Relança a falha em vez de devolver lista vazia
+            
         Returns:
-            Lista de dicionários com informações dos comunicados
+            Publicações encontradas
         """
-        self.logger.info("Iniciando busca de comunicados...")
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
+        
+        driver = driver or self.driver
+        self.logger.info(f"Iniciando busca de {categoria.plural.lower()}...")
         
         try:
-            self.driver.get(self.config.BACEN_COMUNICADOS_URL)
-            time.sleep(self.config.DELAY_ENTRE_REQUISICOES)
-            
-            # Aguarda a página carregar
-            WebDriverWait(self.driver, self.config.TIMEOUT_PAGINA).until(
-                EC.presence_of_element_located((By.CLASS_NAME, "lista"))
-            )
-            
             data_anterior = self.get_yesterday_date()
-            comunicados = []
-            
-            # Procura por links e títulos de comunicados
-            elementos = self.driver.find_elements(By.CSS_SELECTOR, "a[href*='comunicado']")
-            
-            for elemento in elementos:
-                try:
-                    texto = elemento.text.strip()
-                    link = elemento.get_attribute('href')
-                    
-                    if texto and link:
-                        # Verifica se o link é completo
-                        if not link.startswith('http'):
-                            link = f"{self.config.BACEN_BASE_URL}{link}"
-                        
-                        comunicados.append({
-                            'titulo': texto,
-                            'link': link,
-                            'data': data_anterior,
-                            'tipo': 'Comunicado',
-                            'categoria': 'comunicado'
-                        })
+            alvo = datetime.strptime(data_referencia, "%d/%m/%Y").date() if data_referencia else None
+            publicacoes = []
+            links_vistos = set()
+            passou_do_alvo = False
+            
+            for pagina in range(1, categoria.max_paginas + 1):
+                self._navegar(categoria.url_pagina(self.config, pagina), driver)
+                
+                # Aguarda a página carregar
+                WebDriverWait(driver, self.config.TIMEOUT_PAGINA).until(
+                    EC.presence_of_element_located((By.CLASS_NAME, categoria.classe_espera))
+                )
+                
+                # Procura por links e títulos (uma única ida ao navegador)
+                ancoras = self._listar_ancoras(categoria.fragmento_href, driver)
+                novos = 0
+                
+                for link, texto in ancoras:
+                    try:
+                        texto = texto.strip()
                         
-                except Exception as e:
-                    self.logger.warning(f"Erro ao processar elemento: {str(e)}")
-                    continue
-            
-            self.logger.info(f"Encontrados {len(comunicados)} comunicados")
-            return comunicados
+                        if texto and link:
+                            # Verifica se o link é completo
+                            if not link.startswith('http'):
+                                link = f"{self.config.BACEN_BASE_URL}{link}"
+                            
+                            if link in links_vistos:
+                                continue
+                            links_vistos.add(link)
+                            novos += 1
+                            
+                            data_publicacao = categoria.parser_data(texto)
+                            if alvo:
+                                # Sem data no texto não dá para atribuir o link ao dia pedido
+                                if not data_publicacao:
+                                    continue
+                                dia = datetime.strptime(data_publicacao, "%d/%m/%Y").date()
+                                if dia < alvo:
+                                    passou_do_alvo = True
+                                if dia != alvo:
+                                    continue
+                            
+                            publicacoes.append(Publicacao(
+                                titulo=texto,
+                                link=link,
+                                data=data_publicacao or data_anterior,
+                                tipo=categoria.tipo,
+                                categoria=categoria.chave
+                            ))
+                            
+                    except Exception as e:
+                        self.logger.warning(f"Erro ao processar elemento: {str(e)}")
+                        continue
+                
+                # Página sem links novos: fim da listagem. Com data pedida, a listagem
+                # (mais recentes primeiro) já chegou a dias anteriores a ela
+                if not novos or passou_do_alvo:
+                    break
+            
+            if alvo and not passou_do_alvo:
+                self.logger.warning(
+                    f"Listagem de {categoria.plural.lower()} não alcançou {data_referencia} "
+                    f"(max_paginas={categoria.max_paginas}); use o backend \"api\" para datas antigas"
+                )
+            
+            self.logger.info(f"Encontrados {len(publicacoes)} itens em {categoria.plural}")
+            return publicacoes
             
         except Exception as e:
-            self.logger.error(f"Erro ao buscar comunicados: {str(e)}")
+            self.logger.error(f"Erro ao buscar {categoria.plural.lower()}: {str(e)}")
+            if propagar_erros:
+                raise
             return []
     
-    def buscar_resolucoes(self) -> List[Dict]:
+    def buscar_comunicados(self) -> List[Publicacao]:
+        """
+        Busca comunicados do dia anterior
+        
+        Returns:
+            Comunicados encontrados
+        """
+        return self.buscar_categoria(RegistroCategorias.obter('comunicado'))
+    
+    def buscar_resolucoes(self) -> List[Publicacao]:
         """
         Busca resoluções do dia anterior
         
         Returns:
-            Lista de dicionários com informações das resoluções
+            Resoluções encontradas
+        """
+        return self.buscar_categoria(RegistroCategorias.obter('resolucao'))
+    
+    def buscar_circulares(self) -> List[Publicacao]:
         """
-        self.logger.info("Iniciando busca de resoluções...")
+        Busca circulares do dia anterior
         
+        Returns:
+            Circulares encontradas
+        """
+        return self.buscar_categoria(RegistroCategorias.obter('circular'))
+    
+    def _buscar_categoria_com_pool(
+        self,
+        categoria: CategoriaNormativa,
+        data_referencia: Optional[str] = None,
+        propagar_erros: bool = False
+    ) -> List[Publicacao]:
+        """Busca uma categoria com um navegador emprestado do pool"""
         try:
-            self.driver.get(self.config.BACEN_RESOLUCOES_URL)
-            time.sleep(self.config.DELAY_ENTRE_REQUISICOES)
-            
-            WebDriverWait(self.driver, self.config.TIMEOUT_PAGINA).until(
-                EC.presence_of_element_located((By.CLASS_NAME, "lista"))
-            )
-            
-            data_anterior = self.get_yesterday_date()
-            resolucoes = []
-            
-            elementos = self.driver.find_elements(By.CSS_SELECTOR, "a[href*='resolucao']")
-            
-            for elemento in elementos:
-                try:
-                    texto = elemento.text.strip()
-                    link = elemento.get_attribute('href')
-                    
-                    if texto and link:
-                        if not link.startswith('http'):
-                            link = f"{self.config.BACEN_BASE_URL}{link}"
-                        
-                        resolucoes.append({
-                            'titulo': texto,
-                            'link': link,
-                            'data': data_anterior,
-                            'tipo': 'Resolução',
-                            'categoria': 'resolucao'
-                        })
-                        
-                except Exception as e:
-                    self.logger.warning(f"Erro ao processar elemento: {str(e)}")
-                    continue
-            
-            self.logger.info(f"Encontradas {len(resolucoes)} resoluções")
-            return resolucoes
-            
+            with self.pool.emprestar() as driver:
+                return self.buscar_categoria(categoria, driver, data_referencia, propagar_erros)
         except Exception as e:
-            self.logger.error(f"Erro ao buscar resoluções: {str(e)}")
+            self.logger.error(f"Erro ao obter navegador para {categoria.plural.lower()}: {str(e)}")
+            if propagar_erros:
+                raise
             return []
     
-    def buscar_circulares(self) -> List[Dict]:
+    def buscar_todas_categorias(
+        self,
+        data_referencia: Optional[str] = None,
+        categorias: Optional[List[CategoriaNormativa]] = None,
+        propagar_erros: bool = False
+    ) -> List[Publicacao]:
         """
-        Busca circulares do dia anterior
+        Busca todas as categorias ativas, em paralelo pela API ou com pool de navegadores
+        
+        Args:
+            data_referencia: Dia a coletar (DD/MM/YYYY; padrão: dia anterior)
+            categorias: Categorias a buscar (padrão: as ativas)
+            propagar_erros: Relança a falha de qualquer categoria em vez de ignorá-la
         
         Returns:
-            Lista de dicionários com informações das circulares
+            Lista consolidada, sem links repetidos entre categorias
         """
-        self.logger.info("Iniciando busca de circulares...")
+        categorias = categorias or self.categorias
         
-        try:
-            self.driver.get(self.config.BACEN_CIRCULARES_URL)
-            time.sleep(self.config.DELAY_ENTRE_REQUISICOES)
-            
-            WebDriverWait(self.driver, self.config.TIMEOUT_PAGINA).until(
-                EC.presence_of_element_located((By.CLASS_NAME, "lista"))
+        if self.coletor_api:
+            dia = datetime.strptime(data_referencia or self.get_yesterday_date(), "%d/%m/%Y").date()
+            buscar = lambda c: self.coletor_api.buscar_categoria(c, dia, dia, propagar_erros)
+            workers = self.config.MAX_WORKERS_CONTEUDO
+        elif self.pool:
+            buscar = lambda c: self._buscar_categoria_com_pool(c, data_referencia, propagar_erros)
+            workers = self.pool.tamanho
+        else:
+            buscar = lambda c: self.buscar_categoria(
+                c, data_referencia=data_referencia, propagar_erros=propagar_erros
             )
+            workers = 1
+        
+        # O limitador de taxa é compartilhado: o paralelismo não aumenta a taxa sobre o bcb.gov.br
+        if workers > 1 and len(categorias) > 1:
+            with ThreadPoolExecutor(max_workers=min(workers, len(categorias))) as executor:
+                resultados = list(executor.map(buscar, categorias))
+        else:
+            resultados = [buscar(c) for c in categorias]
+        
+        # Um link listado por duas categorias (ex.: "circular" e "carta-circular")
+        # fica com a de fragmento mais específico
+        especificidade = {c.chave: len(c.fragmento_href) for c in categorias}
+        por_link: Dict[str, Publicacao] = {}
+        for publicacoes in resultados:
+            for item in publicacoes:
+                atual = por_link.get(item.link)
+                if atual is None or especificidade[item.categoria] > especificidade[atual.categoria]:
+                    por_link[item.link] = item
+        
+        return list(por_link.values())
+    
+    def _baixar(self, url: str):
+        """
+        Obtém a resposta de uma URL sem ler o corpo inteiro em memória
+        
+        Args:
+            url: URL do recurso
             
-            data_anterior = self.get_yesterday_date()
-            circulares = []
-            
-            elementos = self.driver.find_elements(By.CSS_SELECTOR, "a[href*='circular']")
-            
-            for elemento in elementos:
-                try:
-                    texto = elemento.text.strip()
-                    link = elemento.get_attribute('href')
-                    
-                    if texto and link:
-                        if not link.startswith('http'):
-                            link = f"{self.config.BACEN_BASE_URL}{link}"
-                        
-                        circulares.append({
-                            'titulo': texto,
-                            'link': link,
-                            'data': data_anterior,
-                            'tipo': 'Circular',
-                            'categoria': 'circular'
-                        })
-                        
-                except Exception as e:
-                    self.logger.warning(f"Erro ao processar elemento: {str(e)}")
-                    continue
-            
-            self.logger.info(f"Encontradas {len(circulares)} circulares")
-            return circulares
-            
-        except Exception as e:
-            self.logger.error(f"Erro ao buscar circulares: {str(e)}")
-            return []
+        Returns:
+            RespostaCache (cache habilitado) ou requests.Response em modo stream
+        """
+        if self.http_cache:
+            # Revalida com ETag/If-Modified-Since; 304 reaproveita o corpo em disco
+            return self.http_cache.obter(url)
+        
+        response = self.session.get(url, timeout=30, stream=True)
+        response.raise_for_status()
+        return response
+    
+    @staticmethod
+    def _blocos_resposta(response, tamanho_bloco: int = 64 * 1024):
+        """Itera sobre o corpo da resposta em blocos"""
+        if isinstance(response, RespostaCache):
+            with response.abrir() as f:
+                yield from iter(lambda: f.read(tamanho_bloco), b'')
+        else:
+            yield from response.iter_content(chunk_size=tamanho_bloco)
+    
+    def _resposta_e_pdf(self, response, url: str) -> bool:
+        """Detecta PDF pelo Content-Type, pela URL ou pela assinatura do arquivo"""
+        if isinstance(response, RespostaCache):
+            with response.abrir() as f:
+                return e_pdf(response.content_type, url, f.read(len(b'%PDF-')))
+        return e_pdf(response.headers.get('Content-Type', ''), url)
+    
+    def _charset_resposta(self, response) -> Optional[str]:
+        """charset declarado no Content-Type (sem o padrão latin-1 que o requests assume)"""
+        if isinstance(response, RespostaCache):
+            return charset_do_content_type(response.content_type)
+        return charset_do_content_type(response.headers.get('Content-Type', ''))
     
     def obter_conteudo_completo(self, url: str) -> str:
         """
-        Obtém o conteúdo completo de uma página
+        Obtém o conteúdo completo de uma página (HTML ou PDF)
         
         Args:
             url: URL da página
@@ -290,61 +466,108 @@ class BACENScraper:
             Texto completo da página
         """
         try:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            }
+            response = self._baixar(url)
             
-            response = requests.get(url, headers=headers, timeout=30)
-            response.raise_for_status()
+            if self._resposta_e_pdf(response, url):
+                self.logger.info(f"Extraindo texto de PDF: {url}")
+                return self.extrator_pdf.extrair_de_blocos(self._blocos_resposta(response))
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            html = response.content
+            charset = self._charset_resposta(response)
             
-            # Remove scripts e estilos
-            for script in soup(["script", "style", "nav", "header", "footer"]):
-                script.decompose()
+            # Extrai apenas o conteúdo principal (sem menus e barras laterais)
+            texto = self.extrator.extrair_texto(html, charset)
             
-            # Extrai texto principal
-            texto = soup.get_text(separator=' ', strip=True)
+            # Página de entrada curta com anexo PDF: a íntegra do normativo está no anexo
+            if len(texto) < self.config.PDF_MIN_CARACTERES_PAGINA and self.extrator_pdf.disponivel:
+                anexos = self.extrator.extrair_links_pdf(html, url, charset)
+                if anexos:
+                    self.logger.info(f"Seguindo anexo PDF de {url}: {anexos[0]}")
+                    response_pdf = self._baixar(anexos[0])
+                    texto_pdf = self.extrator_pdf.extrair_de_blocos(self._blocos_resposta(response_pdf))
+                    texto = f"{texto} {texto_pdf}".strip()
             
             return texto
+        
+        except OrcamentoExcedido:
+            # Registrado uma única vez ao fim da coleta
+            return ""
             
         except Exception as e:
             self.logger.error(f"Erro ao obter conteúdo da URL {url}: {str(e)}")
             return ""
     
-    def executar_coleta(self) -> List[Dict]:
+    def _obter_conteudo_item(self, item: Publicacao) -> str:
+        """Texto de uma publicação: pela API quando disponível, senão pela página"""
+        if self.coletor_api:
+            texto = self.coletor_api.obter_conteudo(item)
+            if texto:
+                return texto
+        return self.obter_conteudo_completo(item.link)
+    
+    def executar_listagem(self, chaves: List[str], data_referencia: Optional[str] = None) -> Optional[List[Publicacao]]:
+        """
+        Lista publicações de algumas categorias, sem baixar conteúdo (verificação de novidades)
+        
+        Args:
+            chaves: Chaves das categorias no registro
+            data_referencia: Dia a listar (DD/MM/YYYY; padrão: dia anterior)
+        
+        Returns:
+            Publicações listadas (sem conteudo_completo), ou None se alguma categoria falhou
+            (uma listagem vazia por erro não pode ser tratada como "nada publicado")
+        """
+        categorias = RegistroCategorias.listar(chaves)
+        
+        try:
+            if self.coletor_api or self.pool:
+                return self.buscar_todas_categorias(data_referencia, categorias, propagar_erros=True)
+            
+            # Sem pool: navegador próprio, para não disputar self.driver com a coleta diária
+            driver = criar_driver(self.config)
+            try:
+                publicacoes = []
+                for categoria in categorias:
+                    publicacoes.extend(self.buscar_categoria(categoria, driver, data_referencia, True))
+                return publicacoes
+            finally:
+                driver.quit()
+                
+        except Exception as e:
+            self.logger.error(f"Erro durante a listagem: {str(e)}")
+            return None
+    
+    def executar_coleta(
+        self,
+        data_referencia: Optional[str] = None,
+        progresso: Optional[Callable[[Publicacao, int, int], None]] = None
+    ) -> List[Publicacao]:
         """
         Executa a coleta completa de todas as informações
         
+        Args:
+            data_referencia: Dia a coletar (DD/MM/YYYY; padrão: dia anterior)
+            progresso: Chamado a cada item com conteúdo obtido, como (item, concluídos, total)
+        
         Returns:
             Lista consolidada de todas as publicações encontradas
         """
+        if self.coletor_api or self.pool:
+            # API: sem navegador. Pool: cada categoria usa um navegador aquecido, devolvido ao final
+            try:
+                return self._coletar(data_referencia, progresso)
+            except Exception as e:
+                self.logger.error(f"Erro durante a coleta: {str(e)}")
+                return []
+            finally:
+                self.extrator_pdf.fechar()
+        
         if not self.setup_driver():
             self.logger.error("Não foi possível configurar o driver")
             return []
         
         try:
-            todas_informacoes = []
-            
-            # Coleta comunicados
-            comunicados = self.buscar_comunicados()
-            todas_informacoes.extend(comunicados)
-            
-            # Coleta resoluções
-            resolucoes = self.buscar_resolucoes()
-            todas_informacoes.extend(resolucoes)
-            
-            # Coleta circulares
-            circulares = self.buscar_circulares()
-            todas_informacoes.extend(circulares)
-            
-            # Obtém conteúdo completo para cada item
-            for item in todas_informacoes:
-                if 'conteudo_completo' not in item:
-                    item['conteudo_completo'] = self.obter_conteudo_completo(item['link'])
-            
-            self.logger.info(f"Coleta concluída. Total de itens: {len(todas_informacoes)}")
-            return todas_informacoes
+            return self._coletar(data_referencia, progresso)
             
         except Exception as e:
             self.logger.error(f"Erro durante a coleta: {str(e)}")
@@ -354,6 +577,50 @@ class BACENScraper:
             if self.driver:
                 self.driver.quit()
                 self.logger.info("Driver encerrado")
+            self.extrator_pdf.fechar()
+    
+    def _coletar(
+        self,
+        data_referencia: Optional[str] = None,
+        progresso: Optional[Callable[[Publicacao, int, int], None]] = None
+    ) -> List[Publicacao]:
+        """
+        Coleta listagens e conteúdo usando o driver atual
+        
+        Args:
+            data_referencia: Dia a coletar (DD/MM/YYYY; padrão: dia anterior)
+            progresso: Chamado a cada item com conteúdo obtido, como (item, concluídos, total)
+        
+        Returns:
+            Lista consolidada de todas as publicações encontradas
+        """
+        self.limitador.reiniciar_orcamento()
+        
+        # Coleta as listagens de todas as categorias ativas
+        todas_informacoes = self.buscar_todas_categorias(data_referencia)
+        
+        # Obtém conteúdo completo em paralelo; o limitador mantém a cadência segura para o servidor
+        pendentes = [item for item in todas_informacoes if item.conteudo_completo is None]
+        with ThreadPoolExecutor(max_workers=self.config.MAX_WORKERS_CONTEUDO) as executor:
+            conteudos = executor.map(self._obter_conteudo_item, pendentes)
+            for concluidos, (item, conteudo) in enumerate(zip(pendentes, conteudos), 1):
+                item.conteudo_completo = conteudo
+                if progresso:
+                    progresso(item, concluidos, len(pendentes))
+        
+        if self.limitador.orcamento_esgotado:
+            sem_conteudo = sum(1 for item in pendentes if not item.conteudo_completo)
+            self.logger.warning(
+                f"Orçamento de {self.limitador.orcamento} requisições esgotado; "
+                f"{sem_conteudo} item(ns) mantido(s) sem conteúdo"
+            )
+        
+        self.logger.info(f"Coleta concluída. Total de itens: {len(todas_informacoes)}")
+        
+        self.logger.info(f"Requisições: {self.limitador.estatisticas}")
+        if self.http_cache:
+            self.logger.info(f"Cache HTTP: {self.http_cache.estatisticas}")
+        return todas_informacoes
     
     def __enter__(self):
         """Context manager entry"""
@@ -361,8 +628,15 @@ class BACENScraper:
     
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit"""
+        self.fechar()
+    
+    def fechar(self):
+        """Encerra o navegador próprio, o pool de extração de PDF e a sessão HTTP"""
         if self.driver:
             self.driver.quit()
+            self.driver = None
+        self.extrator_pdf.fechar()
+        self.session.close()
 
 
 if __name__ == "__main__":
@@ -371,5 +645,5 @@ if __name__ == "__main__":
     resultados = scraper.executar_coleta()
     print(f"Resultados encontrados: {len(resultados)}")
     for item in resultados[:3]:  # Mostra apenas os 3 primeiros
-        print(f"- {item['tipo']}: {item['titulo'][:50]}...")
+        print(f"- {item.tipo}: {item.titulo[:50]}...")
 
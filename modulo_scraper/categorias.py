@@ -0,0 +1,204 @@
+"""
+Registro declarativo das categorias de normativos monitoradas
+Cada categoria descreve onde listar, como reconhecer os links e como interpretar a data
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+MESES = {
+    'janeiro': 1, 'fevereiro': 2, 'março': 3, 'marco': 3, 'abril': 4, 'maio': 5, 'junho': 6,
+    'julho': 7, 'agosto': 8, 'setembro': 9, 'outubro': 10, 'novembro': 11, 'dezembro': 12
+}
+
+_DATA_NUMERICA = re.compile(r'\b(\d{1,2})/(\d{1,2})/(\d{4})\b')
+_DATA_EXTENSO = re.compile(r'\b(\d{1,2})º?\s+de\s+([a-zç]+)\s+de\s+(\d{4})\b', re.IGNORECASE)
+
+
+def extrair_data_padrao(texto: str) -> Optional[str]:
+    """
+    Extrai a data de publicação do texto do link
+    
+    Args:
+        texto: Título/texto da âncora (ex.: "Resolução BCB nº 150, de 6 de outubro de 2021")
+    
+    Returns:
+        Data no formato DD/MM/YYYY ou None se não houver data
+    """
+    match = _DATA_NUMERICA.search(texto)
+    if match:
+        dia, mes, ano = (int(g) for g in match.groups())
+        return f"{dia:02d}/{mes:02d}/{ano}"
+    
+    match = _DATA_EXTENSO.search(texto)
+    if match and match.group(2).lower() in MESES:
+        return f"{int(match.group(1)):02d}/{MESES[match.group(2).lower()]:02d}/{match.group(3)}"
+    
+    return None
+
+
+@dataclass(frozen=True)
+class CategoriaNormativa:
+    """Descrição de uma categoria de publicação do BACEN"""
+    
+    chave: str
+    tipo: str
+    plural: str
+    fragmento_href: str
+    url_config: str
+    url_padrao: str
+    classe_espera: str = "lista"
+    max_paginas: int = 1
+    parametro_pagina: Optional[str] = None
+    # Valores do campo "tipo do normativo" na API de busca do BACEN
+    tipos_api: Tuple[str, ...] = ()
+    parser_data: Callable[[str], Optional[str]] = extrair_data_padrao
+    
+    def url(self, config) -> str:
+        """URL da listagem (sobrescrevível via configuração)"""
+        return getattr(config, self.url_config, None) or self.url_padrao
+    
+    def url_pagina(self, config, pagina: int) -> str:
+        """
+        URL de uma página da listagem
+        
+        Args:
+            config: Objeto de configuração
+            pagina: Número da página (começando em 1)
+        
+        Returns:
+            URL da página
+        """
+        url = self.url(config)
+        if pagina <= 1 or not self.parametro_pagina:
+            return url
+        separador = '&' if '?' in url else '?'
+        return f"{url}{separador}{self.parametro_pagina}={pagina}"
+
+
+CATEGORIAS_PADRAO = [
+    CategoriaNormativa(
+        chave='comunicado',
+        tipo='Comunicado',
+        plural='Comunicados',
+        fragmento_href='comunicado',
+        url_config='BACEN_COMUNICADOS_URL',
+        url_padrao='https://www.bcb.gov.br/estabilidadefinanceira/comunicados',
+        tipos_api=('Comunicado',)
+    ),
+    CategoriaNormativa(
+        chave='resolucao',
+        tipo='Resolução',
+        plural='Resoluções',
+        fragmento_href='resolucao',
+        url_config='BACEN_RESOLUCOES_URL',
+        url_padrao='https://www.bcb.gov.br/estabilidadefinanceira/resolucoes',
+        tipos_api=('Resolução CMN', 'Resolução')
+    ),
+    CategoriaNormativa(
+        chave='circular',
+        tipo='Circular',
+        plural='Circulares',
+        fragmento_href='circular',
+        url_config='BACEN_CIRCULARES_URL',
+        url_padrao='https://www.bcb.gov.br/estabilidadefinanceira/circular',
+        tipos_api=('Circular',)
+    ),
+    CategoriaNormativa(
+        chave='resolucao_bcb',
+        tipo='Resolução BCB',
+        plural='Resoluções BCB',
+        fragmento_href='resolucao-bcb',
+        url_config='BACEN_RESOLUCOES_BCB_URL',
+        url_padrao='https://www.bcb.gov.br/estabilidadefinanceira/resolucoesbcb',
+        tipos_api=('Resolução BCB',)
+    ),
+    CategoriaNormativa(
+        chave='instrucao_normativa',
+        tipo='Instrução Normativa',
+        plural='Instruções Normativas',
+        fragmento_href='instrucao-normativa',
+        url_config='BACEN_INSTRUCOES_NORMATIVAS_URL',
+        url_padrao='https://www.bcb.gov.br/estabilidadefinanceira/instrucoesnormativas',
+        tipos_api=('Instrução Normativa BCB',)
+    ),
+    CategoriaNormativa(
+        chave='carta_circular',
+        tipo='Carta Circular',
+        plural='Cartas Circulares',
+        fragmento_href='carta-circular',
+        url_config='BACEN_CARTAS_CIRCULARES_URL',
+        url_padrao='https://www.bcb.gov.br/estabilidadefinanceira/cartascirculares',
+        tipos_api=('Carta Circular',)
+    ),
+]
+
+
+class RegistroCategorias:
+    """Registro das categorias disponíveis para coleta"""
+    
+    _categorias: Dict[str, CategoriaNormativa] = {c.chave: c for c in CATEGORIAS_PADRAO}
+    
+    @classmethod
+    def registrar(cls, categoria: CategoriaNormativa):
+        """
+        Registra (ou substitui) uma categoria
+        
+        Args:
+            categoria: Definição da categoria
+        """
+        cls._categorias[categoria.chave] = categoria
+    
+    @classmethod
+    def obter(cls, chave: str) -> CategoriaNormativa:
+        """
+        Obtém uma categoria pela chave
+        
+        Raises:
+            ValueError: Se a categoria não estiver registrada
+        """
+        if chave not in cls._categorias:
+            raise ValueError(
+                f"Categoria '{chave}' não registrada. "
+                f"Categorias disponíveis: {', '.join(cls._categorias.keys())}"
+            )
+        return cls._categorias[chave]
+    
+    @classmethod
+    def listar(cls, chaves: Optional[List[str]] = None) -> List[CategoriaNormativa]:
+        """
+        Lista categorias registradas
+        
+        Args:
+            chaves: Chaves desejadas, na ordem (todas se None)
+        
+        Returns:
+            Lista de categorias
+        """
+        if chaves is None:
+            return list(cls._categorias.values())
+        return [cls.obter(chave) for chave in chaves]
+    
+    @classmethod
+    def agrupar_por_tipo(cls, itens: List[Dict]) -> List[Tuple[str, List[Dict]]]:
+        """
+        Agrupa itens por tipo, na ordem do registro (tipos desconhecidos ao final)
+        
+        Args:
+            itens: Itens coletados/processados
+        
+        Returns:
+            Lista de tuplas (nome plural do tipo, itens do tipo), apenas tipos com itens
+        """
+        plurais = {c.tipo: c.plural for c in cls._categorias.values()}
+        ordem = list(plurais.keys())
+        ordem += sorted({item.get('tipo', '') for item in itens} - set(ordem))
+        
+        grupos = []
+        for tipo in ordem:
+            documentos = [item for item in itens if item.get('tipo', '') == tipo]
+            if documentos:
+                grupos.append((plurais.get(tipo, tipo or 'Outros'), documentos))
+        return grupos
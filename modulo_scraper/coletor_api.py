@@ -0,0 +1,231 @@
+"""
+Coleta de normativos pelos serviços JSON do bcb.gov.br
+Alternativa ao Selenium: a busca de normativos já devolve tipo, número e data de cada publicação
+"""
+
+import json
+import logging
+from datetime import date, datetime
+from typing import Dict, List, Optional
+from urllib.parse import parse_qs, quote, urlencode, urlparse
+
+import requests
+
+from .categorias import CategoriaNormativa
+from .extrator_conteudo import ExtratorConteudo
+from .http_cache import HTTPCache
+from .publicacao import Publicacao
+from .rate_limiter import OrcamentoExcedido
+
+
+# Caminhos relativos a BACEN_API_URL
+CAMINHO_BUSCA = "/search/app/normativos/buscanormativos"
+CAMINHO_CONTEUDO = "/conteudo/app/normativos/exibenormativo"
+
+# Campos das linhas devolvidas pela busca de normativos
+CAMPO_TITULO = 'title'
+CAMPO_TIPO = 'TipodoNormativoOWSCHCS'
+CAMPO_NUMERO = 'NumeroOWSNMBR'
+CAMPO_DATA = 'Data1OWSDATE'
+
+CONSULTA_BASE = 'ContentType:normativo AND contentSource:normativos'
+
+
+def formatar_data_api(valor: str) -> Optional[str]:
+    """
+    Converte a data da API (ISO 8601) para DD/MM/YYYY
+    
+    Args:
+        valor: Data como devolvida pela API (ex.: "2024-10-18T00:00:00Z")
+    
+    Returns:
+        Data formatada ou None se inválida
+    """
+    try:
+        return datetime.strptime((valor or '')[:10], "%Y-%m-%d").strftime("%d/%m/%Y")
+    except ValueError:
+        return None
+
+
+class ColetorAPI:
+    """Lista publicações e obtém seu texto pelos serviços JSON do BACEN"""
+    
+    def __init__(
+        self,
+        config,
+        session: requests.Session,
+        http_cache: Optional[HTTPCache] = None,
+        extrator: Optional[ExtratorConteudo] = None
+    ):
+        """
+        Inicializa o coletor
+        
+        Args:
+            config: Objeto de configuração
+            session: Sessão HTTP (normalmente a SessaoLimitada do scraper)
+            http_cache: Cache HTTP para o texto dos normativos (opcional)
+            extrator: Extrator do texto HTML devolvido pela API
+        """
+        self.config = config
+        self.session = session
+        self.http_cache = http_cache
+        self.extrator = extrator or ExtratorConteudo()
+        self.base_url = config.BACEN_API_URL.rstrip('/')
+        self.logger = logging.getLogger(__name__)
+    
+    def _obter_json(self, url: str, params: Dict, usar_cache: bool = False) -> Dict:
+        """
+        Faz um GET e decodifica o JSON da resposta
+        
+        Args:
+            url: URL do serviço
+            params: Parâmetros da query string
+            usar_cache: Se True, passa pelo cache HTTP (documentos publicados não mudam)
+        
+        Returns:
+            Corpo da resposta decodificado
+        """
+        if usar_cache and self.http_cache:
+            return json.loads(self.http_cache.obter(f"{url}?{urlencode(params)}").content)
+        
+        response = self.session.get(url, params=params, timeout=30)
+        response.raise_for_status()
+        return response.json()
+    
+    def _consulta(self, categoria: CategoriaNormativa) -> str:
+        """Monta o texto de consulta restrito aos tipos da categoria"""
+        tipos = ' OR '.join(f'{CAMPO_TIPO}:"{tipo}"' for tipo in categoria.tipos_api)
+        return f"{CONSULTA_BASE} AND ({tipos})"
+    
+    def _link_publicacao(self, tipo: str, numero: str) -> str:
+        """Link público do normativo no site do BACEN"""
+        return (
+            f"{self.config.BACEN_BASE_URL}/estabilidadefinanceira/exibenormativo"
+            f"?tipo={quote(tipo)}&numero={quote(numero)}"
+        )
+    
+    def _mapear(self, linha: Dict, categoria: CategoriaNormativa) -> Optional[Publicacao]:
+        """
+        Converte uma linha da busca na publicação do scraper
+        
+        Args:
+            linha: Linha devolvida pela API
+            categoria: Categoria consultada
+        
+        Returns:
+            Publicação ou None se faltar tipo/número
+        """
+        tipo_api = (linha.get(CAMPO_TIPO) or '').strip()
+        numero = str(linha.get(CAMPO_NUMERO) or '').replace('.', '').strip()
+        if not tipo_api or not numero:
+            return None
+        
+        return Publicacao(
+            titulo=(linha.get(CAMPO_TITULO) or f"{tipo_api} nº {numero}").strip(),
+            link=self._link_publicacao(tipo_api, numero),
+            data=formatar_data_api(linha.get(CAMPO_DATA)),
+            tipo=categoria.tipo,
+            categoria=categoria.chave
+        )
+    
+    def buscar_categoria(
+        self,
+        categoria: CategoriaNormativa,
+        data_inicio: date,
+        data_fim: date,
+        propagar_erros: bool = False
+    ) -> List[Publicacao]:
+        """
+        Lista as publicações de uma categoria num intervalo de datas
+        
+        Args:
+            categoria: Categoria do registro (usa tipos_api)
+            data_inicio: Primeiro dia do intervalo
+            data_fim: Último dia do intervalo (inclusive)
+            propagar_erros: Relança a falha em vez de devolver a listagem parcial
+        
+        Returns:
+            Publicações encontradas
+        """
+        if not categoria.tipos_api:
+            self.logger.warning(f"Categoria {categoria.chave} não tem tipos mapeados na API")
+            return []
+        
+        self.logger.info(f"Consultando API de normativos: {categoria.plural.lower()}...")
+        
+        itens_por_pagina = self.config.API_ITENS_POR_PAGINA
+        params = {
+            'querytext': self._consulta(categoria),
+            'rowlimit': itens_por_pagina,
+            'sortlist': f'{CAMPO_DATA}:descending',
+            'refinementfilters': (
+                f'{CAMPO_DATA}:range(datetime({data_inicio.isoformat()}),'
+                f'datetime({data_fim.isoformat()}T23:59:59))'
+            )
+        }
+        
+        publicacoes = []
+        links_vistos = set()
+        
+        try:
+            for pagina in range(self.config.API_MAX_PAGINAS):
+                params['startrow'] = pagina * itens_por_pagina
+                resposta = self._obter_json(self.base_url + CAMINHO_BUSCA, params)
+                linhas = resposta.get('Rows') or []
+                
+                for linha in linhas:
+                    item = self._mapear(linha, categoria)
+                    if item and item.link not in links_vistos:
+                        links_vistos.add(item.link)
+                        item.data = item.data or data_fim.strftime("%d/%m/%Y")
+                        publicacoes.append(item)
+                
+                total = resposta.get('TotalRows', 0)
+                if len(linhas) < itens_por_pagina or params['startrow'] + len(linhas) >= total:
+                    break
+            
+            self.logger.info(f"Encontrados {len(publicacoes)} itens em {categoria.plural}")
+            return publicacoes
+        
+        except OrcamentoExcedido as e:
+            self.logger.warning(f"{str(e)}; mantendo {len(publicacoes)} itens de {categoria.plural.lower()}")
+            if propagar_erros:
+                raise
+            return publicacoes
+        
+        except (requests.RequestException, ValueError) as e:
+            self.logger.error(f"Erro ao consultar API para {categoria.plural.lower()}: {str(e)}")
+            if propagar_erros:
+                raise
+            return publicacoes
+    
+    def obter_conteudo(self, item: Publicacao) -> str:
+        """
+        Obtém o texto de um normativo listado pela API
+        
+        Args:
+            item: Publicação criada por buscar_categoria
+        
+        Returns:
+            Texto do normativo (vazio se a API não o tiver)
+        """
+        query = parse_qs(urlparse(item.link).query)
+        tipo, numero = query.get('tipo', [''])[0], query.get('numero', [''])[0]
+        if not tipo or not numero:
+            return ""
+        
+        try:
+            resposta = self._obter_json(
+                self.base_url + CAMINHO_CONTEUDO,
+                {'p1': tipo, 'p2': numero},
+                usar_cache=True
+            )
+        except OrcamentoExcedido:
+            return ""
+        except (requests.RequestException, ValueError) as e:
+            self.logger.warning(f"Erro ao obter texto de {tipo} {numero} pela API: {str(e)}")
+            return ""
+        
+        documentos = resposta.get('conteudo') or []
+        html = documentos[0].get('Texto', '') if documentos else ''
+        return self.extrator.extrair_texto(html) if html else ""
@@ -0,0 +1,305 @@
+"""
+Pool de sessões Selenium mantidas aquecidas entre execuções
+Evita reinstalar o chromedriver e abrir o Chrome a frio a cada coleta
+"""
+
+import time
+import queue
+import atexit
+import logging
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Optional
+
+# Selenium e webdriver_manager são importados ao criar o primeiro driver
+if TYPE_CHECKING:
+    from selenium import webdriver
+
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+
+# Recursos que a listagem não usa (apenas âncoras são lidas): bloqueados via CDP
+PADROES_RECURSOS_BLOQUEADOS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico", "*.bmp",
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+    "*.css",
+    "*.mp4", "*.webm", "*.mp3",
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*", "*hotjar.com*",
+]
+
+_caminho_chromedriver: Optional[str] = None
+_lock_chromedriver = threading.Lock()
+
+
+def obter_caminho_chromedriver() -> str:
+    """
+    Resolve o chromedriver uma única vez por processo
+    
+    Returns:
+        Caminho do executável do chromedriver
+    """
+    global _caminho_chromedriver
+    with _lock_chromedriver:
+        if _caminho_chromedriver is None:
+            from webdriver_manager.chrome import ChromeDriverManager
+            _caminho_chromedriver = ChromeDriverManager().install()
+        return _caminho_chromedriver
+
+
+def criar_driver(config) -> "webdriver.Chrome":
+    """
+    Cria uma sessão do Chrome com as opções do scraper
+    
+    Args:
+        config: Objeto de configuração
+    
+    Returns:
+        Driver do Selenium pronto para uso
+    """
+    from selenium import webdriver
+    from selenium.webdriver.chrome.service import Service
+    from selenium.webdriver.chrome.options import Options
+    
+    chrome_options = Options()
+    
+    if config.HEADLESS_MODE:
+        chrome_options.add_argument("--headless")
+    
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--disable-gpu")
+    
+    if config.NAVEGACAO_ENXUTA:
+        # Devolve o controle após o DOMContentLoaded, sem esperar imagens e subrecursos
+        chrome_options.page_load_strategy = 'eager'
+        chrome_options.add_argument("--window-size=1280,800")
+        chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+        chrome_options.add_argument("--disable-extensions")
+        chrome_options.add_argument("--disable-background-networking")
+        chrome_options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.managed_default_content_settings.fonts": 2,
+        })
+    else:
+        chrome_options.add_argument("--window-size=1920,1080")
+    
+    chrome_options.add_argument("--disable-blink-features=AutomationControlled")
+    chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    chrome_options.add_experimental_option('useAutomationExtension', False)
+    
+    service = Service(obter_caminho_chromedriver())
+    driver = webdriver.Chrome(service=service, options=chrome_options)
+    driver.implicitly_wait(config.TIMEOUT_PAGINA)
+    
+    if config.NAVEGACAO_ENXUTA:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": PADROES_RECURSOS_BLOQUEADOS})
+    
+    return driver
+
+
+@dataclass
+class SessaoNavegador:
+    """Sessão do Chrome mantida pelo pool"""
+    
+    driver: "webdriver.Chrome"
+    usos: int = 0
+    criada_em: float = field(default_factory=time.time)
+
+
+class WebDriverPool:
+    """Pool de N sessões headless com verificação de saúde e reciclagem"""
+    
+    def __init__(self, config, tamanho: int = 1, max_usos: int = 20, max_memoria_mb: int = 1024):
+        """
+        Inicializa o pool (as sessões são criadas sob demanda ou em aquecer())
+        
+        Args:
+            config: Objeto de configuração
+            tamanho: Número máximo de sessões simultâneas
+            max_usos: Empréstimos antes de reciclar uma sessão
+            max_memoria_mb: Memória (chromedriver + Chrome) acima da qual a sessão é reciclada
+        """
+        self.config = config
+        self.tamanho = max(1, tamanho)
+        self.max_usos = max_usos
+        self.max_memoria_mb = max_memoria_mb
+        self.logger = logging.getLogger(__name__)
+        
+        self._ociosas: "queue.Queue[SessaoNavegador]" = queue.Queue()
+        self._criadas = 0
+        self._lock = threading.Lock()
+        self._encerrado = False
+    
+    def _nova_sessao(self) -> SessaoNavegador:
+        """Abre uma nova sessão do Chrome"""
+        inicio = time.perf_counter()
+        sessao = SessaoNavegador(driver=criar_driver(self.config))
+        self.logger.info(f"Sessão do Chrome criada em {time.perf_counter() - inicio:.1f}s")
+        return sessao
+    
+    def _descartar(self, sessao: SessaoNavegador):
+        """Encerra uma sessão e libera sua vaga no pool"""
+        try:
+            sessao.driver.quit()
+        except Exception as e:
+            self.logger.warning(f"Erro ao encerrar sessão do Chrome: {str(e)}")
+        with self._lock:
+            self._criadas -= 1
+    
+    def _saudavel(self, sessao: SessaoNavegador) -> bool:
+        """Verifica se o navegador ainda responde"""
+        try:
+            sessao.driver.execute_script("return 1")
+            return bool(sessao.driver.window_handles)
+        except Exception:
+            return False
+    
+    def _memoria_mb(self, sessao: SessaoNavegador) -> float:
+        """Memória residente do chromedriver e de seus processos filhos (0 sem psutil)"""
+        if not PSUTIL_AVAILABLE:
+            return 0.0
+        try:
+            processo = psutil.Process(sessao.driver.service.process.pid)
+            processos = [processo] + processo.children(recursive=True)
+            return sum(p.memory_info().rss for p in processos) / (1024 * 1024)
+        except Exception:
+            return 0.0
+    
+    def _deve_reciclar(self, sessao: SessaoNavegador) -> bool:
+        """Decide se a sessão deve ser substituída após o uso"""
+        if self.max_usos and sessao.usos >= self.max_usos:
+            self.logger.info(f"Reciclando sessão após {sessao.usos} usos")
+            return True
+        
+        memoria = self._memoria_mb(sessao)
+        if self.max_memoria_mb and memoria > self.max_memoria_mb:
+            self.logger.info(f"Reciclando sessão com {memoria:.0f} MB em uso")
+            return True
+        
+        return False
+    
+    def _reservar_vaga(self) -> bool:
+        """Reserva uma vaga para criar nova sessão, se o pool ainda não está cheio"""
+        with self._lock:
+            if self._criadas < self.tamanho:
+                self._criadas += 1
+                return True
+            return False
+    
+    def aquecer(self):
+        """Cria antecipadamente todas as sessões do pool"""
+        while self._reservar_vaga():
+            try:
+                self._ociosas.put(self._nova_sessao())
+            except Exception as e:
+                with self._lock:
+                    self._criadas -= 1
+                self.logger.error(f"Erro ao aquecer pool de navegadores: {str(e)}")
+                break
+    
+    def _obter_sessao(self, timeout: float) -> SessaoNavegador:
+        """Obtém uma sessão ociosa saudável ou cria uma nova"""
+        limite = time.monotonic() + timeout
+        
+        while True:
+            try:
+                sessao = self._ociosas.get_nowait()
+            except queue.Empty:
+                if self._reservar_vaga():
+                    try:
+                        return self._nova_sessao()
+                    except Exception:
+                        with self._lock:
+                            self._criadas -= 1
+                        raise
+                
+                restante = limite - time.monotonic()
+                if restante <= 0:
+                    raise TimeoutError("Nenhuma sessão do Chrome disponível no pool")
+                try:
+                    # Espera curta: uma sessão descartada libera vaga sem voltar à fila
+                    sessao = self._ociosas.get(timeout=min(restante, 1.0))
+                except queue.Empty:
+                    continue
+            
+            if self._saudavel(sessao):
+                return sessao
+            
+            self.logger.warning("Sessão do Chrome não responde; substituindo")
+            self._descartar(sessao)
+    
+    @contextmanager
+    def emprestar(self, timeout: float = 300):
+        """
+        Empresta um driver aquecido durante o bloco with
+        
+        Args:
+            timeout: Tempo máximo de espera por uma sessão livre
+        
+        Yields:
+            Driver do Selenium
+        """
+        if self._encerrado:
+            raise RuntimeError("Pool de navegadores já foi encerrado")
+        
+        sessao = self._obter_sessao(timeout)
+        falhou = False
+        try:
+            yield sessao.driver
+        except Exception:
+            falhou = True
+            raise
+        finally:
+            sessao.usos += 1
+            if falhou or self._encerrado or not self._saudavel(sessao) or self._deve_reciclar(sessao):
+                self._descartar(sessao)
+            else:
+                try:
+                    sessao.driver.delete_all_cookies()
+                    sessao.driver.get("about:blank")
+                    self._ociosas.put(sessao)
+                except Exception:
+                    self._descartar(sessao)
+    
+    def encerrar(self):
+        """Encerra todas as sessões ociosas"""
+        self._encerrado = True
+        while True:
+            try:
+                self._descartar(self._ociosas.get_nowait())
+            except queue.Empty:
+                break
+        self.logger.info("Pool de navegadores encerrado")
+
+
+_pool_global: Optional[WebDriverPool] = None
+_lock_pool = threading.Lock()
+
+
+def obter_pool(config) -> WebDriverPool:
+    """
+    Retorna o pool compartilhado pelo processo (agendador, Streamlit, etc.)
+    
+    Args:
+        config: Objeto de configuração
+    
+    Returns:
+        Instância única do WebDriverPool
+    """
+    global _pool_global
+    with _lock_pool:
+        if _pool_global is None or _pool_global._encerrado:
+            _pool_global = WebDriverPool(
+                config,
+                tamanho=config.WEBDRIVER_POOL_TAMANHO,
+                max_usos=config.WEBDRIVER_MAX_USOS,
+                max_memoria_mb=config.WEBDRIVER_MAX_MEMORIA_MB
+            )
+            atexit.register(_pool_global.encerrar)
+        return _pool_global
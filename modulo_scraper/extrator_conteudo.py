@@ -0,0 +1,280 @@
+"""
+Extração de texto de páginas HTML do BACEN
+Localiza o contêiner de conteúdo principal com lxml e remove menus, rodapés e barras laterais
+"""
+
+import re
+import codecs
+import logging
+from typing import List, Optional, Tuple, Union
+
+try:
+    import lxml.html
+    from lxml import etree
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+
+# Contêineres de conteúdo principal usados nas páginas do bcb.gov.br, em ordem de preferência
+SELETORES_CONTEUDO = [
+    "//div[@id='conteudo']",
+    "//div[contains(concat(' ', normalize-space(@class), ' '), ' conteudo ')]",
+    "//div[contains(@class, 'texto-normativo')]",
+    "//div[contains(@class, 'corpo-noticia')]",
+    "//div[contains(@class, 'exibenormativo')]",
+    "//main",
+    "//article",
+    "//div[@role='main']",
+]
+
+# Tags que nunca fazem parte do texto do documento
+TAGS_DESCARTADAS = [
+    'script', 'style', 'noscript', 'template', 'iframe', 'svg', 'canvas',
+    'nav', 'header', 'footer', 'aside', 'form', 'button', 'select'
+]
+
+# Classes/ids típicos de menus, barras laterais e demais elementos de navegação.
+# A palavra precisa ser o token inteiro ou seu último segmento ("menu", "site-header"):
+# "cabecalho-normativo" ou "resultado-busca-normativo" são conteúdo
+PADRAO_BOILERPLATE = re.compile(
+    r'(?:^|\s)(?:[\w-]*[-_])?'
+    r'(?:menu|navbar|sidebar|breadcrumbs?|rodape|footer|cabecalho|header|cookies?|banner|'
+    r'social|compartilh\w*|share|acessibilidade|barra-gov|skip(?:-links?)?|modal|pesquisa|busca)'
+    r'(?=\s|$)',
+    re.IGNORECASE
+)
+
+_ESPACOS = re.compile(r'\s+')
+
+# charset declarado no cabeçalho HTTP e em <meta> (procurado só no início do documento)
+_CHARSET_CABECALHO = re.compile(r'charset\s*=\s*["\']?([\w.:-]+)', re.IGNORECASE)
+_CHARSET_META = re.compile(rb'<meta[^>]+charset\s*=\s*["\']?([\w.:-]+)', re.IGNORECASE)
+_LIMITE_META = 4096
+# O lxml recusa str com declaração XML de encoding (páginas XHTML)
+_DECLARACAO_XML = re.compile(r'^\s*<\?xml[^>]*\?>')
+
+
+def charset_do_content_type(content_type: Optional[str]) -> Optional[str]:
+    """
+    Extrai o parâmetro charset de um Content-Type
+    
+    Args:
+        content_type: Valor do cabeçalho (ex.: 'text/html; charset=utf-8')
+    
+    Returns:
+        Nome da codificação, ou None se o cabeçalho não declarar uma
+    """
+    encontrado = _CHARSET_CABECALHO.search(content_type or '')
+    return encontrado.group(1) if encontrado else None
+
+
+def decodificar_html(html: Union[bytes, str], encoding: Optional[str] = None) -> str:
+    """
+    Decodifica o HTML antes do parse
+    
+    O lxml, recebendo bytes, só enxerga o <meta charset> e lê as demais páginas como
+    latin-1. A ordem aqui é: BOM, charset do HTTP, <meta charset>, UTF-8 e, por fim,
+    cp1252 (codificação das páginas antigas do bcb.gov.br).
+    
+    Args:
+        html: Conteúdo bruto (de str só é retirada a declaração XML)
+        encoding: charset do cabeçalho HTTP, se houver
+    
+    Returns:
+        HTML como texto
+    """
+    if isinstance(html, str):
+        return _DECLARACAO_XML.sub('', html, count=1)
+    
+    if html.startswith(codecs.BOM_UTF8):
+        return decodificar_html(html[len(codecs.BOM_UTF8):].decode('utf-8', errors='replace'))
+    
+    meta = _CHARSET_META.search(html[:_LIMITE_META])
+    candidatos = [encoding, meta.group(1).decode('ascii') if meta else None, 'utf-8']
+    for candidato in candidatos:
+        if not candidato:
+            continue
+        try:
+            return decodificar_html(html.decode(candidato))
+        except (LookupError, UnicodeDecodeError):
+            continue
+    return decodificar_html(html.decode('cp1252', errors='replace'))
+
+
+class ExtratorConteudo:
+    """Extrator de texto do conteúdo principal de páginas HTML"""
+    
+    def __init__(self, min_caracteres: int = 200):
+        """
+        Inicializa o extrator
+        
+        Args:
+            min_caracteres: Tamanho mínimo para aceitar um contêiner como conteúdo principal
+        """
+        self.min_caracteres = min_caracteres
+        self.logger = logging.getLogger(__name__)
+    
+    def extrair_texto(self, html: Union[bytes, str], encoding: Optional[str] = None) -> str:
+        """
+        Extrai o texto do conteúdo principal de uma página
+        
+        Args:
+            html: Conteúdo HTML bruto (ou já decodificado)
+            encoding: charset do Content-Type da resposta, se houver
+        
+        Returns:
+            Texto limpo, com espaços normalizados
+        """
+        if not html:
+            return ""
+        
+        html = decodificar_html(html, encoding)
+        if not LXML_AVAILABLE:
+            return extrair_texto_legado(html)
+        
+        try:
+            documento = lxml.html.fromstring(html)
+        except (etree.ParserError, ValueError) as e:
+            self.logger.warning(f"HTML inválido, usando extração legada: {str(e)}")
+            return extrair_texto_legado(html)
+        
+        etree.strip_elements(documento, etree.Comment, *TAGS_DESCARTADAS, with_tail=False)
+        
+        # 1) Contêiner conhecido do bcb.gov.br
+        for seletor in SELETORES_CONTEUDO:
+            for elemento in documento.xpath(seletor):
+                self._remover_boilerplate(elemento)
+                texto = self._texto(elemento)
+                if len(texto) >= self.min_caracteres:
+                    return texto
+        
+        # 2) Fallback: bloco com maior densidade de texto
+        self._remover_boilerplate(documento)
+        melhor = self._bloco_mais_denso(documento)
+        if melhor is not None:
+            texto = self._texto(melhor)
+            if len(texto) >= self.min_caracteres:
+                return texto
+        
+        body = documento.find('body')
+        return self._texto(body if body is not None else documento)
+    
+    @staticmethod
+    def _texto(elemento) -> str:
+        """Texto do elemento com espaços normalizados (nós separados por espaço, como no get_text legado)"""
+        return _ESPACOS.sub(' ', ' '.join(elemento.itertext())).strip()
+    
+    @staticmethod
+    def _remover_boilerplate(raiz):
+        """Remove elementos de navegação identificados por classe ou id"""
+        for elemento in list(raiz.iter(tag=etree.Element)):
+            if elemento is raiz or elemento.getparent() is None:
+                continue
+            atributos = f"{elemento.get('class', '')} {elemento.get('id', '')}"
+            if atributos.strip() and PADRAO_BOILERPLATE.search(atributos):
+                elemento.drop_tree()
+    
+    def _bloco_mais_denso(self, raiz):
+        """
+        Escolhe o bloco com mais texto próprio e menos texto de links
+        
+        Args:
+            raiz: Elemento raiz do documento
+        
+        Returns:
+            Elemento escolhido ou None
+        """
+        melhor = None
+        melhor_pontuacao = 0.0
+        
+        for bloco in raiz.iter('div', 'section', 'td', 'article', 'main'):
+            texto = bloco.text_content()
+            tamanho = len(texto)
+            if tamanho < self.min_caracteres:
+                continue
+            
+            texto_links = sum(len(a.text_content()) for a in bloco.iter('a'))
+            paragrafos = sum(1 for _ in bloco.iter('p', 'li'))
+            densidade_links = texto_links / tamanho
+            
+            pontuacao = tamanho * (1 - densidade_links) + paragrafos * 25
+            # Penaliza ancestrais muito genéricos: o filho que concentra o texto vence
+            pontuacao /= 1 + 0.1 * len(bloco)
+            
+            if pontuacao > melhor_pontuacao:
+                melhor, melhor_pontuacao = bloco, pontuacao
+        
+        return melhor
+    
+    def extrair_links_pdf(self, html: Union[bytes, str], base_url: str,
+                          encoding: Optional[str] = None) -> List[str]:
+        """
+        Lista os anexos PDF referenciados por uma página
+        
+        Args:
+            html: Conteúdo HTML bruto (ou já decodificado)
+            base_url: URL da página (para resolver links relativos)
+            encoding: charset do Content-Type da resposta, se houver
+        
+        Returns:
+            URLs absolutas dos PDFs, sem repetição e na ordem da página
+        """
+        if not html or not LXML_AVAILABLE:
+            return []
+        
+        try:
+            documento = lxml.html.fromstring(decodificar_html(html, encoding), base_url=base_url)
+        except (etree.ParserError, ValueError):
+            return []
+        
+        documento.make_links_absolute(base_url)
+        links = []
+        for href in documento.xpath("//a/@href"):
+            if href.lower().split('?')[0].endswith('.pdf') and href not in links:
+                links.append(href)
+        return links
+    
+    def extrair_ancoras(self, html: str, base_url: str, fragmento_href: str) -> List[Tuple[str, str]]:
+        """
+        Lista as âncoras cujo href contém um trecho, a partir de um snapshot do DOM
+        
+        Args:
+            html: HTML da página (ex.: driver.page_source)
+            base_url: URL da página (para resolver links relativos)
+            fragmento_href: Trecho que o href deve conter
+            
+        Returns:
+            Lista de tuplas (href absoluto, texto)
+        """
+        if not html or not LXML_AVAILABLE:
+            return []
+        
+        documento = lxml.html.fromstring(html, base_url=base_url)
+        documento.make_links_absolute(base_url)
+        
+        return [
+            (ancora.get('href'), self._texto(ancora))
+            for ancora in documento.xpath("//a[contains(@href, $fragmento)]", fragmento=fragmento_href)
+        ]
+
+
+def extrair_texto_legado(html: Union[bytes, str]) -> str:
+    """
+    Extração original com BeautifulSoup (html.parser), mantida como fallback e referência de benchmark
+    
+    Args:
+        html: Conteúdo HTML (bruto ou já decodificado)
+    
+    Returns:
+        Texto da página inteira
+    """
+    from bs4 import BeautifulSoup
+    
+    soup = BeautifulSoup(html, 'html.parser')
+    
+    # Remove scripts e estilos
+    for script in soup(["script", "style", "nav", "header", "footer"]):
+        script.decompose()
+    
+    return soup.get_text(separator=' ', strip=True)
@@ -0,0 +1,187 @@
+"""
+Extração de texto de normativos publicados em PDF
+Lê página a página a partir de arquivo em disco, em um pool de processos
+"""
+
+import os
+import re
+import logging
+import tempfile
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Iterable, Optional
+
+from importlib.util import find_spec
+
+# pypdf só é importado nos processos que extraem um PDF
+PYPDF_AVAILABLE = find_spec('pypdf') is not None
+
+
+ASSINATURA_PDF = b'%PDF-'
+
+_ESPACOS = re.compile(r'\s+')
+
+
+def e_pdf(content_type: str = "", url: str = "", primeiros_bytes: bytes = b"") -> bool:
+    """
+    Verifica se uma resposta corresponde a um arquivo PDF
+    
+    Args:
+        content_type: Cabeçalho Content-Type
+        url: URL do recurso
+        primeiros_bytes: Início do corpo (opcional)
+    
+    Returns:
+        True se for PDF
+    """
+    if 'application/pdf' in (content_type or '').lower():
+        return True
+    if primeiros_bytes.startswith(ASSINATURA_PDF):
+        return True
+    return url.lower().split('?')[0].endswith('.pdf')
+
+
+def salvar_temporario(blocos: Iterable[bytes]) -> str:
+    """
+    Grava um corpo recebido em blocos num arquivo temporário
+    
+    Args:
+        blocos: Iterável de blocos de bytes
+    
+    Returns:
+        Caminho do arquivo temporário (o chamador deve removê-lo)
+    """
+    fd, caminho = tempfile.mkstemp(suffix='.pdf')
+    with os.fdopen(fd, 'wb') as f:
+        for bloco in blocos:
+            if bloco:
+                f.write(bloco)
+    return caminho
+
+
+def _extrair_paginas(caminho: str, max_paginas: int, max_caracteres: int) -> str:
+    """
+    Extrai o texto de um PDF página a página (executado nos processos do pool)
+    
+    Args:
+        caminho: Caminho do arquivo PDF
+        max_paginas: Número máximo de páginas lidas
+        max_caracteres: Limite de caracteres acumulados
+    
+    Returns:
+        Texto extraído
+    """
+    from pypdf import PdfReader
+    
+    reader = PdfReader(caminho)
+    partes = []
+    total = 0
+    
+    for indice, pagina in enumerate(reader.pages):
+        if indice >= max_paginas or total >= max_caracteres:
+            break
+        
+        texto = _ESPACOS.sub(' ', pagina.extract_text() or '').strip()
+        if texto:
+            partes.append(texto)
+            total += len(texto)
+    
+    return ' '.join(partes)[:max_caracteres]
+
+
+class ExtratorPDF:
+    """Extrator de texto de PDFs com pool de processos e memória limitada"""
+    
+    # Documentos processados antes de reciclar os processos do pool
+    TAREFAS_POR_POOL = 50
+    
+    def __init__(self, max_paginas: int = 50, max_caracteres: int = 200000, max_workers: int = 2):
+        """
+        Inicializa o extrator
+        
+        Args:
+            max_paginas: Número máximo de páginas lidas por documento
+            max_caracteres: Limite de caracteres por documento
+            max_workers: Número de processos do pool
+        """
+        self.max_paginas = max_paginas
+        self.max_caracteres = max_caracteres
+        self.max_workers = max_workers
+        self.logger = logging.getLogger(__name__)
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._tarefas_pool = 0
+        self._lock = threading.Lock()
+    
+    @property
+    def disponivel(self) -> bool:
+        """Indica se a biblioteca de leitura de PDF está instalada"""
+        return PYPDF_AVAILABLE
+    
+    def _submeter(self, caminho: str) -> Future:
+        """
+        Envia um PDF ao pool, criando-o sob demanda e reciclando-o periodicamente
+        
+        A reciclagem e o submit ficam sob o mesmo lock: outra thread não pode encerrar
+        o pool entre a obtenção e o envio. As tarefas já enviadas a um pool reciclado
+        terminam normalmente (shutdown sem espera não as cancela).
+        """
+        with self._lock:
+            # Recicla os processos para limitar o crescimento de memória em lotes grandes
+            if self._pool is not None and self._tarefas_pool >= self.TAREFAS_POR_POOL:
+                self._pool.shutdown(wait=False)
+                self._pool = None
+            
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(max_workers=self.max_workers)
+                self._tarefas_pool = 0
+            
+            self._tarefas_pool += 1
+            return self._pool.submit(_extrair_paginas, caminho, self.max_paginas, self.max_caracteres)
+    
+    def extrair_texto(self, caminho: str) -> str:
+        """
+        Extrai o texto de um PDF em disco
+        
+        Args:
+            caminho: Caminho do arquivo PDF
+        
+        Returns:
+            Texto extraído (vazio se não for possível)
+        """
+        if not PYPDF_AVAILABLE:
+            self.logger.warning("Biblioteca pypdf não está instalada. Execute: pip install pypdf")
+            return ""
+        
+        try:
+            return self._submeter(caminho).result()
+        except Exception as e:
+            self.logger.error(f"Erro ao extrair texto do PDF {caminho}: {str(e)}")
+            return ""
+    
+    def extrair_de_blocos(self, blocos: Iterable[bytes]) -> str:
+        """
+        Grava o PDF recebido em blocos num temporário e extrai o texto
+        
+        Args:
+            blocos: Iterável de blocos de bytes do PDF
+        
+        Returns:
+            Texto extraído
+        """
+        if not PYPDF_AVAILABLE:
+            # Sem pypdf não há o que extrair: evita baixar o PDF para o disco à toa
+            self.logger.warning("Biblioteca pypdf não está instalada. Execute: pip install pypdf")
+            return ""
+        
+        caminho = salvar_temporario(blocos)
+        try:
+            return self.extrair_texto(caminho)
+        finally:
+            os.remove(caminho)
+    
+    def fechar(self):
+        """Encerra o pool de processos"""
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=True)
+                self._pool = None
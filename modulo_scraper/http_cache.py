@@ -0,0 +1,328 @@
+"""
+Cache HTTP em disco para páginas de documentos do BACEN
+Armazena corpos comprimidos e endereçados por conteúdo e revalida com ETag/Last-Modified
+"""
+
+import os
+import re
+import gzip
+import time
+import shutil
+import sqlite3
+import hashlib
+import logging
+import tempfile
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, Optional, IO
+
+import requests
+
+
+@dataclass
+class RespostaCache:
+    """Resposta HTTP servida pelo cache (da rede ou do disco)"""
+    
+    url: str
+    status_code: int
+    content_type: str
+    caminho_objeto: str
+    sha256: str
+    tamanho: int
+    headers: Dict[str, str] = field(default_factory=dict)
+    do_cache: bool = False
+    revalidado: bool = False
+    
+    @property
+    def content(self) -> bytes:
+        """Corpo completo descomprimido"""
+        with gzip.open(self.caminho_objeto, 'rb') as f:
+            return f.read()
+    
+    def abrir(self) -> IO[bytes]:
+        """
+        Abre o corpo como stream, sem carregá-lo inteiro em memória
+        
+        Returns:
+            Arquivo binário descomprimido sob demanda
+        """
+        return gzip.open(self.caminho_objeto, 'rb')
+
+
+class HTTPCache:
+    """Cache HTTP com requisições condicionais e armazenamento endereçado por conteúdo"""
+    
+    TAMANHO_BLOCO = 64 * 1024
+    
+    def __init__(
+        self,
+        cache_dir: str,
+        session: Optional[requests.Session] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: int = 30
+    ):
+        """
+        Inicializa o cache
+        
+        Args:
+            cache_dir: Diretório raiz do cache
+            session: Sessão HTTP compartilhada (opcional)
+            headers: Cabeçalhos padrão das requisições
+            timeout: Timeout padrão em segundos
+        """
+        self.cache_dir = str(cache_dir)
+        self.objetos_dir = os.path.join(self.cache_dir, 'objetos')
+        self.db_path = os.path.join(self.cache_dir, 'indice.db')
+        self.session = session or requests.Session()
+        self.headers = headers or {}
+        self.timeout = timeout
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+        self.estatisticas = {'rede': 0, 'revalidados': 0, 'frescos': 0, 'obsoletos': 0}
+        
+        os.makedirs(self.objetos_dir, exist_ok=True)
+        self._criar_tabelas()
+    
+    def _conectar(self) -> sqlite3.Connection:
+        """Abre conexão com o índice SQLite"""
+        return sqlite3.connect(self.db_path, timeout=30)
+    
+    def _criar_tabelas(self):
+        """Cria a tabela de metadados se não existir"""
+        with self._lock, self._conectar() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS respostas (
+                    url TEXT PRIMARY KEY,
+                    sha256 TEXT NOT NULL,
+                    tamanho INTEGER NOT NULL,
+                    content_type TEXT,
+                    etag TEXT,
+                    last_modified TEXT,
+                    max_age INTEGER,
+                    atualizado_em REAL NOT NULL
+                )
+                """
+            )
+    
+    def _caminho_objeto(self, sha256: str) -> str:
+        """Caminho do objeto comprimido para um hash"""
+        return os.path.join(self.objetos_dir, sha256[:2], f"{sha256}.gz")
+    
+    def _buscar_metadados(self, url: str) -> Optional[Dict]:
+        """Busca metadados armazenados para a URL"""
+        with self._lock, self._conectar() as conn:
+            conn.row_factory = sqlite3.Row
+            row = conn.execute("SELECT * FROM respostas WHERE url = ?", (url,)).fetchone()
+        
+        if row is None or not os.path.exists(self._caminho_objeto(row['sha256'])):
+            return None
+        return dict(row)
+    
+    def _salvar_metadados(self, url: str, meta: Dict):
+        """Grava (ou substitui) os metadados da URL, removendo o objeto substituído se ficou órfão"""
+        orfao = None
+        with self._lock, self._conectar() as conn:
+            anterior = conn.execute("SELECT sha256 FROM respostas WHERE url = ?", (url,)).fetchone()
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO respostas
+                    (url, sha256, tamanho, content_type, etag, last_modified, max_age, atualizado_em)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    url, meta['sha256'], meta['tamanho'], meta.get('content_type'),
+                    meta.get('etag'), meta.get('last_modified'), meta.get('max_age'),
+                    meta['atualizado_em']
+                )
+            )
+            if anterior and anterior[0] != meta['sha256'] and conn.execute(
+                "SELECT 1 FROM respostas WHERE sha256 = ? LIMIT 1", (anterior[0],)
+            ).fetchone() is None:
+                orfao = anterior[0]
+        
+        if orfao:
+            try:
+                os.remove(self._caminho_objeto(orfao))
+            except FileNotFoundError:
+                pass
+    
+    def _contar(self, chave: str):
+        """Incrementa um contador de estatisticas (obter é chamado de várias threads)"""
+        with self._lock:
+            self.estatisticas[chave] += 1
+    
+    @staticmethod
+    def _extrair_max_age(cache_control: str) -> Optional[int]:
+        """Extrai max-age do cabeçalho Cache-Control (None se não cacheável)"""
+        if not cache_control:
+            return None
+        if 'no-cache' in cache_control or 'no-store' in cache_control:
+            return 0
+        match = re.search(r'max-age=(\d+)', cache_control)
+        return int(match.group(1)) if match else None
+    
+    def _resposta_do_cache(self, url: str, meta: Dict, revalidado: bool) -> RespostaCache:
+        """Monta uma resposta a partir dos metadados armazenados"""
+        return RespostaCache(
+            url=url,
+            status_code=200,
+            content_type=meta.get('content_type') or '',
+            caminho_objeto=self._caminho_objeto(meta['sha256']),
+            sha256=meta['sha256'],
+            tamanho=meta['tamanho'],
+            do_cache=True,
+            revalidado=revalidado
+        )
+    
+    def _armazenar_corpo(self, response: requests.Response) -> Dict:
+        """
+        Grava o corpo da resposta em disco de forma incremental
+        
+        Args:
+            response: Resposta aberta em modo stream
+        
+        Returns:
+            Dicionário com sha256 e tamanho do corpo
+        """
+        hasher = hashlib.sha256()
+        tamanho = 0
+        fd, caminho_tmp = tempfile.mkstemp(dir=self.objetos_dir, suffix='.tmp')
+        
+        try:
+            with os.fdopen(fd, 'wb') as bruto, gzip.GzipFile(fileobj=bruto, mode='wb', compresslevel=6) as gz:
+                for bloco in response.iter_content(chunk_size=self.TAMANHO_BLOCO):
+                    if bloco:
+                        hasher.update(bloco)
+                        gz.write(bloco)
+                        tamanho += len(bloco)
+            
+            sha256 = hasher.hexdigest()
+            destino = self._caminho_objeto(sha256)
+            
+            if os.path.exists(destino):
+                os.remove(caminho_tmp)
+            else:
+                os.makedirs(os.path.dirname(destino), exist_ok=True)
+                shutil.move(caminho_tmp, destino)
+            
+            return {'sha256': sha256, 'tamanho': tamanho}
+        
+        except Exception:
+            if os.path.exists(caminho_tmp):
+                os.remove(caminho_tmp)
+            raise
+    
+    def obter(self, url: str, headers: Optional[Dict[str, str]] = None, timeout: Optional[int] = None) -> RespostaCache:
+        """
+        Obtém uma URL usando o cache (requisição condicional quando possível)
+        
+        Args:
+            url: URL a ser obtida
+            headers: Cabeçalhos adicionais
+            timeout: Timeout em segundos (usa o padrão se None)
+        
+        Returns:
+            Resposta com o corpo armazenado em disco
+        
+        Raises:
+            requests.RequestException: Se a requisição falhar e não houver cópia em cache
+        """
+        meta = self._buscar_metadados(url)
+        
+        # Cópia ainda fresca segundo Cache-Control: dispensa a rede
+        if meta and meta.get('max_age') and time.time() - meta['atualizado_em'] < meta['max_age']:
+            self._contar('frescos')
+            return self._resposta_do_cache(url, meta, revalidado=False)
+        
+        headers_req = dict(self.headers)
+        headers_req.update(headers or {})
+        
+        if meta:
+            if meta.get('etag'):
+                headers_req['If-None-Match'] = meta['etag']
+            if meta.get('last_modified'):
+                headers_req['If-Modified-Since'] = meta['last_modified']
+        
+        try:
+            response = self.session.get(
+                url,
+                headers=headers_req,
+                timeout=timeout or self.timeout,
+                stream=True
+            )
+        except requests.RequestException as e:
+            if meta:
+                self.logger.warning(f"Falha na requisição de {url}, servindo cópia em cache: {str(e)}")
+                self._contar('obsoletos')
+                return self._resposta_do_cache(url, meta, revalidado=False)
+            raise
+        
+        with response:
+            if response.status_code == 304 and meta:
+                meta['atualizado_em'] = time.time()
+                # Cache-Control do 304 substitui o armazenado (no-cache e max-age=0 valem 0)
+                if 'Cache-Control' in response.headers:
+                    meta['max_age'] = self._extrair_max_age(response.headers['Cache-Control'])
+                meta['etag'] = response.headers.get('ETag', meta.get('etag'))
+                meta['last_modified'] = response.headers.get('Last-Modified', meta.get('last_modified'))
+                self._salvar_metadados(url, meta)
+                self._contar('revalidados')
+                return self._resposta_do_cache(url, meta, revalidado=True)
+            
+            # 5xx após as retentativas da sessão: mesmo tratamento de uma falha de conexão
+            if response.status_code >= 500 and meta:
+                self.logger.warning(
+                    f"{url} respondeu {response.status_code}, servindo cópia em cache"
+                )
+                self._contar('obsoletos')
+                return self._resposta_do_cache(url, meta, revalidado=False)
+            
+            response.raise_for_status()
+            
+            corpo = self._armazenar_corpo(response)
+            novo_meta = {
+                'sha256': corpo['sha256'],
+                'tamanho': corpo['tamanho'],
+                'content_type': response.headers.get('Content-Type', ''),
+                'etag': response.headers.get('ETag'),
+                'last_modified': response.headers.get('Last-Modified'),
+                'max_age': self._extrair_max_age(response.headers.get('Cache-Control', '')),
+                'atualizado_em': time.time()
+            }
+            self._salvar_metadados(url, novo_meta)
+            self._contar('rede')
+            
+            return RespostaCache(
+                url=url,
+                status_code=response.status_code,
+                content_type=novo_meta['content_type'],
+                caminho_objeto=self._caminho_objeto(corpo['sha256']),
+                sha256=corpo['sha256'],
+                tamanho=corpo['tamanho'],
+                headers=dict(response.headers),
+                do_cache=False
+            )
+    
+    def limpar_orfaos(self) -> int:
+        """
+        Remove objetos que não são mais referenciados pelo índice
+        
+        Objetos substituídos já são removidos ao gravar a nova versão; isto limpa as
+        sobras de execuções interrompidas entre a gravação do corpo e a do índice.
+        
+        Returns:
+            Número de objetos removidos
+        """
+        with self._lock, self._conectar() as conn:
+            referenciados = {row[0] for row in conn.execute("SELECT DISTINCT sha256 FROM respostas")}
+        
+        removidos = 0
+        for raiz, _, arquivos in os.walk(self.objetos_dir):
+            for nome in arquivos:
+                if nome.endswith('.gz') and nome[:-3] not in referenciados:
+                    os.remove(os.path.join(raiz, nome))
+                    removidos += 1
+        
+        self.logger.info(f"Cache HTTP: {removidos} objetos órfãos removidos")
+        return removidos
@@ -0,0 +1,101 @@
+"""
+Registro tipado de uma publicação do BACEN
+
+Criado pelo scraper e completado pelas etapas seguintes (conteúdo, resumo). Com
+__slots__ cada publicação ocupa uma fração de um dicionário equivalente, o que conta
+em coletas longas (backfill). O acesso por chave (item['titulo'], item.get(...)) é
+mantido para o código que ainda recebe publicações como dicionários.
+"""
+
+import json
+from dataclasses import dataclass, fields, replace
+from typing import Any, ClassVar, Dict, Iterable, List, Mapping, Optional, Tuple
+
+
+@dataclass(slots=True)
+class Publicacao:
+    """Uma publicação listada (e, depois, com conteúdo e resumo)"""
+    
+    titulo: str
+    link: str
+    data: Optional[str] = None
+    tipo: Optional[str] = None
+    categoria: Optional[str] = None
+    conteudo_completo: Optional[str] = None
+    resumo: Optional[str] = None
+    
+    CAMPOS: ClassVar[Tuple[str, ...]] = ()
+    
+    # Acesso como dicionário: campos vazios (None) se comportam como chaves ausentes
+    
+    def __getitem__(self, campo: str) -> Any:
+        if campo not in self.CAMPOS:
+            raise KeyError(campo)
+        return getattr(self, campo)
+    
+    def __setitem__(self, campo: str, valor: Any):
+        if campo not in self.CAMPOS:
+            raise KeyError(campo)
+        setattr(self, campo, valor)
+    
+    def __contains__(self, campo: str) -> bool:
+        return campo in self.CAMPOS and getattr(self, campo) is not None
+    
+    def get(self, campo: str, padrao: Any = None) -> Any:
+        """Valor do campo, ou padrao se o campo não existir ou estiver vazio"""
+        valor = getattr(self, campo, None) if campo in self.CAMPOS else None
+        return padrao if valor is None else valor
+    
+    def keys(self) -> List[str]:
+        """Campos preenchidos (permite dict(publicacao))"""
+        return [campo for campo in self.CAMPOS if getattr(self, campo) is not None]
+    
+    def copiar(self, **alteracoes) -> "Publicacao":
+        """Cópia da publicação, com os campos alterados"""
+        return replace(self, **alteracoes)
+    
+    def para_dict(self) -> Dict[str, Any]:
+        """Dicionário só com os campos preenchidos"""
+        return {campo: getattr(self, campo) for campo in self.keys()}
+    
+    @classmethod
+    def de_dict(cls, dados: Mapping[str, Any]) -> "Publicacao":
+        """
+        Cria a publicação a partir de um dicionário (chaves desconhecidas são ignoradas)
+        
+        Args:
+            dados: Dicionário com ao menos 'titulo' e 'link'
+        
+        Returns:
+            Publicação equivalente
+        """
+        return cls(**{campo: dados[campo] for campo in cls.CAMPOS if campo in dados})
+
+
+Publicacao.CAMPOS = tuple(campo.name for campo in fields(Publicacao))
+
+
+def publicacoes_para_json(itens: Iterable[Publicacao]) -> str:
+    """
+    Serializa publicações em JSON compacto (para repassar entre etapas ou processos)
+    
+    Args:
+        itens: Publicações
+    
+    Returns:
+        Lista JSON de objetos, sem os campos vazios
+    """
+    return json.dumps([item.para_dict() for item in itens], ensure_ascii=False, separators=(',', ':'))
+
+
+def publicacoes_de_json(texto: str) -> List[Publicacao]:
+    """
+    Lê publicações serializadas por publicacoes_para_json
+    
+    Args:
+        texto: Lista JSON de objetos
+    
+    Returns:
+        Publicações
+    """
+    return [Publicacao.de_dict(dados) for dados in json.loads(texto)]
@@ -0,0 +1,220 @@
+"""
+Controle de taxa e política de retentativas para requisições ao bcb.gov.br
+Token bucket compartilhado com backoff adaptativo e orçamento de requisições por execução
+"""
+
+import time
+import random
+import logging
+import threading
+from typing import Optional, Set
+
+import requests
+
+
+class OrcamentoExcedido(requests.RequestException):
+    """
+    Levantada quando o orçamento de requisições da execução se esgota
+    
+    Deriva de RequestException para que quem já trata falhas de requisição (coletor
+    da API, cache HTTP) pare de buscar e preserve o que já obteve.
+    """
+
+
+class LimitadorTaxa:
+    """Token bucket thread-safe com redução multiplicativa em 429/5xx e recuperação gradual"""
+    
+    def __init__(
+        self,
+        taxa_por_segundo: float = 2.0,
+        capacidade: int = 4,
+        orcamento: int = 0,
+        taxa_minima: float = 0.1
+    ):
+        """
+        Inicializa o limitador
+        
+        Args:
+            taxa_por_segundo: Taxa máxima sustentada (requisições/s)
+            capacidade: Tamanho da rajada permitida
+            orcamento: Máximo de requisições por execução (0 = ilimitado)
+            taxa_minima: Piso da taxa após reduções adaptativas
+        """
+        self.taxa_maxima = taxa_por_segundo
+        self.taxa_minima = min(taxa_minima, taxa_por_segundo)
+        self.taxa = taxa_por_segundo
+        self.capacidade = capacidade
+        self.orcamento = orcamento
+        self.logger = logging.getLogger(__name__)
+        
+        self._tokens = float(capacidade)
+        self._ultimo = time.monotonic()
+        self._pausa_ate = 0.0
+        self._lock = threading.Lock()
+        self.estatisticas = {'requisicoes': 0, 'limitacoes': 0, 'espera_total': 0.0}
+    
+    @property
+    def orcamento_esgotado(self) -> bool:
+        """True se o orçamento da execução já foi consumido"""
+        return bool(self.orcamento) and self.estatisticas['requisicoes'] >= self.orcamento
+    
+    def reiniciar_orcamento(self, orcamento: Optional[int] = None):
+        """
+        Zera o contador de requisições no início de uma execução
+        
+        Args:
+            orcamento: Novo orçamento (mantém o atual se None)
+        """
+        with self._lock:
+            if orcamento is not None:
+                self.orcamento = orcamento
+            self.estatisticas = {'requisicoes': 0, 'limitacoes': 0, 'espera_total': 0.0}
+    
+    def _repor(self, agora: float):
+        """Repõe tokens proporcionalmente ao tempo decorrido"""
+        decorrido = agora - self._ultimo
+        self._ultimo = agora
+        self._tokens = min(self.capacidade, self._tokens + decorrido * self.taxa)
+    
+    def adquirir(self):
+        """
+        Bloqueia até haver um token disponível
+        
+        Raises:
+            OrcamentoExcedido: Se o orçamento da execução foi consumido
+        """
+        with self._lock:
+            if self.orcamento_esgotado:
+                raise OrcamentoExcedido(
+                    f"Orçamento de {self.orcamento} requisições por execução esgotado"
+                )
+            self.estatisticas['requisicoes'] += 1
+        
+        while True:
+            with self._lock:
+                agora = time.monotonic()
+                self._repor(agora)
+                
+                espera = max(0.0, self._pausa_ate - agora)
+                if espera == 0.0:
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return
+                    espera = (1 - self._tokens) / self.taxa
+                
+                self.estatisticas['espera_total'] += espera
+            
+            time.sleep(espera)
+    
+    def registrar_sucesso(self):
+        """Recupera a taxa gradualmente (aumento aditivo) após respostas normais"""
+        with self._lock:
+            if self.taxa < self.taxa_maxima:
+                self.taxa = min(self.taxa_maxima, self.taxa + self.taxa_maxima * 0.05)
+    
+    def registrar_limitacao(self, retry_after: Optional[float] = None):
+        """
+        Reduz a taxa pela metade após 429/5xx e respeita Retry-After
+        
+        Args:
+            retry_after: Segundos indicados pelo servidor (opcional)
+        """
+        with self._lock:
+            self.taxa = max(self.taxa_minima, self.taxa / 2)
+            self._tokens = min(self._tokens, 0.0)
+            self.estatisticas['limitacoes'] += 1
+            if retry_after:
+                self._pausa_ate = max(self._pausa_ate, time.monotonic() + retry_after)
+        
+        self.logger.warning(f"Servidor sinalizou limitação; taxa reduzida para {self.taxa:.2f} req/s")
+
+
+class PoliticaRetry:
+    """Retentativas com backoff exponencial e jitter completo"""
+    
+    STATUS_RETENTAVEIS: Set[int] = {429, 500, 502, 503, 504}
+    
+    def __init__(self, max_tentativas: int = 3, backoff_base: float = 1.0, backoff_max: float = 60.0):
+        """
+        Inicializa a política
+        
+        Args:
+            max_tentativas: Número total de tentativas por requisição
+            backoff_base: Espera base em segundos
+            backoff_max: Espera máxima em segundos
+        """
+        self.max_tentativas = max(1, max_tentativas)
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+    
+    def espera(self, tentativa: int, retry_after: Optional[float] = None) -> float:
+        """
+        Calcula a espera antes da próxima tentativa
+        
+        Args:
+            tentativa: Número da tentativa que falhou (começando em 1)
+            retry_after: Valor de Retry-After enviado pelo servidor
+        
+        Returns:
+            Segundos de espera
+        """
+        teto = min(self.backoff_max, self.backoff_base * (2 ** (tentativa - 1)))
+        return max(retry_after or 0.0, random.uniform(0, teto))
+
+
+def _ler_retry_after(response: requests.Response) -> Optional[float]:
+    """Interpreta o cabeçalho Retry-After (apenas o formato em segundos)"""
+    valor = response.headers.get('Retry-After', '')
+    try:
+        return float(valor) if valor else None
+    except ValueError:
+        return None
+
+
+class SessaoLimitada(requests.Session):
+    """Sessão HTTP que passa pelo limitador de taxa e aplica a política de retentativas"""
+    
+    def __init__(self, limitador: LimitadorTaxa, politica: Optional[PoliticaRetry] = None):
+        """
+        Inicializa a sessão
+        
+        Args:
+            limitador: Limitador compartilhado por todo o I/O do scraper
+            politica: Política de retentativas (padrão: 3 tentativas)
+        """
+        super().__init__()
+        self.limitador = limitador
+        self.politica = politica or PoliticaRetry()
+        self.logger = logging.getLogger(__name__)
+    
+    def request(self, method, url, *args, **kwargs):
+        """Executa a requisição respeitando o limitador e retentando falhas transitórias"""
+        for tentativa in range(1, self.politica.max_tentativas + 1):
+            self.limitador.adquirir()
+            ultima = tentativa == self.politica.max_tentativas
+            
+            try:
+                response = super().request(method, url, *args, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if ultima:
+                    raise
+                espera = self.politica.espera(tentativa)
+                self.logger.warning(f"Falha em {url} ({str(e)}); nova tentativa em {espera:.1f}s")
+                time.sleep(espera)
+                continue
+            
+            if response.status_code in PoliticaRetry.STATUS_RETENTAVEIS:
+                retry_after = _ler_retry_after(response)
+                self.limitador.registrar_limitacao(retry_after)
+                if ultima:
+                    return response
+                response.close()
+                espera = self.politica.espera(tentativa, retry_after)
+                self.logger.warning(
+                    f"HTTP {response.status_code} em {url}; nova tentativa em {espera:.1f}s"
+                )
+                time.sleep(espera)
+                continue
+            
+            self.limitador.registrar_sucesso()
+            return response